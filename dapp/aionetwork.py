@@ -0,0 +1,629 @@
+"""Module with asyncio functions for retrieving blockchain data."""
+
+import asyncio
+import base64
+import json
+from collections import defaultdict
+from copy import deepcopy
+
+import aiohttp
+from algosdk.encoding import encode_address
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
+
+from configuration import (
+    AIO_CONCURRENCY,
+    AIO_CONNECTIONS_LIMIT,
+    BOXES_PAGE_LIMIT,
+    INDEXER_ADDRESS,
+    INDEXER_TOKEN,
+    SUBSCRIPTION_PERMISSIONS,
+)
+from helpers import (
+    box_name_from_address,
+    environment_variables,
+    permission_dapp_id,
+)
+from network import (
+    box_subscription_end,
+    cometa_app_amount,
+    cometa_app_local_state,
+    deserialized_box_response_value,
+    is_active_subscription,
+)
+
+
+# # CLIENTS
+async def _error_message(response):
+    """Return error message from non-successful HTTP `response`.
+
+    Message is taken from JSON body if possible, otherwise from body text as
+    proxies and rate limiters return HTML or plain text error pages.
+
+    :param response: Node's or Indexer's HTTP response
+    :type response: :class:`aiohttp.ClientResponse`
+    :var text: response body text
+    :type text: str
+    :return: str
+    """
+    text = await response.text()
+    try:
+        return json.loads(text).get("message") or response.reason
+    except (ValueError, AttributeError):
+        return text or response.reason
+
+
+class AsyncAlgodClient:
+    """Asyncio Algorand Node client with the read methods used by Permission dApp.
+
+    Method names and responses follow :class:`AlgodClient`, so the very same
+    decoding helpers are used for both blocking and asyncio code paths.
+    """
+
+    def __init__(self, algod_token, algod_address, session):
+        """Store Node credentials and shared HTTP `session` instance.
+
+        :param algod_token: Algorand Node API token
+        :type algod_token: str
+        :param algod_address: Algorand Node URL
+        :type algod_address: str
+        :param session: HTTP session shared by all the clients
+        :type session: :class:`aiohttp.ClientSession`
+        """
+        self.algod_token = algod_token
+        self.algod_address = algod_address.rstrip("/")
+        self.session = session
+
+    async def algod_request(self, path, params=None):
+        """Fetch and return JSON response for Node's `path` endpoint.
+
+        Raise AlgodHTTPError with Node's message for non-successful responses
+        before their body is parsed as JSON.
+
+        :param path: Node's endpoint path without API version prefix
+        :type path: str
+        :param params: query parameters
+        :type params: dict
+        :var headers: request headers
+        :type headers: dict
+        :var response: Node's HTTP response
+        :type response: :class:`aiohttp.ClientResponse`
+        :var data: JSON response content
+        :type data: dict
+        :return: dict
+        """
+        headers = {"X-Algo-API-Token": self.algod_token or ""}
+        async with self.session.get(
+            f"{self.algod_address}/v2{path}", params=params or {}, headers=headers
+        ) as response:
+            if response.status >= 400:
+                raise AlgodHTTPError(await _error_message(response), response.status)
+
+            data = await response.json(content_type=None)
+            return data or {}
+
+    async def account_info(self, address):
+        """Return account information for provided `address`.
+
+        :param address: Algorand account address
+        :type address: str
+        :return: dict
+        """
+        return await self.algod_request(f"/accounts/{address}")
+
+    async def application_box_by_name(self, application_id, box_name):
+        """Return the value of application's box named `box_name`.
+
+        :param application_id: application identifier
+        :type application_id: int
+        :param box_name: box name
+        :type box_name: bytes
+        :return: dict
+        """
+        return await self.algod_request(
+            f"/applications/{application_id}/box",
+            params={"name": "b64:" + base64.b64encode(box_name).decode()},
+        )
+
+
+class AsyncIndexerClient:
+    """Asyncio Algorand Indexer client with transactions searching method."""
+
+    def __init__(self, indexer_token, indexer_address, session):
+        """Store Indexer credentials and shared HTTP `session` instance.
+
+        :param indexer_token: Algorand Indexer API token
+        :type indexer_token: str
+        :param indexer_address: Algorand Indexer URL
+        :type indexer_address: str
+        :param session: HTTP session shared by all the clients
+        :type session: :class:`aiohttp.ClientSession`
+        """
+        self.indexer_token = indexer_token
+        self.indexer_address = indexer_address.rstrip("/")
+        self.session = session
+
+    async def search_transactions(self, **kwargs):
+        """Return page of transactions satisfying the provided conditions.
+
+        Keyword arguments follow :meth:`IndexerClient.search_transactions`.
+
+        :var params: query parameters
+        :type params: dict
+        :var response: Indexer's HTTP response
+        :type response: :class:`aiohttp.ClientResponse`
+        :var data: JSON response content
+        :type data: dict
+        :return: dict
+        """
+        params = {
+            ("next" if key == "next_page" else key.replace("_", "-")): value
+            for key, value in kwargs.items()
+            if value is not None
+        }
+        async with self.session.get(
+            f"{self.indexer_address}/v2/transactions",
+            params=params,
+            headers={"X-Indexer-API-Token": self.indexer_token or ""},
+        ) as response:
+            if response.status >= 400:
+                raise IndexerHTTPError(await _error_message(response))
+
+            data = await response.json(content_type=None)
+            return data or {}
+
+
+def _indexer_instance(session):
+    """Return asyncio Algorand Indexer instance using provided `session`.
+
+    :param session: HTTP session shared by all the clients
+    :type session: :class:`aiohttp.ClientSession`
+    :return: :class:`AsyncIndexerClient`
+    """
+    return AsyncIndexerClient(INDEXER_TOKEN, INDEXER_ADDRESS, session)
+
+
+def client_session(limit=AIO_CONNECTIONS_LIMIT):
+    """Return HTTP session instance with connection pool of `limit` connections.
+
+    :param limit: maximum number of simultaneous connections
+    :type limit: int
+    :return: :class:`aiohttp.ClientSession`
+    """
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit))
+
+
+# # HELPERS
+async def _bounded(semaphore, coroutine):
+    """Await and return `coroutine` result after acquiring `semaphore`.
+
+    :param semaphore: semaphore limiting number of concurrent calls
+    :type semaphore: :class:`asyncio.Semaphore`
+    :param coroutine: coroutine to await
+    :type coroutine: coroutine
+    :return: object
+    """
+    async with semaphore:
+        return await coroutine
+
+
+async def gather_bounded(coroutines, concurrency=AIO_CONCURRENCY, semaphore=None):
+    """Run `coroutines` concurrently, at most `concurrency` at a time.
+
+    Provided `semaphore` shared by several gatherings limits them all together.
+
+    :param coroutines: collection of coroutines to run
+    :type coroutines: iterable
+    :param concurrency: maximum number of concurrently running coroutines
+    :type concurrency: int
+    :param semaphore: semaphore limiting number of concurrent calls
+    :type semaphore: :class:`asyncio.Semaphore`
+    :return: list
+    """
+    semaphore = semaphore or asyncio.Semaphore(concurrency)
+    return await asyncio.gather(
+        *(_bounded(semaphore, coroutine) for coroutine in coroutines)
+    )
+
+
+async def box_names(client, app_id, limit=BOXES_PAGE_LIMIT):
+    """Return collection of all box names for application defined by `app_id`.
+
+    Box names are fetched page by page following Node's continuation token.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param app_id: application identifier
+    :type app_id: int
+    :param limit: maximum number of box names per page
+    :type limit: int
+    :var names: collection of application's box names
+    :type names: list
+    :var params: collection of query parameters for currently fetched page
+    :type params: dict
+    :var page: currently processed page of box names
+    :type page: dict
+    :return: list
+    """
+    names, params = [], {"max": limit}
+    while True:
+        page = await client.algod_request(
+            f"/applications/{app_id}/boxes", params=params
+        )
+        names.extend(base64.b64decode(box.get("name")) for box in page.get("boxes", []))
+        if not page.get("next-token"):
+            return names
+
+        params = {"max": limit, "next": page.get("next-token")}
+
+
+# # SUBCRIPTIONS
+async def _subscription_end_for_box(client, app_id, box_name):
+    """Return subscription's end timestamp or None if box `box_name` isn't found.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param app_id: subscription tier app
+    :type app_id: int
+    :param box_name: user's box name
+    :type box_name: bytes
+    :var response: user's box response instance
+    :type response: dict
+    :return: int
+    """
+    try:
+        response = await client.application_box_by_name(app_id, box_name)
+    except AlgodHTTPError:
+        return None
+
+    return box_subscription_end(response.get("value")) if response else None
+
+
+async def fetch_subscriptions_for_address(client, address):
+    """Return collection of all subscriptions for provided `address`.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param address: user's address
+    :type address: str
+    :var box_name: user's box name
+    :type box_name: bytes
+    :var ends: subscription end timestamps in `SUBSCRIPTION_PERMISSIONS` order
+    :type ends: list
+    :return: dict
+    """
+    box_name = box_name_from_address(address)
+    ends = await asyncio.gather(
+        *(
+            _subscription_end_for_box(client, app_id, box_name)
+            for app_id in SUBSCRIPTION_PERMISSIONS
+        )
+    )
+    return defaultdict(
+        int,
+        {
+            tier_name: subscription_end
+            for (_, _, tier_name), subscription_end in zip(
+                SUBSCRIPTION_PERMISSIONS.values(), ends
+            )
+            if subscription_end is not None
+        },
+    )
+
+
+async def fetch_subscriptions_from_boxes(
+    client, concurrency=AIO_CONCURRENCY, semaphore=None
+):
+    """Return collection of all subscribed addresses with related subscription values.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param concurrency: maximum number of concurrent box requests
+    :type concurrency: int
+    :param semaphore: semaphore limiting number of concurrent box requests
+    :type semaphore: :class:`asyncio.Semaphore`
+    :var subscriptions: Subtopia subscribers addresses and related tiers' values
+    :type subscriptions: dict
+    :var tiers_box_names: collection of box names for every tier app
+    :type tiers_box_names: list
+    :var lookups: collection of (app_id, box_name) pairs to fetch
+    :type lookups: list
+    :var responses: collection of box responses in `lookups` order
+    :type responses: list
+    :return: dict
+    """
+    subscriptions = defaultdict(list)
+    tiers_box_names = await asyncio.gather(
+        *(box_names(client, app_id) for app_id in SUBSCRIPTION_PERMISSIONS)
+    )
+    lookups = [
+        (app_id, box_name)
+        for app_id, names in zip(SUBSCRIPTION_PERMISSIONS, tiers_box_names)
+        for box_name in names
+    ]
+    responses = await gather_bounded(
+        (
+            client.application_box_by_name(app_id, box_name)
+            for app_id, box_name in lookups
+        ),
+        concurrency=concurrency,
+        semaphore=semaphore,
+    )
+    for (app_id, box_name), response in zip(lookups, responses):
+        amount, permission, _ = SUBSCRIPTION_PERMISSIONS[app_id]
+        if is_active_subscription(box_subscription_end(response.get("value"))):
+            subscriptions[encode_address(box_name)].append((amount, permission))
+
+    return subscriptions
+
+
+# #  STAKING
+async def _cometa_app_local_state_for_address(client, address):
+    """Return Cometa's ASASTATS staking dApp's local state instance from account info.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param address: governance seat address
+    :type address: str
+    :var account_info: account's information object
+    :type account_info: dict
+    :return: dict
+    """
+    try:
+        account_info = await client.account_info(address)
+    except AlgodHTTPError:
+        return None
+
+    return cometa_app_local_state(account_info)
+
+
+async def current_governance_staking_for_address(client, address, staking_key=None):
+    """Return staking amount for `address` from Cometa's staking program.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param address: governance seat address associated with the box
+    :type address: str
+    :param staking_key: staking program's staking key
+    :type staking_key: str
+    :var state: staking application's local state object
+    :type state: dict
+    :return: int
+    """
+    if staking_key is None:
+        return 0
+
+    state = await _cometa_app_local_state_for_address(client, address)
+    return cometa_app_amount(staking_key, state) if state else 0
+
+
+async def governance_stakings(
+    client, addresses, staking_key=None, concurrency=AIO_CONCURRENCY
+):
+    """Return collection of `addresses` and related current staking amounts.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param addresses: collection of governance staking addresses
+    :type addresses: iterable
+    :param staking_key: staking program's staking key
+    :type staking_key: str
+    :param concurrency: maximum number of concurrent account requests
+    :type concurrency: int
+    :var addresses_list: ordered collection of provided addresses
+    :type addresses_list: list
+    :var amounts: staking amounts in `addresses_list` order
+    :type amounts: list
+    :return: dict
+    """
+    addresses_list = list(addresses)
+    amounts = await gather_bounded(
+        (
+            current_governance_staking_for_address(
+                client, address, staking_key=staking_key
+            )
+            for address in addresses_list
+        ),
+        concurrency=concurrency,
+    )
+    return dict(zip(addresses_list, amounts))
+
+
+# # INDEXER
+async def _application_transactions(
+    params, indexer_client, next_page=None, error_delay=5, retries=20
+):
+    """Fetch and return transactions from indexer instance based on provided params.
+
+    :param params: collection of parameters to indexer search method
+    :type params: dict
+    :param indexer_client: asyncio Algorand Indexer client instance
+    :type indexer_client: :class:`AsyncIndexerClient`
+    :param next_page: custom code identifying very next page of search results
+    :type next_page: str
+    :param error_delay: delay in seconds after error
+    :type error_delay: int
+    :param retries: maximum number of retries before giving up
+    :type retries: int
+    :var _params: updated parameters to indexer search method
+    :type _params: dict
+    :var counter: current number of retries
+    :type counter: int
+    :return: dict
+    """
+    _params = deepcopy(params)
+    if next_page:
+        _params.update({"next_page": next_page})
+
+    counter = 0
+    while True:
+        try:
+            return await indexer_client.search_transactions(**_params)
+
+        except Exception as e:
+            if counter >= retries:
+                print("Maximum number of retries reached. Exiting...")
+                return {}
+
+            print(
+                "Exception %s raised searching transactions: %s; Paused..."
+                % (
+                    e,
+                    _params,
+                )
+            )
+            await asyncio.sleep(error_delay)
+            counter += 1
+
+
+async def application_transaction(params, indexer_client):
+    """Yield transaction connected with application defined by provided `params`.
+
+    :param params: collection of arguments to search transactions endpoint
+    :type params: dict
+    :param indexer_client: asyncio Algorand Indexer client instance
+    :type indexer_client: :class:`AsyncIndexerClient`
+    :var results: fetched page of transactions
+    :type results: dict
+    :var transaction: transaction instance
+    :type transaction: dict
+    :yield: dict
+    """
+    results = await _application_transactions(params, indexer_client)
+    while results.get("transactions"):
+        for transaction in results.get("transactions"):
+            yield transaction
+
+        results = await _application_transactions(
+            params, indexer_client, next_page=results.get("next-token")
+        )
+
+
+async def governance_staking_addresses(
+    session, staking_app_id=None, staking_min_round=None
+):
+    """Return all addresses involved in the staking program run by `staking_app_id`.
+
+    :param session: HTTP session shared by all the clients
+    :type session: :class:`aiohttp.ClientSession`
+    :param staking_app_id: Algorand application identifier
+    :type staking_app_id: int
+    :param staking_min_round: starting round of the staking program
+    :type staking_min_round: int
+    :var indexer_client: asyncio Algorand Indexer client instance
+    :type indexer_client: :class:`AsyncIndexerClient`
+    :var params: collection of arguments provided to Indexer method
+    :type params: dict
+    :return: set
+    """
+    if staking_app_id is None:
+        return set()
+
+    indexer_client = _indexer_instance(session)
+    params = {
+        "application_id": staking_app_id,
+        "limit": 1000,
+        "min_round": staking_min_round,
+    }
+    return {
+        transaction.get("sender")
+        async for transaction in application_transaction(params, indexer_client)
+    }
+
+
+# # PERMISSION DAPP
+async def deserialized_permission_dapp_box_value(client, app_id, box_name):
+    """Fetch `box_name` value and return deserialized values from it.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param box_name: box name
+    :type box_name: bytes
+    :var response: fetch application box call's response
+    :type response: dict
+    :return: list
+    """
+    try:
+        response = await client.application_box_by_name(app_id, box_name)
+    except AlgodHTTPError as exception:
+        if "box not found" in exception.args:
+            return None
+        raise exception
+
+    return deserialized_box_response_value(response)
+
+
+async def permission_dapp_values_from_boxes(
+    client, app_id, concurrency=AIO_CONCURRENCY, semaphore=None
+):
+    """Return collection of all addresses with related votes and permission values.
+
+    :param client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param concurrency: maximum number of concurrent box requests
+    :type concurrency: int
+    :param semaphore: semaphore limiting number of concurrent box requests
+    :type semaphore: :class:`asyncio.Semaphore`
+    :var names: collection of Permission dApp's box names
+    :type names: list
+    :var results: collection of deserialized values in `names` order
+    :type results: list
+    :return: dict
+    """
+    if app_id is None:
+        raise ValueError("Permission dApp ID isn't set!")
+
+    names = await box_names(client, app_id)
+    results = await gather_bounded(
+        (
+            deserialized_permission_dapp_box_value(client, app_id, box_name)
+            for box_name in names
+        ),
+        concurrency=concurrency,
+        semaphore=semaphore,
+    )
+    return {
+        encode_address(box_name): values
+        for box_name, values in zip(names, results)
+        if values
+    }
+
+
+async def permission_dapp_snapshot(network="testnet", concurrency=AIO_CONCURRENCY):
+    """Return Permission dApp values and Subtopia subscriptions fetched concurrently.
+
+    Both collections are fetched in a single event loop through one shared
+    connection pool, with at most `concurrency` box requests running at a time
+    in both of them together.
+
+    :param network: network to query (e.g., "testnet")
+    :type network: str
+    :param concurrency: maximum number of concurrent box requests
+    :type concurrency: int
+    :var env: environment variables collection
+    :type env: dict
+    :var session: HTTP session shared by all the requests
+    :type session: :class:`aiohttp.ClientSession`
+    :var client: asyncio Algorand Node client instance
+    :type client: :class:`AsyncAlgodClient`
+    :var semaphore: semaphore limiting number of concurrent box requests
+    :type semaphore: :class:`asyncio.Semaphore`
+    :return: two-tuple
+    """
+    env = environment_variables()
+    semaphore = asyncio.Semaphore(concurrency)
+    async with client_session() as session:
+        client = AsyncAlgodClient(
+            env.get(f"algod_token_{network}"),
+            env.get(f"algod_address_{network}"),
+            session,
+        )
+        return await asyncio.gather(
+            permission_dapp_values_from_boxes(
+                client, permission_dapp_id(network), semaphore=semaphore
+            ),
+            fetch_subscriptions_from_boxes(client, semaphore=semaphore),
+        )
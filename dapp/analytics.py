@@ -0,0 +1,194 @@
+"""Module with NumPy functions for analysing Permission dApp boxes snapshots."""
+
+from itertools import combinations
+
+import numpy as np
+
+from configuration import (
+    CALCULATED_DATA,
+    CURRENT_STAKING_DATA,
+    DOCS_VALUES_MAX_PAIRS,
+    MANDATORY_VALUES_SIZE,
+    STAKING_AMOUNT_VOTES,
+    SUBSCRIPTION_DATA,
+    SUBSCRIPTION_PERMISSIONS,
+)
+from helpers import decode_values_data
+
+HEADER_DTYPE = np.dtype(
+    [(name, ">u8") for name in CALCULATED_DATA]
+    + [(f"subscription_{name}", ">u8") for name in SUBSCRIPTION_DATA]
+    + [(f"staking_{name}", ">u8") for name in CURRENT_STAKING_DATA]
+)
+DOCS_DTYPE = np.dtype([("amount", ">u8"), ("doc_index", "u1")])
+
+
+# # SNAPSHOT
+def decode_snapshot(data):
+    """Return columnar snapshot decoded from collection of raw box values `data`.
+
+    Fixed size starting values of all the boxes are decoded into one structured
+    array, while variable number of docs pairs are decoded into another one and
+    the `offsets` array holds boundaries of each box's docs pairs.
+
+    :param data: collection of addresses and related box values data
+    :type data: dict
+    :var addresses: collection of snapshot addresses
+    :type addresses: list
+    :var decoded: collection of decoded serialized values collections
+    :type decoded: list
+    :var counts: collection of docs pairs numbers
+    :type counts: list
+    :var values: currently processed decoded values collection
+    :type values: bytes
+    :return: dict
+    """
+    addresses = list(data)
+    decoded = [decode_values_data(data[address]) for address in addresses]
+    counts = [
+        min(
+            max(len(values) - MANDATORY_VALUES_SIZE, 0) // DOCS_DTYPE.itemsize,
+            DOCS_VALUES_MAX_PAIRS,
+        )
+        for values in decoded
+    ]
+    return {
+        "addresses": np.array(addresses, dtype=object),
+        "header": np.frombuffer(
+            b"".join(values[:MANDATORY_VALUES_SIZE] for values in decoded),
+            dtype=HEADER_DTYPE,
+        ),
+        "docs": np.frombuffer(
+            b"".join(
+                values[
+                    MANDATORY_VALUES_SIZE : MANDATORY_VALUES_SIZE
+                    + count * DOCS_DTYPE.itemsize
+                ]
+                for values, count in zip(decoded, counts)
+            ),
+            dtype=DOCS_DTYPE,
+        ),
+        "offsets": np.concatenate(([0], np.cumsum(counts, dtype=np.int64))),
+    }
+
+
+def snapshot_from_mirror(connection):
+    """Return columnar snapshot of all the boxes stored in mirror database.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :return: dict
+    """
+    return decode_snapshot(
+        dict(connection.execute("SELECT address, value FROM boxes ORDER BY address"))
+    )
+
+
+# # AGGREGATES
+def docs_permissions(snapshot):
+    """Return array of total docs permission for every box in `snapshot`.
+
+    :param snapshot: columnar boxes snapshot
+    :type snapshot: dict
+    :var rows: collection of box positions for every docs pair
+    :type rows: :class:`numpy.ndarray`
+    :var permissions: collection of total docs permissions
+    :type permissions: :class:`numpy.ndarray`
+    :return: :class:`numpy.ndarray`
+    """
+    rows = np.repeat(np.arange(len(snapshot["header"])), np.diff(snapshot["offsets"]))
+    permissions = np.zeros(len(snapshot["header"]), dtype=np.uint64)
+    np.add.at(permissions, rows, snapshot["docs"]["amount"])
+    return permissions
+
+
+def staking_tiers_histogram(snapshot):
+    """Return numbers of boxes by current staking amount boundaries.
+
+    The first element counts boxes with staking amount not greater than
+    the smallest boundary and each following one counts the boxes with
+    staking amount greater than related boundary.
+
+    :param snapshot: columnar boxes snapshot
+    :type snapshot: dict
+    :var boundaries: collection of staking amount boundaries
+    :type boundaries: :class:`numpy.ndarray`
+    :return: :class:`numpy.ndarray`
+    """
+    boundaries = np.array([boundary for boundary, _ in STAKING_AMOUNT_VOTES])
+    return np.bincount(
+        np.searchsorted(boundaries, snapshot["header"]["staking_amount"], side="left"),
+        minlength=len(boundaries) + 1,
+    )
+
+
+def subscription_tiers_histogram(snapshot):
+    """Return collection of subscription tier names and related numbers of boxes.
+
+    Box subscription amount is the sum of all the subscribed tiers' amounts,
+    so the box is counted for every tier in the combination of tiers with
+    the same sum of amounts.
+
+    :param snapshot: columnar boxes snapshot
+    :type snapshot: dict
+    :var amounts: collection of distinct subscription amounts
+    :type amounts: :class:`numpy.ndarray`
+    :var counts: collection of numbers of boxes for distinct amounts
+    :type counts: :class:`numpy.ndarray`
+    :var boxes: collection of subscription amounts and related numbers of boxes
+    :type boxes: dict
+    :var tiers: collection of subscription tiers' amounts, permissions and names
+    :type tiers: list
+    :var histogram: collection of tier names and related numbers of boxes
+    :type histogram: dict
+    :var size: currently processed number of combined tiers
+    :type size: int
+    :var combination: currently processed combination of tiers
+    :type combination: tuple
+    :var count: number of boxes with currently processed combination of tiers
+    :type count: int
+    :return: dict
+    """
+    amounts, counts = np.unique(
+        snapshot["header"]["subscription_amount"], return_counts=True
+    )
+    boxes = dict(zip(amounts.tolist(), counts.tolist()))
+    tiers = list(SUBSCRIPTION_PERMISSIONS.values())
+    histogram = {name: 0 for _, _, name in tiers}
+    for size in range(1, len(tiers) + 1):
+        for combination in combinations(tiers, size):
+            count = boxes.get(sum(amount for amount, _, _ in combination), 0)
+            for _, _, name in combination:
+                histogram[name] += count
+
+    return histogram
+
+
+def top_permissions(snapshot, count=10):
+    """Return `count` addresses with the highest permission and related values.
+
+    :param snapshot: columnar boxes snapshot
+    :type snapshot: dict
+    :param count: number of returned addresses
+    :type count: int
+    :var permissions: collection of permission values
+    :type permissions: :class:`numpy.ndarray`
+    :var indexes: positions of the highest permissions in descending order
+    :type indexes: :class:`numpy.ndarray`
+    :return: list
+    """
+    permissions = snapshot["header"]["permission"].astype(np.int64)
+    indexes = np.argsort(-permissions, kind="stable")[:count]
+    return [
+        (snapshot["addresses"][index], int(permissions[index])) for index in indexes
+    ]
+
+
+def total_permission(snapshot):
+    """Return sum of permission values of all the boxes in `snapshot`.
+
+    :param snapshot: columnar boxes snapshot
+    :type snapshot: dict
+    :return: int
+    """
+    return int(snapshot["header"]["permission"].sum(dtype=np.uint64))
@@ -0,0 +1,300 @@
+"""Module with in-memory caches for Permission dApp box values and transactions."""
+
+import threading
+import time
+from collections import OrderedDict
+from copy import copy
+
+from configuration import (
+    PERMISSION_CACHE_NOT_FOUND_TTL,
+    PERMISSION_CACHE_SIZE,
+    PERMISSION_CACHE_TTL,
+    SUBSCRIPTION_CACHE_NOT_FOUND_TTL,
+    SUBSCRIPTION_CACHE_SIZE,
+    SUGGESTED_PARAMS_MAX_AGE,
+    SUGGESTED_PARAMS_ROUND_TIME,
+    SUGGESTED_PARAMS_SAFETY_ROUNDS,
+)
+
+
+class PermissionValuesCache:
+    """Bounded least recently used cache with per-entry expiry.
+
+    Entries are keyed by Permission dApp identifier and governance seat address.
+    None values stand for not found boxes and expire after `not_found_ttl`.
+    """
+
+    def __init__(
+        self,
+        size=PERMISSION_CACHE_SIZE,
+        ttl=PERMISSION_CACHE_TTL,
+        not_found_ttl=PERMISSION_CACHE_NOT_FOUND_TTL,
+    ):
+        """Set cache limits and create empty entries collection.
+
+        :param size: maximum number of cached entries
+        :type size: int
+        :param ttl: number of seconds found values are valid for
+        :type ttl: float
+        :param not_found_ttl: number of seconds not found results are valid for
+        :type not_found_ttl: float
+        """
+        self.size = size
+        self.ttl = ttl
+        self.not_found_ttl = not_found_ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return number of currently stored entries.
+
+        :return: int
+        """
+        return len(self._entries)
+
+    def get(self, app_id, address):
+        """Return two-tuple of cache hit flag and cached values for `address`.
+
+        Expired entry is removed and reported as a miss.
+
+        :param app_id: Permission dApp identifier
+        :type app_id: int
+        :param address: governance seat address
+        :type address: str
+        :var key: cache entry key
+        :type key: tuple
+        :var entry: pair of expiry time and cached values
+        :type entry: tuple
+        :return: two-tuple
+        """
+        key = (app_id, address)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+            return True, None if entry[1] is None else list(entry[1])
+
+    def set(self, app_id, address, values):
+        """Store `values` for `address` evicting the least recently used entry.
+
+        :param app_id: Permission dApp identifier
+        :type app_id: int
+        :param address: governance seat address
+        :type address: str
+        :param values: deserialized box values or None for not found box
+        :type values: list
+        :var key: cache entry key
+        :type key: tuple
+        :var ttl: number of seconds the entry is valid for
+        :type ttl: float
+        """
+        key = (app_id, address)
+        ttl = self.not_found_ttl if values is None else self.ttl
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + ttl,
+                None if values is None else list(values),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, app_id, address):
+        """Remove cached entry for `address` if it exists.
+
+        :param app_id: Permission dApp identifier
+        :type app_id: int
+        :param address: governance seat address
+        :type address: str
+        """
+        with self._lock:
+            self._entries.pop((app_id, address), None)
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class NotSubscribedCache:
+    """Bounded least recently used cache of addresses not subscribed to a tier.
+
+    Entries are keyed by subscription tier app and user address and expire
+    after `ttl` seconds, so new subscriptions are eventually picked up.
+    """
+
+    def __init__(
+        self, size=SUBSCRIPTION_CACHE_SIZE, ttl=SUBSCRIPTION_CACHE_NOT_FOUND_TTL
+    ):
+        """Set cache limits and create empty entries collection.
+
+        :param size: maximum number of cached entries
+        :type size: int
+        :param ttl: number of seconds not subscribed results are valid for
+        :type ttl: float
+        """
+        self.size = size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return number of currently stored entries.
+
+        :return: int
+        """
+        return len(self._entries)
+
+    def get(self, app_id, address):
+        """Return True if `address` is cached as not subscribed to `app_id` tier.
+
+        Expired entry is removed and reported as a miss.
+
+        :param app_id: subscription tier app
+        :type app_id: int
+        :param address: user's address
+        :type address: str
+        :var key: cache entry key
+        :type key: tuple
+        :var expiry: cached entry's expiry time
+        :type expiry: float
+        :return: bool
+        """
+        key = (app_id, address)
+        with self._lock:
+            expiry = self._entries.get(key)
+            if expiry is None:
+                return False
+
+            if expiry <= time.monotonic():
+                del self._entries[key]
+                return False
+
+            self._entries.move_to_end(key)
+            return True
+
+    def set(self, app_id, address):
+        """Store `address` as not subscribed evicting the least recently used entry.
+
+        :param app_id: subscription tier app
+        :type app_id: int
+        :param address: user's address
+        :type address: str
+        :var key: cache entry key
+        :type key: tuple
+        """
+        key = (app_id, address)
+        with self._lock:
+            self._entries[key] = time.monotonic() + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, app_id, address):
+        """Remove cached entry for `address` if it exists.
+
+        :param app_id: subscription tier app
+        :type app_id: int
+        :param address: user's address
+        :type address: str
+        """
+        with self._lock:
+            self._entries.pop((app_id, address), None)
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SuggestedParamsCache:
+    """Per Node cache of suggested transaction parameters.
+
+    Parameters are fetched again when they are older than `max_age` seconds,
+    so fee changes are picked up, or when the estimated current round gets
+    within `safety_rounds` of parameters' last valid round.
+    """
+
+    def __init__(
+        self,
+        max_age=SUGGESTED_PARAMS_MAX_AGE,
+        round_time=SUGGESTED_PARAMS_ROUND_TIME,
+        safety_rounds=SUGGESTED_PARAMS_SAFETY_ROUNDS,
+    ):
+        """Set cache limits and create empty entries collection.
+
+        :param max_age: maximum number of seconds parameters are reused for
+        :type max_age: float
+        :param round_time: estimated number of seconds per round
+        :type round_time: float
+        :param safety_rounds: number of rounds before last valid round to refresh at
+        :type safety_rounds: int
+        """
+        self.max_age = max_age
+        self.round_time = round_time
+        self.safety_rounds = safety_rounds
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _is_expired(self, entry, now):
+        """Return True if cached parameters `entry` shouldn't be used anymore.
+
+        :param entry: pair of fetching time and suggested parameters
+        :type entry: tuple
+        :param now: current monotonic time
+        :type now: float
+        :var age: number of seconds since parameters are fetched
+        :type age: float
+        :var params: cached suggested parameters
+        :type params: :class:`transaction.SuggestedParams`
+        :return: bool
+        """
+        age = now - entry[0]
+        params = entry[1]
+        return (
+            age >= self.max_age
+            or params.first + age / self.round_time + self.safety_rounds >= params.last
+        )
+
+    def get(self, client):
+        """Return copy of cached or freshly fetched suggested parameters for `client`.
+
+        :param client: Algorand Node client instance
+        :type client: :class:`AlgodClient`
+        :var now: current monotonic time
+        :type now: float
+        :var entry: pair of fetching time and suggested parameters
+        :type entry: tuple
+        :return: :class:`transaction.SuggestedParams`
+        """
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(client.algod_address)
+            if entry is None or self._is_expired(entry, now):
+                entry = (now, client.suggested_params())
+                self._entries[client.algod_address] = entry
+
+            return copy(entry[1])
+
+    def invalidate(self, client=None):
+        """Remove cached parameters for `client` or for all Nodes if not provided.
+
+        :param client: Algorand Node client instance
+        :type client: :class:`AlgodClient`
+        """
+        with self._lock:
+            if client is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(client.algod_address, None)
+
+
+not_subscribed_cache = NotSubscribedCache()
+permission_values_cache = PermissionValuesCache()
+suggested_params_cache = SuggestedParamsCache()
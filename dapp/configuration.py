@@ -9,6 +9,7 @@ STAKING_KEY = "AA=="
 
 INDEXER_TOKEN = ""
 INDEXER_ADDRESS = "https://mainnet-idx.4160.nodely.io"
+INDEXER_ADDRESS_TESTNET = "https://testnet-idx.4160.nodely.dev"
 
 STAKING_AMOUNT_VOTES = (
     (500_000_000_000, 23299.689438),
@@ -17,6 +18,44 @@ STAKING_AMOUNT_VOTES = (
 )
 
 MANDATORY_VALUES_SIZE = 48
+DOCS_VALUES_MAX_PAIRS = 15
+VALUES_RAW_VERSION = 2
+WRITE_RAW_VALUES = False
+WRITE_BOXES_METHOD = False
+
+BOXES_FETCHING_WORKERS = 16
+BOXES_PAGE_LIMIT = 1000
+BOXES_WRITING_GROUP_SIZE = 64
+BOXES_PER_WRITE_CALL = 8
+BOXES_DELETING_GROUP_SIZE = 16
+APP_CALL_ARGS_MAX_SIZE = 2048
+AIO_CONCURRENCY = 64
+AIO_CONNECTIONS_LIMIT = 32
+
+MIRROR_DATABASE = "permission_dapp_{network}.sqlite3"
+MIRROR_MAX_SYNC_GAP = 50_000
+
+WRITE_JOURNAL = "write_journal_{network}.jsonl"
+
+PERMISSION_CACHE_SIZE = 10_000
+PERMISSION_CACHE_TTL = 60
+PERMISSION_CACHE_NOT_FOUND_TTL = 5
+
+SUBSCRIPTION_CACHE_SIZE = 10_000
+SUBSCRIPTION_CACHE_NOT_FOUND_TTL = 300
+
+SUGGESTED_PARAMS_MAX_AGE = 60
+SUGGESTED_PARAMS_ROUND_TIME = 2.8
+SUGGESTED_PARAMS_SAFETY_ROUNDS = 50
+SUGGESTED_PARAMS_ERRORS = (
+    "txn dead",
+    "fee too small",
+    "below threshold",
+    "less than the minimum",
+)
+
+PIPELINE_MAX_RETRIES = 2
+PIPELINE_MAX_WAIT_ROUNDS = 10
 
 CALCULATED_DATA = ["votes", "permission"]
 SUBSCRIPTION_DATA = ["amount", "permission"]
@@ -93,3 +132,4 @@ SUBSCRIPTION_PERMISSIONS = {
 }
 
 SUBSCRIPTION_PERIOD_EXTENSION = 86400
+SUBSCRIPTIONS_RUN_INTERVAL = 86400
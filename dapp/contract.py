@@ -1,6 +1,18 @@
 """Permission dApp smart contract implemented with Algorand Python (puyapy)."""
 
-from algopy import ARC4Contract, Global, Txn, arc4, op
+from algopy import (
+    ARC4Contract,
+    Bytes,
+    Global,
+    Txn,
+    arc4,
+    op,
+    subroutine,
+    urange,
+)
+
+BoxEntry = arc4.Tuple[arc4.DynamicBytes, arc4.String]
+RawBoxEntry = arc4.Tuple[arc4.DynamicBytes, arc4.DynamicBytes]
 
 
 class PermissionDApp(ARC4Contract):
@@ -50,29 +62,54 @@ class PermissionDApp(ARC4Contract):
         """
         assert Txn.sender == Global.creator_address, "Only creator can write to boxes"
 
-        # Convert arc4 types to bytes for box operations
-        box_name_bytes = box_name.bytes
-        value_bytes = value.bytes
+        put_box(box_name, value.bytes)
 
-        # For DynamicBytes, the .bytes includes the length prefix, so we need to extract the actual content
-        # The first 2 bytes are the length prefix in big-endian
-        actual_box_name_length = op.extract_uint16(box_name_bytes, 0)
-        actual_box_name = op.extract(box_name_bytes, 2, actual_box_name_length)
+    @arc4.abimethod
+    def write_box_raw(
+        self, box_name: arc4.DynamicBytes, value: arc4.DynamicBytes
+    ) -> None:
+        """
+        Write raw bytes value to a box. Only the creator can call this method.
 
-        # For String, the .bytes also includes the length prefix
-        actual_value_length = op.extract_uint16(value_bytes, 0)
-        actual_value = op.extract(value_bytes, 2, actual_value_length)
+        Args:
+            box_name: The name of the box (should be 32 bytes)
+            value: The raw bytes value to write to the box
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can write to boxes"
 
-        assert actual_box_name_length == 32, "Box name must be exactly 32 bytes"
+        put_box(box_name, value.bytes)
 
-        # Simple approach: always delete the box first if it exists, then create it
-        # This avoids the length comparison issue
-        _length, exists = op.Box.length(actual_box_name)
-        if exists:
-            op.Box.delete(actual_box_name)
+    @arc4.abimethod
+    def write_boxes(self, boxes: arc4.DynamicArray[BoxEntry]) -> None:
+        """
+        Write values to multiple boxes in a single call. Only the creator can
+        call this method.
 
-        # Write to box (create new box)
-        op.Box.put(actual_box_name, actual_value)
+        Args:
+            boxes: The array of (box_name, value) pairs, every box name should
+                be 32 bytes and referenced by the application call
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can write to boxes"
+
+        for index in urange(boxes.length):
+            box_name, value = boxes[index].native
+            put_box(box_name.copy(), value.bytes)
+
+    @arc4.abimethod
+    def write_boxes_raw(self, boxes: arc4.DynamicArray[RawBoxEntry]) -> None:
+        """
+        Write raw bytes values to multiple boxes in a single call. Only the
+        creator can call this method.
+
+        Args:
+            boxes: The array of (box_name, value) pairs, every box name should
+                be 32 bytes and referenced by the application call
+        """
+        assert Txn.sender == Global.creator_address, "Only creator can write to boxes"
+
+        for index in urange(boxes.length):
+            box_name, value = boxes[index].native
+            put_box(box_name.copy(), value.bytes)
 
     @arc4.abimethod
     def delete_box(self, box_name: arc4.DynamicBytes) -> None:
@@ -95,3 +132,37 @@ class PermissionDApp(ARC4Contract):
 
         # Delete the box
         op.Box.delete(actual_box_name)
+
+
+@subroutine
+def put_box(box_name: arc4.DynamicBytes, value_bytes: Bytes) -> None:
+    """
+    Replace content of the box named `box_name` with `value_bytes` content.
+
+    Args:
+        box_name: The name of the box (should be 32 bytes)
+        value_bytes: The ARC4 encoded string or bytes value to write to the box
+    """
+    # Convert arc4 type to bytes for box operations
+    box_name_bytes = box_name.bytes
+
+    # For DynamicBytes, the .bytes includes the length prefix, so we need to extract the actual content
+    # The first 2 bytes are the length prefix in big-endian
+    actual_box_name_length = op.extract_uint16(box_name_bytes, 0)
+    actual_box_name = op.extract(box_name_bytes, 2, actual_box_name_length)
+
+    # For String and DynamicBytes, the .bytes also includes the length prefix
+    actual_value_length = op.extract_uint16(value_bytes, 0)
+    actual_value = op.extract(value_bytes, 2, actual_value_length)
+
+    assert actual_box_name_length == 32, "Box name must be exactly 32 bytes"
+
+    # Update existing box in place, resizing it only when the length changes
+    length, exists = op.Box.length(actual_box_name)
+    if exists:
+        if length != actual_value_length:
+            op.Box.resize(actual_box_name, actual_value_length)
+        op.Box.replace(actual_box_name, 0, actual_value)
+    else:
+        # Write to box (create new box)
+        op.Box.put(actual_box_name, actual_value)
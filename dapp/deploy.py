@@ -8,6 +8,7 @@ from algosdk.logic import get_application_address
 from algosdk.transaction import PaymentTxn
 from algosdk.v2client.algod import AlgodClient
 
+from cache import suggested_params_cache
 from contract import PermissionDApp
 from helpers import (
     compile_program,
@@ -148,7 +149,7 @@ def fund_app(app_id, network, amount=1_000_000):
     )
     sender = address_from_private_key(creator_private_key)
     app_address = get_application_address(app_id)
-    sp = client.suggested_params()
+    sp = suggested_params_cache.get(client)
     sp.flat_fee = True
     sp.fee = 1000
 
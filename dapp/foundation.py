@@ -6,6 +6,7 @@ from pathlib import Path
 from algosdk.v2client.algod import AlgodClient
 
 from configuration import (
+    BOXES_FETCHING_WORKERS,
     CURRENT_STAKING_POSITION,
     DAO_DISCUSSIONS_DOCS,
     DAO_DISCUSSIONS_DOCS_STARTING_INDEX,
@@ -13,25 +14,38 @@ from configuration import (
     MERGED_ACCOUNTS,
     STAKING_DOCS,
     STAKING_DOCS_STARTING_INDEX,
+    WRITE_JOURNAL,
 )
 from helpers import (
     box_writing_parameters,
     calculate_votes_and_permission,
+    deserialize_values_data,
     environment_variables,
     governance_staking_addresses,
+    indexer_instance,
     permission_dapp_id,
     permission_for_amount,
     read_json,
 )
+from journal import reset_journal
+from mirror import (
+    indexed_subscriptions,
+    mirror_connection,
+    mirrored_box_contents,
+    mirrored_permission_values,
+    sync_mirror,
+    sync_subscriptions,
+)
 from network import (
     check_and_update_changed_subscriptions_and_staking,
     check_and_update_new_stakers,
     check_and_update_new_subscribers,
     current_governance_staking_for_address,
     fetch_subscriptions_from_boxes,
-    permission_dapp_values_from_boxes,
+    permission_dapp_box_contents,
     write_foundation_boxes,
 )
+from plan import box_updates_plan, save_plan, simulate_plan
 
 
 # # HELPERS
@@ -55,14 +69,16 @@ def _calculate_and_update_votes_and_permissions(data):
         data[address][1] = permission
 
 
-def _initial_check(network="testnet"):
+def _initial_check(network="testnet", resume=False):
     """Return environment variables and client instances.
 
     Raise ValueError if Permission dApp ID isn't set.
-    Raise ValueError if there are existing dApp boxes.
+    Raise ValueError if there are existing dApp boxes and `resume` isn't set.
 
     :param network: network to deploy to (e.g., "testnet")
     :type network: str
+    :param resume: allow existing boxes written by an interrupted run
+    :type resume: Boolean
     :var env: environment variables collection
     :type env: dict
     :var client: Algorand Node client instance
@@ -76,6 +92,9 @@ def _initial_check(network="testnet"):
         env.get(f"algod_token_{network}"), env.get(f"algod_address_{network}")
     )
 
+    if resume:
+        return env, client
+
     boxes = client.application_boxes(permission_dapp_id(network))
     if len(boxes.get("boxes", [])):
         raise ValueError("Some boxes are already populated!")
@@ -185,11 +204,18 @@ def _prepare_data(env, network="testnet"):
     return data
 
 
-def prepare_and_write_data(network="testnet"):
+def prepare_and_write_data(network="testnet", resume=False):
     """Collect and write collection of DAO addresses and related values.
 
+    Written groups are recorded in the network's write journal. If `resume`
+    is set, the run interrupted before is continued skipping the writes
+    confirmed in the journal and the boxes already holding their values,
+    otherwise the journal is started anew and all the boxes are written.
+
     :param network: network to deploy to (e.g., "testnet")
     :type network: str
+    :param resume: continue interrupted run from its write journal
+    :type resume: Boolean
     :var env: environment variables collection
     :type env: dict
     :var client: Algorand Node client instance
@@ -198,12 +224,28 @@ def prepare_and_write_data(network="testnet"):
     :type data: dict
     :var writing_parameters: instances sneeded for writing boxes to blockchain
     :type writing_parameters: dict
+    :var app_id: Permission dApp identifier
+    :type app_id: int
+    :var current: collection of addresses and related current box contents
+    :type current: dict or None
+    :var journal: write journal file path
+    :type journal: :class:`pathlib.Path`
     """
-    env, client = _initial_check(network=network)
+    env, client = _initial_check(network=network, resume=resume)
     data = _prepare_data(env, network=network)
     writing_parameters = box_writing_parameters(env, network=network)
+    app_id = permission_dapp_id(network)
+    current = None
+    journal = Path(__file__).resolve().parent / WRITE_JOURNAL.format(network=network)
+    if resume:
+        current = permission_dapp_box_contents(
+            client, app_id, workers=BOXES_FETCHING_WORKERS
+        )
+    else:
+        reset_journal(journal)
+
     write_foundation_boxes(
-        client, permission_dapp_id(network), writing_parameters, data
+        client, app_id, writing_parameters, data, current=current, journal=journal
     )
 
 
@@ -264,11 +306,18 @@ def _update_current_staking_for_non_foundation(client, data, starting_position):
 
 
 # # UPDATE
-def check_and_update_permission_dapp_boxes(network="testnet"):
-    """Check and update boxes if staking and/or subscription values have changed.
+def _permission_dapp_boxes_state(network="testnet", mirror=False):
+    """Return Permission dApp's current boxes with subscriptions and staking values.
+
+    If `mirror` is True, current boxes values are read from local mirror database
+    which is synced beforehand, refetching only the boxes touched since last sync,
+    while subscriptions are read from mirror's subscriptions expiry index synced
+    from subscription tier apps' calls.
 
     :param network: network to deploy to (e.g., "testnet")
     :type network: str
+    :param mirror: read current boxes values from local mirror database
+    :type mirror: Boolean
     :var env: environment variables collection
     :type env: dict
     :var client: Algorand Node client instance
@@ -283,8 +332,15 @@ def check_and_update_permission_dapp_boxes(network="testnet"):
     :type subscriptions: dict
     :var stakings: collection  of all governance staking addresses and related amounts
     :type stakings: dict
+    :var connection: local mirror database connection
+    :type connection: :class:`sqlite3.Connection`
+    :var indexer_client: Algorand Indexer client instance
+    :type indexer_client: :class:`IndexerClient`
+    :var current: collection of addresses and related current box contents
+    :type current: dict
     :var permissions: collection of addresses and related votes and permission values
     :type permissions: dict
+    :return: dict
     """
     env = environment_variables()
     app_id = permission_dapp_id(network)
@@ -296,24 +352,133 @@ def check_and_update_permission_dapp_boxes(network="testnet"):
     )
     writing_parameters = box_writing_parameters(env, network=network)
 
-    subscriptions = fetch_subscriptions_from_boxes(client)
+    if mirror:
+        connection = mirror_connection(network=network)
+        indexer_client = indexer_instance(network=network)
+        sync_subscriptions(connection, client, indexer_client)
+        subscriptions = indexed_subscriptions(connection)
+    else:
+        subscriptions = fetch_subscriptions_from_boxes(
+            client, workers=BOXES_FETCHING_WORKERS
+        )
+
     stakings = {
         address: current_governance_staking_for_address(mainnet_client, address)
         for address in governance_staking_addresses()
     }
-    permissions = permission_dapp_values_from_boxes(client, app_id)
+    if mirror:
+        sync_mirror(connection, client, indexer_client, app_id)
+        current = mirrored_box_contents(connection)
+        permissions = mirrored_permission_values(connection)
+    else:
+        current = permission_dapp_box_contents(
+            client, app_id, workers=BOXES_FETCHING_WORKERS
+        )
+        permissions = {
+            address: deserialize_values_data(content)
+            for address, content in current.items()
+            if content
+        }
 
+    return {
+        "client": client,
+        "app_id": app_id,
+        "writing_parameters": writing_parameters,
+        "permissions": permissions,
+        "subscriptions": subscriptions,
+        "stakings": stakings,
+        "current": current,
+    }
+
+
+def check_and_update_permission_dapp_boxes(network="testnet", mirror=False):
+    """Check and update boxes if staking and/or subscription values have changed.
+
+    If `mirror` is True, current boxes values are read from local mirror database
+    which is synced beforehand, refetching only the boxes touched since last sync.
+    Writes of values equal to current boxes contents are skipped.
+
+    :param network: network to deploy to (e.g., "testnet")
+    :type network: str
+    :param mirror: read current boxes values from local mirror database
+    :type mirror: Boolean
+    :var state: Permission dApp's current boxes with subscriptions and staking
+    :type state: dict
+    """
+    state = _permission_dapp_boxes_state(network=network, mirror=mirror)
     check_and_update_new_subscribers(
-        client, app_id, writing_parameters, permissions, subscriptions
+        state["client"],
+        state["app_id"],
+        state["writing_parameters"],
+        state["permissions"],
+        state["subscriptions"],
+        state["current"],
     )
     check_and_update_new_stakers(
-        client, app_id, writing_parameters, permissions, stakings
+        state["client"],
+        state["app_id"],
+        state["writing_parameters"],
+        state["permissions"],
+        state["stakings"],
+        state["current"],
     )
     check_and_update_changed_subscriptions_and_staking(
-        client, app_id, writing_parameters, permissions, subscriptions, stakings
+        state["client"],
+        state["app_id"],
+        state["writing_parameters"],
+        state["permissions"],
+        state["subscriptions"],
+        state["stakings"],
+        state["current"],
     )
 
 
+def plan_permission_dapp_boxes(
+    network="testnet", mirror=False, simulate=True, filename=None
+):
+    """Return plan of box updates without submitting anything to the blockchain.
+
+    Plan holds create and update actions with old and new values for all
+    the box writes :func:`check_and_update_permission_dapp_boxes` would make.
+    If `simulate` is True, the planned groups are run through Node's simulate
+    endpoint. Plan is saved to `filename` JSON file if provided.
+
+    :param network: network to deploy to (e.g., "testnet")
+    :type network: str
+    :param mirror: read current boxes values from local mirror database
+    :type mirror: Boolean
+    :param simulate: validate planned groups by simulating them
+    :type simulate: Boolean
+    :param filename: full path to plan's JSON file
+    :type filename: :class:`pathlib.Path`
+    :var state: Permission dApp's current boxes with subscriptions and staking
+    :type state: dict
+    :var plan: box updates plan
+    :type plan: dict
+    :return: dict
+    """
+    state = _permission_dapp_boxes_state(network=network, mirror=mirror)
+    plan = box_updates_plan(
+        state["app_id"],
+        state["permissions"],
+        state["subscriptions"],
+        state["stakings"],
+        state["current"],
+    )
+    if simulate:
+        plan = simulate_plan(
+            state["client"],
+            state["writing_parameters"],
+            plan,
+            workers=BOXES_FETCHING_WORKERS,
+        )
+
+    if filename is not None:
+        save_plan(plan, filename)
+
+    return plan
+
+
 if __name__ == "__main__":  # pragma: no cover
     prepare_and_write_data()
     # import time
@@ -1,10 +1,14 @@
 """Module with Permission dApp helpers functions."""
 
 import base64
+import binascii
 import json
 import os
+import struct
 import time
+from collections import namedtuple
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 
 from algosdk.abi.contract import Contract
@@ -19,120 +23,165 @@ from dotenv import load_dotenv
 from configuration import (
     CURRENT_STAKING_POSITION,
     DOCS_STARTING_POSITION,
+    DOCS_VALUES_MAX_PAIRS,
     INDEXER_ADDRESS,
+    INDEXER_ADDRESS_TESTNET,
     INDEXER_TOKEN,
     MANDATORY_VALUES_SIZE,
     PERMISSION_APP_ID,
     PERMISSION_APP_ID_TESTNET,
     STAKING_AMOUNT_VOTES,
     SUBSCRIPTION_POSITION,
+    VALUES_RAW_VERSION,
+    WRITE_RAW_VALUES,
 )
 
+SubtopiaSubscription = namedtuple(
+    "SubtopiaSubscription", ["tier_asset_id", "version", "start", "end", "duration"]
+)
+SUBTOPIA_BOX_STRUCT = struct.Struct(">5Q")
+COMETA_STAKING_STRUCT = struct.Struct(">xQ")
+
 
 # # VALUES
-def _docs_positions_offset_and_length_pairs(
-    docs_data_size, start=MANDATORY_VALUES_SIZE
-):
-    """Return offset/position and size pairs for docs values with size `docs_data_size`
+def _value_length_from_values_position(position):
+    """Return bytes length of the value defined by providced `position`
 
-    :param docs_data_size: size of serialized docs values
-    :type docs_data_size: int
-    :param start: starting position of documents' values
-    :type start: int
-    :return: list
+    First three pairs are:
+    CALCULATED_DATA = ["votes", "permission"]
+    SUBSCRIPTION_DATA = ["amount", "permission"]
+    CURRENT_STAKING_DATA = ["amount", "permission"]
+
+    After those 6, pairs are (permission, doc_index).
+
+    :param position: value index/position in values collection
+    :type position: int
+    :return: int
     """
-    return [
-        (
-            (start + (index // 2) * 9, 8)
-            if divmod(index, 2)[1] == 0
-            else (start + (index // 2) * 9 + 8, 1)
+    return 8 if position < 6 or divmod(position, 2)[1] == 0 else 1
+
+
+@lru_cache(maxsize=None)
+def _values_struct(count):
+    """Return compiled big-endian struct for collection of `count` values.
+
+    For complete boxes the format is ">6Q" followed by one "QB" pair per document.
+
+    :param count: number of values in collection
+    :type count: int
+    :return: :class:`struct.Struct`
+    """
+    return struct.Struct(
+        ">"
+        + "".join(
+            "Q" if _value_length_from_values_position(position) == 8 else "B"
+            for position in range(count)
         )
-        for counter, index in enumerate(range(30))
-        if counter // 2 < docs_data_size // 9
-    ]
+    )
+
 
+def _values_count_from_size(size):
+    """Return number of values serialized in the data of `size` bytes.
 
-def _extract_uint(byte_str, index, length):
-    """Return extarcted uint from providedc byte string.
+    Starting values are followed by up to `DOCS_VALUES_MAX_PAIRS` document pairs.
 
-    :param byte_str: base64 encoded values
-    :type byte_str: bytes
-    :param index: target value's position/index in data
-    :type index: int
-    :param length: target value's bytes size/length
-    :type length: int
+    :param size: serialized values collection size in bytes
+    :type size: int
     :return: int
     """
-    return int.from_bytes(byte_str[index : index + length], byteorder="big")
-
+    return MANDATORY_VALUES_SIZE // 8 + 2 * min(
+        max(size - MANDATORY_VALUES_SIZE, 0) // 9, DOCS_VALUES_MAX_PAIRS
+    )
 
-def _starting_positions_offset_and_length_pairs(end=MANDATORY_VALUES_SIZE):
-    """Return offset/position and related bytes size/length for starting values.
 
-    Starting three pairs are:
-    CALCULATED_DATA = ["votes", "permission"]
-    SUBSCRIPTION_DATA = ["amount", "permission"]
-    CURRENT_STAKING_DATA = ["amount", "permission"]
+def _unpack_values(decoded):
+    """Return collection of integer values unpacked from serialized `decoded` data.
 
-    :param end: starting values right boundary
-    :type end: int
+    :param decoded: serialized values collection
+    :type decoded: bytes-like object
     :return: list
     """
-    return [(offset, 8) for offset in range(0, end, 8)]
+    return list(
+        _values_struct(_values_count_from_size(len(decoded))).unpack_from(decoded)
+    )
 
 
-def _value_length_from_values_position(position):
-    """Return bytes length of the value defined by providced `position`
+def values_data_version(data):
+    """Return format version of the values `data` stored in a box.
 
-    First three pairs are:
-    CALCULATED_DATA = ["votes", "permission"]
-    SUBSCRIPTION_DATA = ["amount", "permission"]
-    CURRENT_STAKING_DATA = ["amount", "permission"]
+    Version 1 data is base64 encoded text, while version 2 raw data starts with
+    `VALUES_RAW_VERSION` byte that can't be found in base64 alphabet.
 
-    After those 6, pairs are (permission, doc_index).
-
-    :param position: value index/position in values collection
-    :type position: int
+    :param data: box content
+    :type data: str or bytes
     :return: int
     """
-    return 8 if position < 6 or divmod(position, 2)[1] == 0 else 1
+    if isinstance(data, str) or data[:1] != bytes((VALUES_RAW_VERSION,)):
+        return 1
+
+    return VALUES_RAW_VERSION
+
+
+def decode_values_data(data):
+    """Return serialized values collection decoded from box content `data`.
+
+    :param data: version 1 base64 encoded or version 2 raw values data
+    :type data: str or bytes
+    :return: bytes
+    """
+    if values_data_version(data) == VALUES_RAW_VERSION:
+        return bytes(data[1:])
 
+    return binascii.a2b_base64(data)
 
-def _values_offset_and_length_pairs(docs_data_size):
-    """Return offset/position and related bytes size/length of serialized values data.
 
-    Provided `docs_data_size` represents size after mandatory starting size.
+def deserialize_box_value(value):
+    """Return collection of integer values deserialized from Node's box `value`.
 
-    :param docs_data_size: size of docs values pairs
-    :type docs_data_size: int
+    Node returns base64 encoded box content that is decoded bytes to bytes
+    without intermediate text copy and deserialized by its format version.
+
+    :param value: fetch application box call's response value
+    :type value: str
     :return: list
     """
-    return (
-        _starting_positions_offset_and_length_pairs()
-        + _docs_positions_offset_and_length_pairs(docs_data_size)
-    )
+    return _unpack_values(decode_values_data(binascii.a2b_base64(value)))
 
 
 def deserialize_values_data(data):
-    """Return collection of integer values deserialized from base64 encoded `data`.
-
-    :param data: base64 encoded values collection
-    :type data: str
-    :var decoded: base64 decoded values collection
-    :type decoded: bytes
-    :var offset: current value's offset/position in encoded data
-    :type offset: int
-    :var length: current value's size in bytes
-    :type length: int
+    """Return collection of integer values deserialized from box content `data`.
+
+    :param data: version 1 base64 encoded or version 2 raw values data
+    :type data: str or bytes
     :return: list
     """
-    decoded = base64.b64decode(data)
-    return [
-        _extract_uint(decoded, offset, length)
-        for offset, length in _values_offset_and_length_pairs(
-            len(decoded) - MANDATORY_VALUES_SIZE
-        )
-    ]
+    return _unpack_values(decode_values_data(data))
+
+
+def serialize_raw_values(values):
+    """Return version 2 raw data serialized from `values` collection of integers.
+
+    :param values: collection of integer values to serialize
+    :type values: list
+    :return: bytes
+    """
+    return bytes((VALUES_RAW_VERSION,)) + _values_struct(len(values)).pack(*values)
+
+
+def serialize_box_values(values):
+    """Return box data serialized from `values` in the configured format version.
+
+    Version 2 raw data is written by the `_raw` methods of the upgraded
+    Permission dApp, so it is returned only if `WRITE_RAW_VALUES` is enabled.
+
+    :param values: collection of integer values to serialize
+    :type values: list
+    :return: bytes or str
+    """
+    if WRITE_RAW_VALUES:
+        return serialize_raw_values(values)
+
+    return serialize_values(values)
 
 
 def serialize_values(values):
@@ -140,25 +189,65 @@ def serialize_values(values):
 
     :param values: collection of integer values to serialize
     :type values: list
-    :var _bytes: serialized values collection
-    :type _bytes: bytes
-    :var position: current byte's position in serialized data
-    :type position: int
-    :var val: current byte's value in serialized data
-    :type val: int
     :return: str
     """
-    _bytes = bytes(
-        x
-        for position, val in enumerate(values)
-        for x in int.to_bytes(
-            val,
-            length=_value_length_from_values_position(position),
-            byteorder="big",
-            signed=False,
+    return base64.b64encode(_values_struct(len(values)).pack(*values)).decode("ascii")
+
+
+# # RECORDS
+def parse_subtopia_box(raw):
+    """Return Subtopia subscription record unpacked from `raw` box value.
+
+    :param raw: raw Subtopia box value
+    :type raw: bytes-like object
+    :return: :class:`SubtopiaSubscription`
+    """
+    return SubtopiaSubscription._make(SUBTOPIA_BOX_STRUCT.unpack(raw))
+
+
+def parse_subtopia_boxes(raws):
+    """Return collection of Subtopia subscription records unpacked from `raws`.
+
+    All the raw values are joined and unpacked in a single pass.
+
+    :param raws: collection of raw Subtopia box values
+    :type raws: iterable
+    :var raws_list: collection of raw Subtopia box values
+    :type raws_list: list
+    :return: list
+    """
+    raws_list = list(raws)
+    if any(len(raw) != SUBTOPIA_BOX_STRUCT.size for raw in raws_list):
+        raise ValueError("Invalid Subtopia box value size!")
+
+    return list(
+        map(
+            SubtopiaSubscription._make,
+            SUBTOPIA_BOX_STRUCT.iter_unpack(b"".join(raws_list)),
         )
     )
-    return base64.b64encode(_bytes).decode("ascii")
+
+
+def parse_cometa_staking_amount(raw):
+    """Return staking amount unpacked from Cometa's `raw` local state value.
+
+    Amount is stored as uint64 following the value's leading byte.
+
+    :param raw: raw Cometa local state bytes value
+    :type raw: bytes-like object
+    :return: int
+    """
+    return COMETA_STAKING_STRUCT.unpack_from(raw)[0]
+
+
+def parse_cometa_staking_amounts(raws):
+    """Return collection of staking amounts unpacked from Cometa's `raws` values.
+
+    :param raws: collection of raw Cometa local state bytes values
+    :type raws: iterable
+    :return: list
+    """
+    return [COMETA_STAKING_STRUCT.unpack_from(raw)[0] for raw in raws]
 
 
 # # CONTRACT
@@ -222,33 +311,6 @@ def load_contract(dapp_name="PermissionDApp"):
 
 
 # # STAKING
-def _application_transaction(params, indexer_client):
-    """Yield transaction connected with application defined by provided `params`.
-
-    :param params: collection of arguments to search transactions endpoint
-    :type params: dict
-    :param indexer_client: Algorand Indexer client instance
-    :type indexer_client: :class:`IndexerClient`
-    :var results: fetched page of transactions
-    :type results: dict
-    :var transaction: transaction instance
-    :type transaction: dict
-    :yield: dict
-    """
-    results = _application_transactions(params, indexer_client, delay=1)
-    while results.get("transactions"):
-        for transaction in results.get("transactions"):
-            yield transaction
-
-        pause(1)
-        results = _application_transactions(
-            params,
-            indexer_client,
-            next_page=results.get("next-token"),
-            delay=1,
-        )
-
-
 def _application_transactions(
     params, indexer_client, next_page=None, delay=1, error_delay=5, retries=20
 ):
@@ -298,14 +360,31 @@ def _application_transactions(
             counter += 1
 
 
-def _indexer_instance():
-    """Return Algorand Indexer instance.
+def application_transaction(params, indexer_client):
+    """Yield transaction connected with application defined by provided `params`.
 
-    :return: :class:`IndexerClient`
+    :param params: collection of arguments to search transactions endpoint
+    :type params: dict
+    :param indexer_client: Algorand Indexer client instance
+    :type indexer_client: :class:`IndexerClient`
+    :var results: fetched page of transactions
+    :type results: dict
+    :var transaction: transaction instance
+    :type transaction: dict
+    :yield: dict
     """
-    return IndexerClient(
-        INDEXER_TOKEN, INDEXER_ADDRESS, headers={"User-Agent": "algosdk"}
-    )
+    results = _application_transactions(params, indexer_client, delay=1)
+    while results.get("transactions"):
+        for transaction in results.get("transactions"):
+            yield transaction
+
+        pause(1)
+        results = _application_transactions(
+            params,
+            indexer_client,
+            next_page=results.get("next-token"),
+            delay=1,
+        )
 
 
 def governance_staking_addresses(staking_app_id=None, staking_min_round=None):
@@ -327,18 +406,32 @@ def governance_staking_addresses(staking_app_id=None, staking_min_round=None):
         return set()
 
     addresses = set()
-    indexer_client = _indexer_instance()
+    indexer_client = indexer_instance()
     params = {
         "application_id": staking_app_id,
         "limit": 1000,
         "min_round": staking_min_round,
     }
-    for transaction in _application_transaction(params, indexer_client):
+    for transaction in application_transaction(params, indexer_client):
         addresses.add(transaction.get("sender"))
 
     return addresses
 
 
+def indexer_instance(network="mainnet"):
+    """Return Algorand Indexer instance for provided `network`.
+
+    :param network: network to query (e.g., "testnet")
+    :type network: str
+    :return: :class:`IndexerClient`
+    """
+    return IndexerClient(
+        INDEXER_TOKEN,
+        INDEXER_ADDRESS if network == "mainnet" else INDEXER_ADDRESS_TESTNET,
+        headers={"User-Agent": "algosdk"},
+    )
+
+
 # # HELPERS
 def box_name_from_address(address):
     """Return string representation of base64 encoded public Algorand `address`.
@@ -0,0 +1,146 @@
+"""Module with functions for append-only journal of Permission dApp box writes."""
+
+import binascii
+import json
+import os
+import time
+
+from algosdk.error import AlgodHTTPError
+
+from helpers import box_name_from_address
+
+
+def append_journal_entry(path, entry):
+    """Append `entry` with current timestamp as a new line of `path` journal.
+
+    :param path: journal file path
+    :type path: :class:`pathlib.Path`
+    :param entry: journal entry
+    :type entry: dict
+    """
+    with open(path, "a") as journal_file:
+        journal_file.write(json.dumps({**entry, "time": time.time()}) + "\n")
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+
+
+def read_journal(path):
+    """Return collection of all the entries recorded in `path` journal.
+
+    Line left incomplete by an interrupted run is ignored.
+
+    :param path: journal file path
+    :type path: :class:`pathlib.Path`
+    :var entries: collection of journal entries
+    :type entries: list
+    :var line: currently processed journal line
+    :type line: str
+    :return: list
+    """
+    entries = []
+    if not os.path.exists(path):
+        return entries
+
+    with open(path, "r") as journal_file:
+        for line in journal_file:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+    return entries
+
+
+def reset_journal(path):
+    """Remove all the entries from `path` journal.
+
+    :param path: journal file path
+    :type path: :class:`pathlib.Path`
+    """
+    open(path, "w").close()
+
+
+def _current_box_content(client, app_id, address):
+    """Return hex encoded current content of `address` box or None if not fetched.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param address: governance seat address
+    :type address: str
+    :var response: fetch application box call's response
+    :type response: dict
+    :return: str
+    """
+    try:
+        response = client.application_box_by_name(
+            app_id, box_name_from_address(address)
+        )
+    except AlgodHTTPError:
+        return None
+
+    return binascii.a2b_base64(response.get("value")).hex()
+
+
+def confirmed_journal_writes(client, path, app_id):
+    """Return collection of addresses and box contents confirmed in `path` journal.
+
+    Writes planned by an interrupted run without confirmation are verified
+    against current boxes contents, so they are found no matter how long ago
+    they were confirmed. Their confirmation is journaled if all the group's
+    boxes hold planned contents, while the other ones are left out to be
+    written again.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param path: journal file path
+    :type path: :class:`pathlib.Path`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :var confirmed: collection of addresses and related hex encoded box contents
+    :type confirmed: dict
+    :var pending: collection of planned transaction IDs and related box contents
+    :type pending: dict
+    :var entry: currently processed journal entry
+    :type entry: dict
+    :var txid: currently processed planned transaction ID
+    :type txid: str
+    :var contents: currently processed transaction's box contents
+    :type contents: dict
+    :return: dict
+    """
+    confirmed, pending = {}, {}
+    for entry in read_journal(path):
+        if entry.get("app_id") != app_id:
+            continue
+
+        if entry.get("event") == "planned":
+            pending[entry.get("txid")] = entry.get("contents", {})
+
+        elif entry.get("event") == "confirmed":
+            pending.pop(entry.get("txid"), None)
+            confirmed.update(entry.get("contents", {}))
+
+    for txid, contents in pending.items():
+        if all(
+            confirmed.get(address) == content for address, content in contents.items()
+        ):
+            continue
+
+        if all(
+            _current_box_content(client, app_id, address) == content
+            for address, content in contents.items()
+        ):
+            append_journal_entry(
+                path,
+                {
+                    "event": "confirmed",
+                    "app_id": app_id,
+                    "txid": txid,
+                    "contents": contents,
+                },
+            )
+            confirmed.update(contents)
+
+    return confirmed
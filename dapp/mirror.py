@@ -0,0 +1,663 @@
+"""Module with functions for local SQLite mirror of Permission dApp boxes."""
+
+import base64
+import binascii
+import json
+import sqlite3
+from collections import defaultdict
+from datetime import UTC, datetime
+from pathlib import Path
+
+from algosdk.encoding import decode_address, encode_address
+
+from configuration import (
+    BOXES_FETCHING_WORKERS,
+    MIRROR_DATABASE,
+    MIRROR_MAX_SYNC_GAP,
+    SUBSCRIPTION_PERIOD_EXTENSION,
+    SUBSCRIPTION_PERMISSIONS,
+    SUBSCRIPTIONS_RUN_INTERVAL,
+)
+from helpers import (
+    application_transaction,
+    deserialize_values_data,
+    parse_subtopia_boxes,
+)
+from network import (
+    application_box_names,
+    fetch_subscription_ends,
+    permission_dapp_box_responses,
+)
+
+
+# # DATABASE
+def mirror_connection(network="testnet", path=None):
+    """Return connection to Permission dApp boxes mirror database for `network`.
+
+    Database tables are created if they don't exist.
+
+    :param network: network the mirrored Permission dApp is deployed to
+    :type network: str
+    :param path: database file path, ":memory:" for in-memory database
+    :type path: str
+    :var connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :return: :class:`sqlite3.Connection`
+    """
+    if path is None:
+        path = Path(__file__).resolve().parent / MIRROR_DATABASE.format(network=network)
+
+    connection = sqlite3.connect(path)
+    connection.executescript("""
+        CREATE TABLE IF NOT EXISTS boxes (
+            name BLOB PRIMARY KEY,
+            address TEXT NOT NULL,
+            value BLOB NOT NULL,
+            data TEXT NOT NULL,
+            round INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS state (
+            key TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS subscriptions (
+            app_id INTEGER NOT NULL,
+            address TEXT NOT NULL,
+            subscription_end INTEGER NOT NULL,
+            PRIMARY KEY (app_id, address)
+        );
+        CREATE INDEX IF NOT EXISTS subscriptions_expiry
+            ON subscriptions (app_id, subscription_end);
+        """)
+    return connection
+
+
+def mirror_state(connection, key, default=None):
+    """Return integer state value stored under `key` in mirror database.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param key: state key
+    :type key: str
+    :param default: value returned when `key` isn't stored
+    :type default: int
+    :var row: fetched database row
+    :type row: tuple
+    :return: int
+    """
+    row = connection.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+def set_mirror_state(connection, key, value):
+    """Store integer state `value` under `key` in mirror database.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param key: state key
+    :type key: str
+    :param value: state value
+    :type value: int
+    """
+    connection.execute(
+        "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value)
+    )
+
+
+# # READ
+def mirrored_box_values(connection):
+    """Return collection of mirrored box names and related raw box values.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :return: dict
+    """
+    return dict(connection.execute("SELECT name, value FROM boxes"))
+
+
+def mirrored_box_contents(connection):
+    """Return collection of mirrored addresses and related raw box values.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :return: dict
+    """
+    return dict(connection.execute("SELECT address, value FROM boxes"))
+
+
+def mirrored_permission_values(connection, address=None):
+    """Return collection of mirrored addresses and related deserialized values.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param address: return values only for this address if provided
+    :type address: str
+    :var rows: fetched database rows
+    :type rows: :class:`sqlite3.Cursor`
+    :return: dict
+    """
+    if address is None:
+        rows = connection.execute("SELECT address, data FROM boxes")
+    else:
+        rows = connection.execute(
+            "SELECT address, data FROM boxes WHERE address = ?", (address,)
+        )
+    return {address: json.loads(data) for address, data in rows}
+
+
+# # WRITE
+def _mirror_row(box_name, response):
+    """Return mirror database row created from box `response`.
+
+    :param box_name: box name
+    :type box_name: bytes
+    :param response: fetch application box call's response
+    :type response: dict
+    :var value: raw box value
+    :type value: bytes
+    :return: tuple
+    """
+    value = base64.b64decode(response.get("value"))
+    return (
+        box_name,
+        encode_address(box_name),
+        value,
+        json.dumps(deserialize_values_data(value)),
+        response.get("round", 0),
+    )
+
+
+def update_mirror_boxes(connection, responses):
+    """Update mirror with provided box `responses` and return number of changes.
+
+    Only the rows with changed raw box value are rewritten, while the boxes
+    with None response are removed from mirror.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param responses: collection of box names and related Node's responses
+    :type responses: dict
+    :var current: collection of mirrored box names and related raw values
+    :type current: dict
+    :var changed: collection of database rows to write
+    :type changed: list
+    :var deleted: collection of mirrored box names to remove
+    :type deleted: list
+    :return: two-tuple
+    """
+    current = mirrored_box_values(connection)
+    changed = [
+        _mirror_row(box_name, response)
+        for box_name, response in responses.items()
+        if response and current.get(box_name) != base64.b64decode(response.get("value"))
+    ]
+    deleted = [
+        (box_name,)
+        for box_name, response in responses.items()
+        if not response and box_name in current
+    ]
+    with connection:
+        connection.executemany(
+            "INSERT OR REPLACE INTO boxes (name, address, value, data, round) "
+            "VALUES (?, ?, ?, ?, ?)",
+            changed,
+        )
+        connection.executemany("DELETE FROM boxes WHERE name = ?", deleted)
+
+    return len(changed), len(deleted)
+
+
+def refresh_mirror(connection, client, app_id, workers=BOXES_FETCHING_WORKERS):
+    """Fetch all Permission dApp boxes and update mirror with changed ones.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var last_round: Node's last round before boxes are fetched
+    :type last_round: int
+    :var responses: collection of box names and related Node's responses
+    :type responses: dict
+    :var changes: number of rewritten and removed mirror rows
+    :type changes: tuple
+    :return: two-tuple
+    """
+    if app_id is None:
+        raise ValueError("Permission dApp ID isn't set!")
+
+    last_round = client.status().get("last-round")
+    responses = permission_dapp_box_responses(
+        client, app_id, application_box_names(client, app_id), workers=workers
+    )
+    responses.update(
+        {
+            box_name: None
+            for box_name in mirrored_box_values(connection)
+            if box_name not in responses
+        }
+    )
+    changes = update_mirror_boxes(connection, responses)
+    with connection:
+        set_mirror_state(connection, "synced_round", last_round)
+
+    return changes
+
+
+# # SYNC
+def _box_names_from_transaction(transaction, app_id):
+    """Return names of `app_id` boxes referenced by application call `transaction`.
+
+    Box references are used if Indexer provides them, otherwise the box name
+    is decoded from the first ABI argument of `write_box`/`delete_box` call.
+
+    :param transaction: Indexer's application call transaction instance
+    :type transaction: dict
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :var application_transaction: application call's specific fields
+    :type application_transaction: dict
+    :var references: collection of transaction's box references
+    :type references: list
+    :var arguments: collection of base64 encoded application call arguments
+    :type arguments: list
+    :var argument: decoded ABI encoded box name argument
+    :type argument: bytes
+    :return: set
+    """
+    application_transaction = transaction.get("application-transaction", {})
+    if application_transaction.get("application-id") != app_id:
+        return set()
+
+    references = application_transaction.get("box-references")
+    if references:
+        return {
+            base64.b64decode(reference.get("name"))
+            for reference in references
+            if reference.get("app", 0) in (0, app_id) and reference.get("name")
+        }
+
+    arguments = application_transaction.get("application-args", [])
+    if len(arguments) > 1:
+        argument = base64.b64decode(arguments[1])
+        if len(argument) == 34 and int.from_bytes(argument[:2], "big") == 32:
+            return {argument[2:]}
+
+    return set()
+
+
+def touched_box_names(indexer_client, app_id, min_round, senders=False):
+    """Return names of `app_id` boxes referenced by app calls since `min_round`.
+
+    If `senders` is True then the boxes named after app calls' senders
+    are returned too.
+
+    :param indexer_client: Algorand Indexer client instance
+    :type indexer_client: :class:`IndexerClient`
+    :param app_id: application identifier
+    :type app_id: int
+    :param min_round: starting round to search transactions from
+    :type min_round: int
+    :param senders: include boxes named after app calls' senders
+    :type senders: bool
+    :var params: collection of arguments provided to Indexer method
+    :type params: dict
+    :var names: collection of touched box names
+    :type names: set
+    :var transaction: currently processed application transaction instance
+    :type transaction: dict
+    :return: set
+    """
+    params = {
+        "application_id": app_id,
+        "txn_type": "appl",
+        "limit": 1000,
+        "min_round": min_round,
+    }
+    names = set()
+    for transaction in application_transaction(params, indexer_client):
+        names |= _box_names_from_transaction(transaction, app_id)
+        if senders and transaction.get("sender"):
+            names.add(decode_address(transaction.get("sender")))
+
+    return names
+
+
+def sync_mirror(
+    connection,
+    client,
+    indexer_client,
+    app_id,
+    max_gap=MIRROR_MAX_SYNC_GAP,
+    workers=BOXES_FETCHING_WORKERS,
+):
+    """Update mirror with boxes touched by Permission dApp calls since last sync.
+
+    Full refresh is run instead if mirror has never been synced or if
+    the number of rounds since the last sync is greater than `max_gap`.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param indexer_client: Algorand Indexer client instance
+    :type indexer_client: :class:`IndexerClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param max_gap: maximum number of rounds for incremental sync
+    :type max_gap: int
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var synced_round: last round mirror was synced at
+    :type synced_round: int
+    :var indexer_round: last round processed by Indexer
+    :type indexer_round: int
+    :var box_names: collection of boxes touched since last sync
+    :type box_names: list
+    :var changes: number of rewritten and removed mirror rows
+    :type changes: tuple
+    :return: two-tuple
+    """
+    synced_round = mirror_state(connection, "synced_round")
+    indexer_round = indexer_client.health().get("round")
+    if synced_round is None or indexer_round - synced_round > max_gap:
+        return refresh_mirror(connection, client, app_id, workers=workers)
+
+    box_names = list(touched_box_names(indexer_client, app_id, synced_round + 1))
+    changes = update_mirror_boxes(
+        connection,
+        permission_dapp_box_responses(client, app_id, box_names, workers=workers),
+    )
+    with connection:
+        set_mirror_state(connection, "synced_round", indexer_round)
+
+    return changes
+
+
+# # SUBSCRIPTIONS
+def _subscriptions_horizon(interval):
+    """Return timestamp of the last subscription end due for fetching.
+
+    Subscription ending up to the returned timestamp becomes inactive before
+    the next run in `interval` seconds.
+
+    :param interval: number of seconds until the next scheduled run
+    :type interval: int
+    :return: int
+    """
+    return int(datetime.now(UTC).timestamp() + interval - SUBSCRIPTION_PERIOD_EXTENSION)
+
+
+def _due_subscription_addresses(connection, app_id, since, horizon):
+    """Return `app_id` subscription addresses expiring after `since` up to `horizon`.
+
+    Lifetime subscriptions with zero subscription end are never due, while
+    the ones expiring up to `since` are left out by incremental sync as they
+    have already been fetched and their renewals are caught from app calls.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param app_id: subscription tier app
+    :type app_id: int
+    :param since: horizon timestamp of the previous run
+    :type since: int
+    :param horizon: timestamp after which subscriptions aren't due
+    :type horizon: int
+    :return: set
+    """
+    return {
+        address
+        for (address,) in connection.execute(
+            "SELECT address FROM subscriptions WHERE app_id = ? "
+            "AND subscription_end > ? AND subscription_end <= ?",
+            (app_id, max(since, 0), horizon),
+        )
+    }
+
+
+def sync_subscriptions_index(
+    connection,
+    client,
+    interval=SUBSCRIPTIONS_RUN_INTERVAL,
+    workers=BOXES_FETCHING_WORKERS,
+):
+    """Update subscriptions expiry index and return number of fetched boxes.
+
+    Only the boxes that are new in tier app's box names listing and the ones
+    with subscription expired or expiring before the next run in `interval`
+    seconds are fetched, so lapsed and then renewed subscriptions are indexed
+    again, while the subscriptions without related box are removed. The
+    horizon is stored as the lower bound of incremental sync's due expiries.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param interval: number of seconds until the next scheduled run
+    :type interval: int
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var horizon: timestamp of the last subscription end due for fetching
+    :type horizon: int
+    :var fetched: total number of fetched boxes
+    :type fetched: int
+    :var app_id: currently processed subscription tier app
+    :type app_id: int
+    :var box_names: collection of tier app's addresses and related box names
+    :type box_names: dict
+    :var indexed: collection of tier app's indexed addresses
+    :type indexed: set
+    :var due: collection of addresses with expiring subscription
+    :type due: set
+    :var ends: collection of fetched box names and related subscription ends
+    :type ends: dict
+    :return: int
+    """
+    horizon = _subscriptions_horizon(interval)
+    fetched = 0
+    for app_id in SUBSCRIPTION_PERMISSIONS:
+        box_names = {
+            encode_address(box_name): box_name
+            for box_name in application_box_names(client, app_id)
+        }
+        indexed = {
+            address
+            for (address,) in connection.execute(
+                "SELECT address FROM subscriptions WHERE app_id = ?", (app_id,)
+            )
+        }
+        due = _due_subscription_addresses(connection, app_id, 0, horizon)
+        ends = fetch_subscription_ends(
+            client,
+            app_id,
+            [
+                box_name
+                for address, box_name in box_names.items()
+                if address not in indexed or address in due
+            ],
+            workers=workers,
+        )
+        with connection:
+            connection.executemany(
+                "DELETE FROM subscriptions WHERE app_id = ? AND address = ?",
+                [(app_id, address) for address in indexed if address not in box_names],
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO subscriptions "
+                "(app_id, address, subscription_end) VALUES (?, ?, ?)",
+                [
+                    (app_id, encode_address(box_name), end)
+                    for box_name, end in ends.items()
+                ],
+            )
+
+        fetched += len(ends)
+
+    with connection:
+        set_mirror_state(connection, "subscriptions_horizon", horizon)
+
+    return fetched
+
+
+def update_subscriptions_index(connection, client, app_id, box_names, workers=1):
+    """Refetch `box_names` of `app_id` tier and return number of fetched boxes.
+
+    Subscriptions without related box are removed from the expiry index.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: subscription tier app
+    :type app_id: int
+    :param box_names: collection of tier app's box names to refetch
+    :type box_names: iterable
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var responses: collection of box names and related Node's responses
+    :type responses: dict
+    :var found: collection of existing box names
+    :type found: list
+    :var subscriptions: collection of existing boxes' subscription records
+    :type subscriptions: list
+    :return: int
+    """
+    responses = permission_dapp_box_responses(
+        client, app_id, box_names, workers=workers
+    )
+    found = [box_name for box_name, response in responses.items() if response]
+    subscriptions = parse_subtopia_boxes(
+        binascii.a2b_base64(responses[box_name].get("value")) for box_name in found
+    )
+    with connection:
+        connection.executemany(
+            "DELETE FROM subscriptions WHERE app_id = ? AND address = ?",
+            [
+                (app_id, encode_address(box_name))
+                for box_name, response in responses.items()
+                if not response
+            ],
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO subscriptions "
+            "(app_id, address, subscription_end) VALUES (?, ?, ?)",
+            [
+                (app_id, encode_address(box_name), subscription.end)
+                for box_name, subscription in zip(found, subscriptions)
+            ],
+        )
+
+    return len(responses)
+
+
+def sync_subscriptions(
+    connection,
+    client,
+    indexer_client,
+    interval=SUBSCRIPTIONS_RUN_INTERVAL,
+    max_gap=MIRROR_MAX_SYNC_GAP,
+    workers=BOXES_FETCHING_WORKERS,
+):
+    """Update subscriptions expiry index from tier app calls since last sync.
+
+    Only the boxes referenced by or named after senders of tier apps' calls
+    and the ones with subscription newly expiring after the previous run's
+    horizon and before the next run are refetched. Full listing based sync is
+    run instead if subscriptions have never been synced or if the number of
+    rounds since the last sync is greater than `max_gap`, which rechecks all
+    the expired subscriptions as their renewal calls aren't processed.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param indexer_client: Algorand Indexer client instance
+    :type indexer_client: :class:`IndexerClient`
+    :param interval: number of seconds until the next scheduled run
+    :type interval: int
+    :param max_gap: maximum number of rounds for incremental sync
+    :type max_gap: int
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var synced_round: last round subscriptions were synced at
+    :type synced_round: int
+    :var indexer_round: last round processed by Indexer
+    :type indexer_round: int
+    :var fetched: total number of fetched boxes
+    :type fetched: int
+    :var since: horizon timestamp of the previous run
+    :type since: int
+    :var horizon: timestamp of the last subscription end due for fetching
+    :type horizon: int
+    :var app_id: currently processed subscription tier app
+    :type app_id: int
+    :var box_names: collection of tier app's box names to refetch
+    :type box_names: set
+    :return: int
+    """
+    synced_round = mirror_state(connection, "subscriptions_synced_round")
+    indexer_round = indexer_client.health().get("round")
+    if synced_round is None or indexer_round - synced_round > max_gap:
+        fetched = sync_subscriptions_index(
+            connection, client, interval=interval, workers=workers
+        )
+
+    else:
+        since = mirror_state(connection, "subscriptions_horizon", 0)
+        horizon = _subscriptions_horizon(interval)
+        fetched = 0
+        for app_id in SUBSCRIPTION_PERMISSIONS:
+            box_names = touched_box_names(
+                indexer_client, app_id, synced_round + 1, senders=True
+            ) | {
+                decode_address(address)
+                for address in _due_subscription_addresses(
+                    connection, app_id, since, horizon
+                )
+            }
+            fetched += update_subscriptions_index(
+                connection, client, app_id, box_names, workers=workers
+            )
+
+        with connection:
+            set_mirror_state(connection, "subscriptions_horizon", horizon)
+
+    with connection:
+        set_mirror_state(connection, "subscriptions_synced_round", indexer_round)
+
+    return fetched
+
+
+def indexed_subscriptions(connection):
+    """Return collection of subscribed addresses with values from expiry index.
+
+    :param connection: SQLite database connection
+    :type connection: :class:`sqlite3.Connection`
+    :var threshold: timestamp subscription end has to be greater than
+    :type threshold: float
+    :var subscriptions: Subtopia subscribers addresses and related tiers' values
+    :type subscriptions: dict
+    :var app_id: currently processed subscription tier app
+    :type app_id: int
+    :var amount: currently processed app's subscription amount
+    :type amount: int
+    :var permission: currently processed subscription app's permission
+    :type permission: int
+    :var address: currently processed subscriber address
+    :type address: str
+    :return: dict
+    """
+    threshold = datetime.now(UTC).timestamp() - SUBSCRIPTION_PERIOD_EXTENSION
+    subscriptions = defaultdict(list)
+    for app_id, (amount, permission, _) in SUBSCRIPTION_PERMISSIONS.items():
+        for (address,) in connection.execute(
+            "SELECT address FROM subscriptions WHERE app_id = ? "
+            "AND (subscription_end = 0 OR subscription_end > ?) ORDER BY address",
+            (app_id, threshold),
+        ):
+            subscriptions[address].append((amount, permission))
+
+    return subscriptions
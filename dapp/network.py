@@ -1,135 +1,320 @@
 """Module with functions for retrieving and saving blockchain data."""
 
 import base64
+import binascii
+import struct
+import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import partial
 
 from algosdk import transaction
 from algosdk.account import address_from_private_key
 from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.constants import MIN_TXN_FEE, TX_GROUP_LIMIT
 from algosdk.encoding import encode_address
 from algosdk.error import AlgodHTTPError
 
+from cache import (
+    not_subscribed_cache,
+    permission_values_cache,
+    suggested_params_cache,
+)
 from configuration import (
+    APP_CALL_ARGS_MAX_SIZE,
+    BOXES_DELETING_GROUP_SIZE,
+    BOXES_FETCHING_WORKERS,
+    BOXES_PAGE_LIMIT,
+    BOXES_PER_WRITE_CALL,
+    BOXES_WRITING_GROUP_SIZE,
     CURRENT_STAKING_POSITION,
     DOCS_STARTING_POSITION,
+    MERGED_ACCOUNTS,
     STAKING_APP_ID,
     SUBSCRIPTION_PERIOD_EXTENSION,
     SUBSCRIPTION_PERMISSIONS,
     SUBSCRIPTION_POSITION,
+    SUGGESTED_PARAMS_ERRORS,
+    WRITE_BOXES_METHOD,
 )
 from helpers import (
     app_schemas,
     box_name_from_address,
     calculate_votes_and_permission,
+    deserialize_box_value,
     deserialize_values_data,
+    parse_cometa_staking_amount,
+    parse_subtopia_box,
+    parse_subtopia_boxes,
     permission_for_amount,
-    serialize_values,
+    serialize_box_values,
+    serialize_raw_values,
+    values_data_version,
     wait_for_confirmation,
 )
+from journal import append_journal_entry, confirmed_journal_writes
+from pipeline import submit_pipelined
+
+
+# # BOXES
+def application_box_names(client, app_id, limit=BOXES_PAGE_LIMIT):
+    """Yield names of all boxes owned by `app_id`, fetching them page by page.
+
+    Node's continuation token is followed until the listing is exhausted,
+    so large applications aren't truncated and the names are processed
+    as soon as their page arrives.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: application identifier
+    :type app_id: int
+    :param limit: maximum number of box names per page
+    :type limit: int
+    :var params: collection of query parameters for currently fetched page
+    :type params: dict
+    :var page: currently processed page of box names
+    :type page: dict
+    :var box: currently processed box instance
+    :type box: dict
+    :yield: bytes
+    """
+    params = {"max": limit}
+    while True:
+        page = client.algod_request(
+            "GET", f"/applications/{app_id}/boxes", params=params
+        )
+        for box in page.get("boxes", []):
+            yield base64.b64decode(box.get("name"))
+
+        if not page.get("next-token"):
+            break
+
+        params = {"max": limit, "next": page.get("next-token")}
 
 
 # # SUBCRIPTIONS
-def fetch_subscriptions_for_address(client, address):
-    """Return collection of all subscriptions for provided `address`.
+def is_active_subscription(subscription_end):
+    """Return True if subscription ending at `subscription_end` is still active.
+
+    Subscriptions are extended for `SUBSCRIPTION_PERIOD_EXTENSION` seconds after
+    their expiration, while zero value denotes a lifetime subscription.
+
+    :param subscription_end: timestamp when subscription expires
+    :type subscription_end: int
+    :return: Boolean
+    """
+    return (
+        subscription_end > datetime.now(UTC).timestamp() - SUBSCRIPTION_PERIOD_EXTENSION
+        or subscription_end == 0
+    )
+
+
+def box_subscription_end(value):
+    """Return subscription's end timestamp from Subtopia's box `value`.
 
     Box value contains the following uints:
     (tier_asset_id, 2, subscription_start, subscription_end, subscription_duration)
 
+    :param value: base64 encoded Subtopia box value
+    :type value: str
+    :return: int
+    """
+    return parse_subtopia_box(binascii.a2b_base64(value)).end
+
+
+def _subscription_end_for_box(client, app_id, address, cached=False):
+    """Return subscription's end timestamp or None if `address` isn't subscribed.
+
+    If `cached` is set then not found boxes are stored to and served from
+    the not subscribed addresses cache.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: subscription tier app
+    :type app_id: int
+    :param address: user's address
+    :type address: str
+    :param cached: use not subscribed addresses cache
+    :type cached: bool
+    :var response: user's box response instance
+    :type response: dict
+    :var not_found: box not found flag
+    :type not_found: bool
+    :return: int
+    """
+    if cached and not_subscribed_cache.get(app_id, address):
+        return None
+
+    try:
+        response = client.application_box_by_name(
+            app_id, box_name_from_address(address)
+        )
+    except AlgodHTTPError as exception:
+        response, not_found = None, "box not found" in exception.args
+    else:
+        not_found = not response
+
+    if response:
+        return box_subscription_end(response.get("value"))
+
+    if cached and not_found:
+        not_subscribed_cache.set(app_id, address)
+
+    return None
+
+
+def fetch_subscriptions_for_address(client, address, cached=False):
+    """Return collection of all subscriptions for provided `address`.
+
+    Subscription tier apps are looked up concurrently.
+
     :param client: Algorand Node client instance
     :type client: :class:`AlgodClient`
     :param address: currently processed box's user address
     :type address: str
-    :var subscriptions: collection of tier names and related expiration timestamps
-    :type subscriptions: dict
-    :var app_id: currently processed subscription tier app
+    :param cached: use not subscribed addresses cache
+    :type cached: bool
+    :var executor: thread pool executor instance
+    :type executor: :class:`ThreadPoolExecutor`
+    :var ends: subscription end timestamps in `SUBSCRIPTION_PERMISSIONS` order
+    :type ends: list
+    :return: dict
+    """
+    with ThreadPoolExecutor(max_workers=len(SUBSCRIPTION_PERMISSIONS)) as executor:
+        ends = list(
+            executor.map(
+                lambda app_id: _subscription_end_for_box(
+                    client, app_id, address, cached=cached
+                ),
+                SUBSCRIPTION_PERMISSIONS,
+            )
+        )
+
+    return defaultdict(
+        int,
+        {
+            tier_name: subscription_end
+            for (_, _, tier_name), subscription_end in zip(
+                SUBSCRIPTION_PERMISSIONS.values(), ends
+            )
+            if subscription_end is not None
+        },
+    )
+
+
+def _active_tier_subscribers(client, app_id, workers=1):
+    """Return collection of addresses with active subscription to `app_id` tier.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: subscription tier app
     :type app_id: int
-    :var tier_name: subscription tier name
-    :type tier_name: str
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var ends: collection of tier app's box names and related subscription ends
+    :type ends: dict
     :var box_name: currently processed box's name
     :type box_name: bytes
-    :var response: user's box response instance
-    :type response: dict
-    :var hexed: user box value's hexadecimal string representation
-    :type hexed: str
-    :var start: starting position of subscription's end value
-    :type start: int
-    :var subscription_end: timestamp when subscription expires
-    :type subscription_end: int
-    :return: dict
+    :var end: currently processed subscription's end timestamp
+    :type end: int
+    :return: list
     """
-    subscriptions = defaultdict(int)
-    for app_id, (_, _, tier_name) in SUBSCRIPTION_PERMISSIONS.items():
-        box_name = box_name_from_address(address)
-        try:
-            response = client.application_box_by_name(app_id, box_name)
-        except AlgodHTTPError:
-            continue
+    ends = fetch_subscription_ends(
+        client, app_id, application_box_names(client, app_id), workers=workers
+    )
+    return [
+        encode_address(box_name)
+        for box_name, end in ends.items()
+        if is_active_subscription(end)
+    ]
 
-        if response:
-            hexed = base64.b64decode(response.get("value")).hex()
-            start = 48
-            subscription_end = int(hexed[start : start + 16], 16)
-            subscriptions[tier_name] = subscription_end
 
-    return subscriptions
+def fetch_subscription_ends(client, app_id, box_names, workers=1):
+    """Return collection of `app_id` tier's box names and related subscription ends.
+
+    Boxes are fetched concurrently and their values are parsed in bulk.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: subscription tier app
+    :type app_id: int
+    :param box_names: collection of tier app's box names to fetch
+    :type box_names: list
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var executor: thread pool executor instance
+    :type executor: :class:`ThreadPoolExecutor`
+    :var raws: collection of fetched raw Subtopia box values
+    :type raws: list
+    :var subscription: currently processed Subtopia subscription record
+    :type subscription: :class:`SubtopiaSubscription`
+    :return: dict
+    """
+    box_names = list(box_names)
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        raws = list(
+            executor.map(
+                lambda box_name: binascii.a2b_base64(
+                    client.application_box_by_name(app_id, box_name).get("value")
+                ),
+                box_names,
+            )
+        )
+
+    return {
+        box_name: subscription.end
+        for box_name, subscription in zip(box_names, parse_subtopia_boxes(raws))
+    }
 
 
-def fetch_subscriptions_from_boxes(client):
+def fetch_subscriptions_from_boxes(client, workers=1):
     """Return collection of all subscribed addresses with related subscription values.
 
-    Box value contains the following uints:
-    (tier_asset_id, 2, subscription_start, subscription_end, subscription_duration)
+    Subscription tier apps are scanned concurrently and every tier's boxes are
+    fetched by up to `workers` concurrent threads.
 
     :param client: Algorand Node client instance
     :type client: :class:`AlgodClient`
+    :param workers: maximum number of concurrent box fetching threads per tier
+    :type workers: int
+    :var tiers: collection of subscription tier apps and related values
+    :type tiers: list
+    :var executor: thread pool executor instance
+    :type executor: :class:`ThreadPoolExecutor`
+    :var subscribers: collection of tiers' active subscribers addresses
+    :type subscribers: list
     :var subscriptions: Subtopia subscribers addresses and related tiers' values
     :type subscriptions: dict
-    :var app_id: currently processed subscription tier app
-    :type app_id: int
     :var amount: currently processed app's subscription amount
     :type amount: int
     :var permission: currently processed subscription app's permission
     :type permission: int
-    :var boxes: collection of currently processed app's boxes fetched from Node
-    :type boxes: dict
-    :var box_name: currently processed box's name
-    :type box_name: bytes
-    :var address: currently processed box's user address
+    :var addresses: currently processed tier's active subscribers addresses
+    :type addresses: list
+    :var address: currently processed subscriber address
     :type address: str
-    :var response: user's box response instance
-    :type response: dict
-    :var hexed: user box value's hexadecimal string representation
-    :type hexed: str
-    :var start: starting position of subscription's end value
-    :type start: int
-    :var subscription_end: timestamp when subscription expires
-    :type subscription_end: int
     :return: dict
     """
+    tiers = list(SUBSCRIPTION_PERMISSIONS.items())
+    with ThreadPoolExecutor(max_workers=min(max(workers, 1), len(tiers))) as executor:
+        subscribers = list(
+            executor.map(
+                lambda tier: _active_tier_subscribers(client, tier[0], workers=workers),
+                tiers,
+            )
+        )
+
     subscriptions = defaultdict(list)
-    for app_id, (amount, permission, _) in SUBSCRIPTION_PERMISSIONS.items():
-        boxes = client.application_boxes(app_id)
-        for box in boxes.get("boxes", []):
-            box_name = base64.b64decode(box.get("name"))
-            address = encode_address(box_name)
-            response = client.application_box_by_name(app_id, box_name)
-            hexed = base64.b64decode(response.get("value")).hex()
-            assert len(hexed) == 80, hexed
-            start = 48
-            subscription_end = int(hexed[start : start + 16], 16)
-            if (
-                subscription_end
-                > datetime.now(UTC).timestamp() - SUBSCRIPTION_PERIOD_EXTENSION
-                or subscription_end == 0
-            ):
-                subscriptions[address].append((amount, permission))
+    for (_, (amount, permission, _)), addresses in zip(tiers, subscribers):
+        for address in addresses:
+            subscriptions[address].append((amount, permission))
 
     return subscriptions
 
 
 # #  STAKING
-def _cometa_app_amount(key, state):
+def cometa_app_amount(key, state):
     """Return amount behind provided key for provided Cometa app.
 
     :param key: app key to look for
@@ -140,7 +325,9 @@ def _cometa_app_amount(key, state):
     """
     try:
         return next(
-            int(base64.b64decode(row.get("value", {}).get("bytes")).hex()[2:18], 16)
+            parse_cometa_staking_amount(
+                binascii.a2b_base64(row.get("value", {}).get("bytes"))
+            )
             for row in state.get("key-value")
             if row.get("key") == key and len(row.get("value", {}).get("bytes")) >= 16
         )
@@ -148,6 +335,23 @@ def _cometa_app_amount(key, state):
         return 0
 
 
+def cometa_app_local_state(account_info):
+    """Return Cometa's ASASTATS staking dApp's local state from `account_info`.
+
+    :param account_info: account's information object
+    :type account_info: dict
+    :return: dict
+    """
+    return next(
+        (
+            state
+            for state in account_info.get("apps-local-state", [])
+            if state.get("id") == STAKING_APP_ID
+        ),
+        None,
+    )
+
+
 def _cometa_app_local_state_for_address(client, address):
     """Return Cometa's ASASTATS staking dApp's local state instance from account info.
 
@@ -164,14 +368,7 @@ def _cometa_app_local_state_for_address(client, address):
     except AlgodHTTPError:
         return None
 
-    return next(
-        (
-            state
-            for state in account_info.get("apps-local-state", [])
-            if state.get("id") == STAKING_APP_ID
-        ),
-        None,
-    )
+    return cometa_app_local_state(account_info)
 
 
 def current_governance_staking_for_address(client, address, staking_key=None):
@@ -193,27 +390,92 @@ def current_governance_staking_for_address(client, address, staking_key=None):
         return 0
 
     state = _cometa_app_local_state_for_address(client, address)
-    return _cometa_app_amount(staking_key, state) if state else 0
+    return cometa_app_amount(staking_key, state) if state else 0
 
 
 # # UPDATE
-def check_and_update_changed_subscriptions_and_staking(
-    client, app_id, writing_parameters, permissions, subscriptions, stakings
-):
-    """Check and update boxes for address with changed subscriptions and staking.
+def _box_content(value):
+    """Return box content bytes written for serialized `value`.
+
+    :param value: version 2 raw or version 1 base64 encoded values data
+    :type value: bytes or str
+    :return: bytes
+    """
+    return value if isinstance(value, bytes) else value.encode()
+
+
+def _print_skipped_writes(skipped):
+    """Print number of skipped box writes and related saved transaction fees.
+
+    :param skipped: number of skipped box writes
+    :type skipped: int
+    """
+    if skipped:
+        print(
+            f"Skipped {skipped} unchanged box writes "
+            f"saving up to {skipped * MIN_TXN_FEE} microAlgos in fees"
+        )
+
+
+def is_unchanged_box(content, value):
+    """Return True if box `content` holds the same values as serialized `value`.
+
+    Values are compared deserialized, so version 1 box holding the same values
+    as version 2 raw `value` is unchanged too, while the content that can't be
+    deserialized is always changed.
+
+    :param content: current box content
+    :type content: bytes
+    :param value: version 2 raw or version 1 base64 encoded values data
+    :type value: bytes or str
+    :return: Boolean
+    """
+    if not content:
+        return False
+
+    if content == _box_content(value):
+        return True
+
+    try:
+        return deserialize_values_data(content) == deserialize_values_data(value)
+    except (ValueError, struct.error):
+        return False
+
+
+def changed_box_values(values, current):
+    """Return collection of `values` without the ones equal to `current` contents.
+
+    :param values: collection of addresses and related serialized values
+    :type values: dict
+    :param current: collection of addresses and related current box contents
+    :type current: dict
+    :var changed: collection of addresses and related changed serialized values
+    :type changed: dict
+    :return: dict
+    """
+    if current is None:
+        return values
+
+    changed = {
+        address: value
+        for address, value in values.items()
+        if not is_unchanged_box(current.get(address), value)
+    }
+    _print_skipped_writes(len(values) - len(changed))
+    return changed
+
+
+def changed_subscriptions_and_staking_values(permissions, subscriptions, stakings):
+    """Return collection of addresses with changed subscriptions and staking values.
 
-    :param client: Algorand Node client instance
-    :type client: :class:`AlgodClient`
-    :param app_id: currently processed subscription tier app
-    :type app_id: int
-    :param writing_parameters: instances sneeded for writing boxes to blockchain
-    :type writing_parameters: dict
     :param permissions: collection of addresses and related votes and permission values
     :type permissions: dict
     :param subscriptions: Subtopia subscribers addresses and related tiers' values
     :type subscriptions: dict
     :param stakings: collection  of all governance staking addresses and related amounts
     :type stakings: dict
+    :var changed: collection of addresses and related updated values
+    :type changed: dict
     :var address: currently processed address
     :type address: str
     :var values: currently processed address' values collection
@@ -226,8 +488,11 @@ def check_and_update_changed_subscriptions_and_staking(
     :type subscription_values: list
     :var subscribed_amuunt: current subscribed amount for currently processed address
     :type subscribed_amuunt: int
+    :return: dict
     """
+    changed = {}
     for address, values in permissions.items():
+        values = list(values)
         update = False
         staking_amount = stakings.get(address)
         if (
@@ -255,148 +520,264 @@ def check_and_update_changed_subscriptions_and_staking(
 
         if update:
             values[0], values[1] = calculate_votes_and_permission(values)
-            write_box(
-                client, app_id, writing_parameters, address, serialize_values(values)
-            )
+            changed[address] = values
 
+    return changed
 
-def check_and_update_new_stakers(
-    client, app_id, writing_parameters, permissions, stakings
-):
-    """Check and update boxes for completely new staking addresses.
 
-    :param client: Algorand Node client instance
-    :type client: :class:`AlgodClient`
-    :param app_id: currently processed subscription tier app
-    :type app_id: int
-    :param writing_parameters: instances sneeded for writing boxes to blockchain
-    :type writing_parameters: dict
+def new_stakers_values(permissions, stakings):
+    """Return collection of completely new staking addresses and related values.
+
+    Stakers without any permission are left out.
+
     :param permissions: collection of addresses and related votes and permission values
     :type permissions: dict
     :param stakings: collection  of all governance staking addresses and related amounts
     :type stakings: dict
-    :var new_stakers: collection of new staking addresses with related values
-    :type new_stakers: dict
+    :var new_values: collection of new staking addresses and related values
+    :type new_values: dict
     :var address: currently processed staking address
     :type address: str
     :var amount: staking amount
     :type amount: int
     :var values: collection of votes and permissions
     :type values: list
+    :return: dict
     """
-    new_stakers = {
-        address: amount
-        for address, amount in stakings.items()
-        if amount and address not in permissions
-    }
-    for address, amount in new_stakers.items():
+    new_values = {}
+    for address, amount in stakings.items():
+        if not amount or address in permissions:
+            continue
+
         values = [0] * DOCS_STARTING_POSITION
         values[CURRENT_STAKING_POSITION] = amount
         values[CURRENT_STAKING_POSITION + 1] = permission_for_amount(amount)
         values[0], values[1] = calculate_votes_and_permission(values)
         if values[1]:
-            write_box(
-                client, app_id, writing_parameters, address, serialize_values(values)
-            )
+            new_values[address] = values
 
+    return new_values
 
-def check_and_update_new_subscribers(
-    client, app_id, writing_parameters, permissions, subscriptions
-):
-    """Check and update boxes for completely new subscriber addresses.
 
-    :param client: Algorand Node client instance
-    :type client: :class:`AlgodClient`
-    :param app_id: currently processed subscription tier app
-    :type app_id: int
-    :param writing_parameters: instances sneeded for writing boxes to blockchain
-    :type writing_parameters: dict
+def new_subscribers_values(permissions, subscriptions):
+    """Return collection of completely new subscriber addresses and related values.
+
     :param permissions: collection of addresses and related votes and permission values
     :type permissions: dict
     :param subscriptions: Subtopia subscribers addresses and related tiers' values
     :type subscriptions: dict
-    :var new_subscribers: collection of new subscribers with related values
-    :type new_subscribers: dict
-    :var address: currently processed staking address
+    :var new_values: collection of new subscriber addresses and related values
+    :type new_values: dict
+    :var address: currently processed subscriber address
     :type address: str
     :var subscription_values: collection of amount and permission pairs
     :type subscription_values: list
     :var values: collection of votes and permissions
     :type values: list
+    :return: dict
     """
-    new_subscribers = {
-        address: subscription_values
-        for address, subscription_values in subscriptions.items()
-        if address not in permissions
-    }
-    for address, subscription_values in new_subscribers.items():
+    new_values = {}
+    for address, subscription_values in subscriptions.items():
+        if address in permissions:
+            continue
+
         values = [0] * DOCS_STARTING_POSITION
         values[SUBSCRIPTION_POSITION] = sum(amount for amount, _ in subscription_values)
         values[SUBSCRIPTION_POSITION + 1] = sum(
             permission for _, permission in subscription_values
         )
         values[0], values[1] = calculate_votes_and_permission(values)
-        write_box(client, app_id, writing_parameters, address, serialize_values(values))
+        new_values[address] = values
 
+    return new_values
 
-# # PERMISSION DAPP
-def create_app(client, private_key, approval_program, clear_program, contract_json):
-    """Create a new smart contract application on the Algorand blockchain.
 
-    Builds and submits an ApplicationCreate transaction using compiled approval
-    and clear programs. Waits for confirmation and returns the resulting app-id
-    and genesis hash.
+def _write_changed_boxes(client, app_id, writing_parameters, values, current):
+    """Write all `values` to their boxes skipping the ones equal to `current`.
 
-    :param client: Algorand Node client instance.
+    Changed boxes are written in atomic groups by :func:`write_boxes`.
+
+    :param client: Algorand Node client instance
     :type client: :class:`AlgodClient`
-    :param private_key: Creator's private key used to sign the transaction.
-    :type private_key: str
-    :param approval_program: Compiled TEAL approval program.
-    :type approval_program: bytes
-    :param clear_program: Compiled TEAL clear program.
-    :type clear_program: bytes
-    :param contract_json: ARC-56 smart contract specification.
-    :type contract_json: dict
-    :return: A tuple containing the newly created application ID and genesis hash.
-    :rtype: tuple[int, str]
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param values: collection of addresses and related votes and permission values
+    :type values: dict
+    :param current: collection of addresses and related current box contents
+    :type current: dict
+    :var changed: collection of addresses and related changed serialized values
+    :type changed: dict
+    :var address: currently processed address
+    :type address: str
+    :var integers: currently processed address' values collection
+    :type integers: list
+    :return: int
     """
-    # define sender as creator
-    sender = address_from_private_key(private_key)
+    changed = changed_box_values(
+        {
+            address: serialize_box_values(integers)
+            for address, integers in values.items()
+        },
+        current,
+    )
+    if changed:
+        write_boxes(client, app_id, writing_parameters, changed)
 
-    # declare on_complete as NoOp
-    on_complete = transaction.OnComplete.NoOpOC.real
+    return len(values) - len(changed)
 
-    # get node suggested parameters
-    params = client.suggested_params()
-    # comment out the next two (2) lines to use suggested fees
-    params.flat_fee = True
-    params.fee = 1000
 
-    global_schema, local_schema = app_schemas(contract_json)
+def check_and_update_changed_subscriptions_and_staking(
+    client,
+    app_id,
+    writing_parameters,
+    permissions,
+    subscriptions,
+    stakings,
+    current=None,
+):
+    """Check and update boxes for address with changed subscriptions and staking.
 
-    # create unsigned transaction
-    txn = transaction.ApplicationCreateTxn(
-        sender,
-        params,
-        on_complete,
-        approval_program,
-        clear_program,
-        global_schema,
-        local_schema,
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: currently processed subscription tier app
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param permissions: collection of addresses and related votes and permission values
+    :type permissions: dict
+    :param subscriptions: Subtopia subscribers addresses and related tiers' values
+    :type subscriptions: dict
+    :param stakings: collection  of all governance staking addresses and related amounts
+    :type stakings: dict
+    :param current: collection of addresses and related current box contents
+    :type current: dict
+    :return: int
+    """
+    return _write_changed_boxes(
+        client,
+        app_id,
+        writing_parameters,
+        changed_subscriptions_and_staking_values(permissions, subscriptions, stakings),
+        current,
     )
 
-    # sign transaction
-    signed_txn = txn.sign(private_key)
-    tx_id = signed_txn.transaction.get_txid()
-
-    # send transaction
-    client.send_transactions([signed_txn])
 
-    # await confirmation
-    wait_for_confirmation(client, tx_id)
+def check_and_update_new_stakers(
+    client, app_id, writing_parameters, permissions, stakings, current=None
+):
+    """Check and update boxes for completely new staking addresses.
 
-    # display results
-    transaction_response = client.pending_transaction_info(tx_id)
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: currently processed subscription tier app
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param permissions: collection of addresses and related votes and permission values
+    :type permissions: dict
+    :param stakings: collection  of all governance staking addresses and related amounts
+    :type stakings: dict
+    :param current: collection of addresses and related current box contents
+    :type current: dict
+    :return: int
+    """
+    return _write_changed_boxes(
+        client,
+        app_id,
+        writing_parameters,
+        new_stakers_values(permissions, stakings),
+        current,
+    )
+
+
+def check_and_update_new_subscribers(
+    client, app_id, writing_parameters, permissions, subscriptions, current=None
+):
+    """Check and update boxes for completely new subscriber addresses.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: currently processed subscription tier app
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param permissions: collection of addresses and related votes and permission values
+    :type permissions: dict
+    :param subscriptions: Subtopia subscribers addresses and related tiers' values
+    :type subscriptions: dict
+    :param current: collection of addresses and related current box contents
+    :type current: dict
+    :return: int
+    """
+    return _write_changed_boxes(
+        client,
+        app_id,
+        writing_parameters,
+        new_subscribers_values(permissions, subscriptions),
+        current,
+    )
+
+
+# # PERMISSION DAPP
+def create_app(client, private_key, approval_program, clear_program, contract_json):
+    """Create a new smart contract application on the Algorand blockchain.
+
+    Builds and submits an ApplicationCreate transaction using compiled approval
+    and clear programs. Waits for confirmation and returns the resulting app-id
+    and genesis hash.
+
+    :param client: Algorand Node client instance.
+    :type client: :class:`AlgodClient`
+    :param private_key: Creator's private key used to sign the transaction.
+    :type private_key: str
+    :param approval_program: Compiled TEAL approval program.
+    :type approval_program: bytes
+    :param clear_program: Compiled TEAL clear program.
+    :type clear_program: bytes
+    :param contract_json: ARC-56 smart contract specification.
+    :type contract_json: dict
+    :return: A tuple containing the newly created application ID and genesis hash.
+    :rtype: tuple[int, str]
+    """
+    # define sender as creator
+    sender = address_from_private_key(private_key)
+
+    # declare on_complete as NoOp
+    on_complete = transaction.OnComplete.NoOpOC.real
+
+    # get node suggested parameters
+    params = suggested_params_cache.get(client)
+    # comment out the next two (2) lines to use suggested fees
+    params.flat_fee = True
+    params.fee = 1000
+
+    global_schema, local_schema = app_schemas(contract_json)
+
+    # create unsigned transaction
+    txn = transaction.ApplicationCreateTxn(
+        sender,
+        params,
+        on_complete,
+        approval_program,
+        clear_program,
+        global_schema,
+        local_schema,
+    )
+
+    # sign transaction
+    signed_txn = txn.sign(private_key)
+    tx_id = signed_txn.transaction.get_txid()
+
+    # send transaction
+    client.send_transactions([signed_txn])
+
+    # await confirmation
+    wait_for_confirmation(client, tx_id)
+
+    # display results
+    transaction_response = client.pending_transaction_info(tx_id)
     app_id = transaction_response["application-index"]
     print("Created new app id: ", app_id)
 
@@ -421,7 +802,7 @@ def delete_app(client, private_key, index):
     sender = address_from_private_key(private_key)
 
     # get node suggested parameters
-    params = client.suggested_params()
+    params = suggested_params_cache.get(client)
     # comment out the next two (2) lines to use suggested fees
     params.flat_fee = True
     params.fee = 1000
@@ -444,6 +825,43 @@ def delete_app(client, private_key, index):
     print("Deleted app-id: ", transaction_response["txn"]["txn"]["apid"])
 
 
+def _is_suggested_params_error(exception):
+    """Return True if submission `exception` is caused by stale fee or rounds.
+
+    :param exception: Node's submission error
+    :type exception: :class:`AlgodHTTPError`
+    :var message: error message
+    :type message: str
+    :return: bool
+    """
+    message = str(exception)
+    return any(error in message for error in SUGGESTED_PARAMS_ERRORS)
+
+
+def _execute_composer(client, composer, *args):
+    """Execute transaction group built by `composer` and return its response.
+
+    Group rejected because of cached suggested parameters' fee or validity
+    rounds is built again with freshly fetched parameters and executed once more.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param composer: function returning atomic transaction composer
+    :type composer: callable
+    :param args: positional arguments passed to `composer` after `client`
+    :type args: tuple
+    :return: :class:`AtomicTransactionResponse`
+    """
+    try:
+        return composer(client, *args).execute(client, 2)
+    except AlgodHTTPError as exception:
+        if not _is_suggested_params_error(exception):
+            raise
+
+    suggested_params_cache.invalidate(client)
+    return composer(client, *args).execute(client, 2)
+
+
 def delete_box(client, app_id, writing_parameters, address):
     """Delete  box owned by `app_id` defined by provided `address`.
 
@@ -455,95 +873,241 @@ def delete_box(client, app_id, writing_parameters, address):
     :type writing_parameters: dict
     :param address: governance seat address associated with the box
     :type address: str
-    :var atc: transaction composer instance
-    :type atc: :class:`AtomicTransactionComposer`
-    :var box_name: base64 encoded box name
-    :type box_name: str
     :var response: application call's response
     :type response: :class:`AtomicTransactionResponse`
     """
-    atc = AtomicTransactionComposer()
-
-    box_name = box_name_from_address(address)
-
-    atc.add_method_call(
-        app_id=app_id,
-        method=writing_parameters.get("contract").get_method_by_name("delete_box"),
-        sender=writing_parameters.get("sender"),
-        sp=client.suggested_params(),
-        signer=writing_parameters.get("signer"),
-        method_args=[box_name],
-        boxes=[(app_id, box_name)],
-    )
-
     # send transaction
-    response = atc.execute(client, 2)
+    response = _execute_composer(
+        client, _delete_boxes_composer, app_id, writing_parameters, [address]
+    )
+    permission_values_cache.invalidate(app_id, address)
 
     # wait for confirmation
     print("TXID: ", response.tx_ids[0])
     print("Result confirmed in round: {}".format(response.confirmed_round))
 
 
-def deserialized_permission_dapp_box_value(client, app_id, box_name):
+def deserialized_box_response_value(response):
+    """Return deserialized values from Permission dApp's box `response`.
+
+    :param response: fetch application box call's response
+    :type response: dict
+    :return: list
+    """
+    return deserialize_box_value(response.get("value"))
+
+
+def deserialized_permission_dapp_box_value(client, app_id, box_name, cached=False):
     """Fetch `box_name`  value and return deserialized values from it.
 
+    If `cached` is set then values, including not found boxes, are served from
+    and stored to the address-keyed permission values cache.
+
     :param client: Algorand Node client instance
     :type client: :class:`AlgodClient`
     :param app_id: Permission dApp identifier
     :type app_id: int
     :param box_name: base64 encoded box name
     :type box_name: str
+    :param cached: use permission values cache
+    :type cached: bool
+    :var address: governance seat address associated with the box
+    :type address: str
+    :var hit: cache hit flag
+    :type hit: bool
+    :var values: deserialized box values
+    :type values: list
     :var response: fetch application box call's response
     :type response: :class:`AtomicTransactionResponse`
     :return: list
     """
+    if cached:
+        address = encode_address(box_name)
+        hit, values = permission_values_cache.get(app_id, address)
+        if hit:
+            return values
+
+    response = permission_dapp_box_response(client, app_id, box_name)
+    values = deserialized_box_response_value(response) if response else None
+    if cached:
+        permission_values_cache.set(app_id, address, values)
+
+    return values
+
+
+def permission_dapp_box_response(client, app_id, box_name):
+    """Fetch and return Node's response for `box_name` or None if box isn't found.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param box_name: box name
+    :type box_name: bytes
+    :return: dict
+    """
     try:
-        response = client.application_box_by_name(app_id, box_name)
+        return client.application_box_by_name(app_id, box_name)
     except AlgodHTTPError as exception:
         if "box not found" in exception.args:
             return None
         raise exception
 
-    return deserialize_values_data(
-        base64.b64decode(response.get("value")).decode("utf8")
+
+def permission_dapp_box_responses(client, app_id, box_names, workers=1):
+    """Return collection of box names and related Node's responses.
+
+    Boxes that aren't found are mapped to None.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param box_names: collection of box names to fetch
+    :type box_names: iterable
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var executor: thread pool executor instance
+    :type executor: :class:`ThreadPoolExecutor`
+    :return: dict
+    """
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        return dict(
+            executor.map(
+                lambda box_name: (
+                    box_name,
+                    permission_dapp_box_response(client, app_id, box_name),
+                ),
+                box_names,
+            )
+        )
+
+
+def permission_dapp_box_contents(client, app_id, workers=1):
+    """Return collection of all addresses with related current box contents.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :var responses: collection of box names and related Node's responses
+    :type responses: dict
+    :var box_name: currently processed box's name
+    :type box_name: bytes
+    :var response: currently processed box's Node response
+    :type response: dict
+    :return: dict
+    """
+    if app_id is None:
+        raise ValueError("Permission dApp ID isn't set!")
+
+    responses = permission_dapp_box_responses(
+        client, app_id, application_box_names(client, app_id), workers=workers
     )
+    return {
+        encode_address(box_name): base64.b64decode(response.get("value"))
+        for box_name, response in responses.items()
+        if response is not None
+    }
 
 
-def permission_dapp_values_from_boxes(client, app_id):
+def permission_dapp_values_from_boxes(client, app_id, workers=1):
     """Return collection of all addresses with related votes and permission values.
 
+    Box names are listed page by page and fetched by up to `workers` concurrent
+    threads as soon as they are listed, so for large number of boxes the snapshot
+    is bound by Node's throughput instead of the round trip latency.
+
     :param client: Algorand Node client instance
     :type client: :class:`AlgodClient`
     :param app_id: Permission dApp identifier
     :type app_id: int
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
     :var permissions: collection of addresses and related votes and permission values
     :type permissions: dict
-    :var boxes: collection of Pewrmission dApp's boxes fetched from Node
-    :type boxes: dict
+    :var executor: thread pool executor instance
+    :type executor: :class:`ThreadPoolExecutor`
+    :var results: pairs of box names and related deserialized values
+    :type results: generator
     :var box_name: currently processed box's name
     :type box_name: bytes
-    :var address: currently processed box's user address
-    :type address: str
     :var values: collection of deserialized values for currently processed address
-    :type values: int
+    :type values: list
     :return: dict
     """
     if app_id is None:
         raise ValueError("Permission dApp ID isn't set!")
 
     permissions = {}
-    boxes = client.application_boxes(app_id)
-    for box in boxes.get("boxes", []):
-        box_name = base64.b64decode(box.get("name"))
-        address = encode_address(box_name)
-        values = deserialized_permission_dapp_box_value(client, app_id, box_name)
-        if not values:
-            continue
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        results = executor.map(
+            lambda box_name: (
+                box_name,
+                deserialized_permission_dapp_box_value(client, app_id, box_name),
+            ),
+            application_box_names(client, app_id),
+        )
+        for box_name, values in results:
+            if not values:
+                continue
+
+            permissions[encode_address(box_name)] = values
 
-        permissions[address] = values
     return permissions
 
 
+def permission_values_for_addresses(
+    client, app_id, addresses, workers=BOXES_FETCHING_WORKERS, cached=False
+):
+    """Return collection of `addresses` and related votes and permission values.
+
+    Merged accounts are resolved to their main account and every distinct box
+    is fetched only once by up to `workers` concurrent threads. Addresses
+    without a box are mapped to None.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param addresses: collection of governance seat addresses
+    :type addresses: iterable
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :param cached: use permission values cache
+    :type cached: bool
+    :var canonical: collection of addresses and related main accounts
+    :type canonical: dict
+    :var executor: thread pool executor instance
+    :type executor: :class:`ThreadPoolExecutor`
+    :var values: collection of main accounts and related deserialized values
+    :type values: dict
+    :return: dict
+    """
+    if app_id is None:
+        raise ValueError("Permission dApp ID isn't set!")
+
+    canonical = {
+        address: MERGED_ACCOUNTS.get(address, address) for address in addresses
+    }
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        values = dict(
+            executor.map(
+                lambda address: (
+                    address,
+                    deserialized_permission_dapp_box_value(
+                        client, app_id, box_name_from_address(address), cached=cached
+                    ),
+                ),
+                dict.fromkeys(canonical.values()),
+            )
+        )
+
+    return {address: values[merged] for address, merged in canonical.items()}
+
+
 def write_box(client, app_id, writing_parameters, address, value):
     """Write `value` to the box owned by `app_id` defined by provided `address`.
 
@@ -555,38 +1119,622 @@ def write_box(client, app_id, writing_parameters, address, value):
     :type writing_parameters: dict
     :param address: governance seat address associated with the box
     :type address: str
-    :param value: serialized base64 encoded values collection
-    :type value: str
+    :param value: version 2 raw or version 1 base64 encoded values data
+    :type value: bytes or str
+    :var response: application call's response
+    :type response: :class:`AtomicTransactionResponse`
+    """
+    print(f"Writing box for {address[:5]}..{address[-5:]}")
+    response = _execute_composer(
+        client,
+        _write_boxes_composer,
+        app_id,
+        writing_parameters,
+        {address: value},
+        [address],
+    )
+    permission_values_cache.invalidate(app_id, address)
+    print("TXID: ", response.tx_ids[0])
+    print("Result confirmed in round: {}".format(response.confirmed_round))
+
+
+def _write_boxes_calls(values, addresses):
+    """Split `addresses` into collections of addresses written by single app call.
+
+    Every collection references up to `BOXES_PER_WRITE_CALL` boxes of the same
+    values format and its ARC4 encoded arguments fit in application call
+    arguments limit. Every address is written by its own call if the deployed
+    Permission dApp's `write_boxes` methods aren't enabled by `WRITE_BOXES_METHOD`.
+
+    :param values: collection of addresses and related serialized values
+    :type values: dict
+    :param addresses: collection of group's addresses
+    :type addresses: list
+    :var per_call: maximum number of boxes written by single call
+    :type per_call: int
+    :var calls: collection of calls' addresses
+    :type calls: list
+    :var call: currently filled call's addresses
+    :type call: list
+    :var size: currently filled call's arguments size
+    :type size: int
+    :var address: currently processed governance seat address
+    :type address: str
+    :var value: currently processed serialized values
+    :type value: bytes or str
+    :var entry_size: ARC4 encoded size of the box name and value pair
+    :type entry_size: int
+    :return: list
+    """
+    per_call = BOXES_PER_WRITE_CALL if WRITE_BOXES_METHOD else 1
+    # method selector and array length prefix
+    calls, call, size = [], [], 4 + 2
+    for address in addresses:
+        value = values[address]
+        # array and tuple heads offsets, 32 bytes box name and value with prefixes
+        entry_size = (
+            2
+            + 4
+            + 2
+            + 32
+            + 2
+            + len(value if isinstance(value, bytes) else value.encode())
+        )
+        if call and (
+            len(call) == per_call
+            or size + entry_size > APP_CALL_ARGS_MAX_SIZE
+            or isinstance(value, bytes) != isinstance(values[call[0]], bytes)
+        ):
+            calls.append(call)
+            call, size = [], 4 + 2
+
+        call.append(address)
+        size += entry_size
+
+    if call:
+        calls.append(call)
+
+    return calls
+
+
+def _write_group_size(group_size):
+    """Return number of boxes written in atomic group of up to `group_size` boxes.
+
+    Without `write_boxes` methods enabled by `WRITE_BOXES_METHOD` every box is
+    written by its own transaction, so the group can't exceed transactions limit.
+
+    :param group_size: maximum number of boxes written in atomic group
+    :type group_size: int
+    :return: int
+    """
+    return group_size if WRITE_BOXES_METHOD else min(group_size, TX_GROUP_LIMIT)
+
+
+def _write_boxes_composer(client, app_id, writing_parameters, values, addresses):
+    """Return atomic transaction composer with box writing calls for `addresses`.
+
+    Addresses are packed into `write_boxes` method calls, while the addresses
+    left alone in their call are written by `write_box` method. Raw version 2
+    values are written by the `_raw` variants of those methods.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param values: collection of addresses and related serialized values
+    :type values: dict
+    :param addresses: collection of group's addresses
+    :type addresses: list
     :var atc: transaction composer instance
     :type atc: :class:`AtomicTransactionComposer`
-    :var box_name: base64 encoded box name
-    :type box_name: str
-    :var response: application call's response
+    :var contract: Permission dApp's ABI contract
+    :type contract: :class:`Contract`
+    :var suggested_params: group's transaction parameters
+    :type suggested_params: :class:`transaction.SuggestedParams`
+    :var call: currently processed call's addresses
+    :type call: list
+    :var box_names: currently processed call's box names
+    :type box_names: list
+    :var suffix: currently processed call's methods name suffix
+    :type suffix: str
+    :var method: Permission dApp's box writing ABI method
+    :type method: :class:`algosdk.abi.Method`
+    :var method_args: currently processed call's method arguments
+    :type method_args: list
+    :return: :class:`AtomicTransactionComposer`
+    """
+    atc = AtomicTransactionComposer()
+    contract = writing_parameters.get("contract")
+    suggested_params = suggested_params_cache.get(client)
+    for call in _write_boxes_calls(values, addresses):
+        box_names = [box_name_from_address(address) for address in call]
+        suffix = "_raw" if isinstance(values[call[0]], bytes) else ""
+        if len(call) == 1:
+            method = contract.get_method_by_name(f"write_box{suffix}")
+            method_args = [box_names[0], values[call[0]]]
+        else:
+            method = contract.get_method_by_name(f"write_boxes{suffix}")
+            method_args = [
+                [
+                    (box_name, values[address])
+                    for box_name, address in zip(box_names, call)
+                ]
+            ]
+
+        atc.add_method_call(
+            app_id=app_id,
+            method=method,
+            sender=writing_parameters.get("sender"),
+            sp=suggested_params,
+            signer=writing_parameters.get("signer"),
+            method_args=method_args,
+            boxes=[(app_id, box_name) for box_name in box_names],
+        )
+
+    return atc
+
+
+def _journal_contents(values, addresses):
+    """Return collection of `addresses` and related hex encoded box contents.
+
+    :param values: collection of addresses and related serialized values
+    :type values: dict
+    :param addresses: collection of group's addresses
+    :type addresses: list
+    :return: dict
+    """
+    return {address: _box_content(values[address]).hex() for address in addresses}
+
+
+def _journaled_write_boxes_composer(
+    client, app_id, writing_parameters, values, addresses, journal
+):
+    """Return box writing composer for `addresses` recorded as planned in `journal`.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param values: collection of addresses and related serialized values
+    :type values: dict
+    :param addresses: collection of group's addresses
+    :type addresses: list
+    :param journal: write journal file path
+    :type journal: :class:`pathlib.Path`
+    :var atc: transaction composer instance
+    :type atc: :class:`AtomicTransactionComposer`
+    :return: :class:`AtomicTransactionComposer`
+    """
+    atc = _write_boxes_composer(client, app_id, writing_parameters, values, addresses)
+    append_journal_entry(
+        journal,
+        {
+            "event": "planned",
+            "app_id": app_id,
+            "txid": atc.build_group()[0].txn.get_txid(),
+            "contents": _journal_contents(values, addresses),
+        },
+    )
+    return atc
+
+
+def _txid_recording_builder(builder, txids, index):
+    """Return composer created by `builder` and record its first transaction ID.
+
+    :param builder: atomic transaction composer builder
+    :type builder: callable
+    :param txids: collection of group positions and related first transaction IDs
+    :type txids: dict
+    :param index: group position
+    :type index: int
+    :var atc: transaction composer instance
+    :type atc: :class:`AtomicTransactionComposer`
+    :return: :class:`AtomicTransactionComposer`
+    """
+    atc = builder()
+    txids[index] = atc.build_group()[0].txn.get_txid()
+    return atc
+
+
+def write_boxes(
+    client,
+    app_id,
+    writing_parameters,
+    values,
+    group_size=BOXES_WRITING_GROUP_SIZE,
+    pipelined=False,
+    journal=None,
+):
+    """Write `values` to `app_id` boxes in atomic groups of up to `group_size` boxes.
+
+    Group's boxes are packed into `write_boxes` method calls staying within
+    per-transaction box references and arguments size limits. Groups are sent
+    one after another waiting for confirmation of each group, or if `pipelined`
+    is set all the groups are sent at once and their confirmations tracked
+    together.
+
+    If `journal` is provided, planned and confirmed groups are appended to it
+    and the boxes already confirmed with the same values by a previous run
+    are skipped, so an interrupted run can be resumed.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param values: collection of addresses and related serialized values
+    :type values: dict
+    :param group_size: maximum number of boxes written in atomic group
+    :type group_size: int
+    :param pipelined: submit all groups without waiting for confirmations
+    :type pipelined: bool
+    :param journal: write journal file path
+    :type journal: :class:`pathlib.Path`
+    :var addresses: collection of addresses to write boxes for
+    :type addresses: list
+    :var journaled: collection of addresses and box contents confirmed in journal
+    :type journaled: dict
+    :var groups: collection of groups' addresses
+    :type groups: list
+    :var composer: groups' transaction composer builder
+    :type composer: callable
+    :var txids: collection of group positions and related first transaction IDs
+    :type txids: dict
+    :var confirmed: collection of group positions and related confirmed rounds
+    :type confirmed: dict
+    :var failed: collection of group positions and related failure reasons
+    :type failed: dict
+    :var group: currently processed group's addresses
+    :type group: list
+    :var response: application calls group's response
     :type response: :class:`AtomicTransactionResponse`
+    :var address: currently processed governance seat address
+    :type address: str
+    :return: two-tuple
+    """
+    addresses = list(values)
+    composer = _write_boxes_composer
+    if journal is not None:
+        journaled = confirmed_journal_writes(client, journal, app_id)
+        addresses = [
+            address
+            for address in addresses
+            if journaled.get(address) != _box_content(values[address]).hex()
+        ]
+        print(f"Skipped {len(values) - len(addresses)} boxes confirmed in journal")
+        composer = partial(_journaled_write_boxes_composer, journal=journal)
+
+    group_size = _write_group_size(group_size)
+    groups = [
+        addresses[start : start + group_size]
+        for start in range(0, len(addresses), group_size)
+    ]
+    if pipelined:
+        print(f"Submitting {len(groups)} groups of boxes")
+        txids = {}
+        confirmed, failed = submit_pipelined(
+            client,
+            [
+                partial(
+                    _txid_recording_builder,
+                    partial(
+                        composer, client, app_id, writing_parameters, values, group
+                    ),
+                    txids,
+                    index,
+                )
+                for index, group in enumerate(groups)
+            ],
+        )
+        for index in confirmed:
+            for address in groups[index]:
+                permission_values_cache.invalidate(app_id, address)
+
+            if journal is not None:
+                append_journal_entry(
+                    journal,
+                    {
+                        "event": "confirmed",
+                        "app_id": app_id,
+                        "txid": txids.get(index),
+                        "round": confirmed[index],
+                        "contents": _journal_contents(values, groups[index]),
+                    },
+                )
+
+        print(f"Confirmed {len(confirmed)} groups, failed {len(failed)} groups")
+        return confirmed, failed
+
+    confirmed = {}
+    for index, group in enumerate(groups):
+        print(f"Writing {len(group)} boxes starting with {group[0][:5]}..")
+        response = _execute_composer(
+            client, composer, app_id, writing_parameters, values, group
+        )
+        for address in group:
+            permission_values_cache.invalidate(app_id, address)
+
+        if journal is not None:
+            append_journal_entry(
+                journal,
+                {
+                    "event": "confirmed",
+                    "app_id": app_id,
+                    "txid": response.tx_ids[0],
+                    "round": response.confirmed_round,
+                    "contents": _journal_contents(values, group),
+                },
+            )
+
+        print("TXID: ", response.tx_ids[0])
+        print("Result confirmed in round: {}".format(response.confirmed_round))
+        confirmed[index] = response.confirmed_round
+
+    return confirmed, {}
+
+
+def _delete_boxes_composer(client, app_id, writing_parameters, addresses):
+    """Return atomic transaction composer with box deleting calls for `addresses`.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param addresses: collection of group's addresses
+    :type addresses: list
+    :var atc: transaction composer instance
+    :type atc: :class:`AtomicTransactionComposer`
+    :var method: Permission dApp's box deleting ABI method
+    :type method: :class:`algosdk.abi.Method`
+    :var suggested_params: group's transaction parameters
+    :type suggested_params: :class:`transaction.SuggestedParams`
+    :var address: currently processed governance seat address
+    :type address: str
+    :var box_name: currently processed box name
+    :type box_name: bytes
+    :return: :class:`AtomicTransactionComposer`
     """
     atc = AtomicTransactionComposer()
+    method = writing_parameters.get("contract").get_method_by_name("delete_box")
+    suggested_params = suggested_params_cache.get(client)
+    for address in addresses:
+        box_name = box_name_from_address(address)
+        atc.add_method_call(
+            app_id=app_id,
+            method=method,
+            sender=writing_parameters.get("sender"),
+            sp=suggested_params,
+            signer=writing_parameters.get("signer"),
+            method_args=[box_name],
+            boxes=[(app_id, box_name)],
+        )
+
+    return atc
 
-    box_name = box_name_from_address(address)
 
-    atc.add_method_call(
-        app_id=app_id,
-        method=writing_parameters.get("contract").get_method_by_name("write_box"),
-        sender=writing_parameters.get("sender"),
-        sp=client.suggested_params(),
-        signer=writing_parameters.get("signer"),
-        method_args=[box_name, value],
-        boxes=[(app_id, box_name)],
+def _print_deleting_progress(deleted, total, started):
+    """Print number of deleted boxes out of `total` and related deleting rate.
+
+    :param deleted: number of deleted boxes
+    :type deleted: int
+    :param total: number of boxes to delete
+    :type total: int
+    :param started: monotonic time deleting started at
+    :type started: float
+    :var elapsed: number of seconds since deleting started
+    :type elapsed: float
+    """
+    elapsed = time.monotonic() - started
+    print(
+        f"Deleted {deleted}/{total} boxes "
+        f"({deleted / elapsed if elapsed else 0:.1f} boxes/s)"
     )
 
-    print(f"Writing box for {address[:5]}..{address[-5:]}")
-    response = atc.execute(client, 2)
-    print("TXID: ", response.tx_ids[0])
-    print("Result confirmed in round: {}".format(response.confirmed_round))
+
+def delete_boxes_in_groups(
+    client,
+    app_id,
+    writing_parameters,
+    addresses,
+    group_size=BOXES_DELETING_GROUP_SIZE,
+    pipelined=False,
+):
+    """Delete `app_id` boxes for `addresses` in atomic groups of `delete_box` calls.
+
+    Groups are sent one after another waiting for confirmation of each group,
+    or if `pipelined` is set all the groups are sent at once and their
+    confirmations tracked together.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param addresses: collection of addresses to delete boxes for
+    :type addresses: list
+    :param group_size: maximum number of boxes deleted in atomic group
+    :type group_size: int
+    :param pipelined: submit all groups without waiting for confirmations
+    :type pipelined: bool
+    :var groups: collection of groups' addresses
+    :type groups: list
+    :var started: monotonic time deleting started at
+    :type started: float
+    :var confirmed: collection of group positions and related confirmed rounds
+    :type confirmed: dict
+    :var failed: collection of group positions and related failure reasons
+    :type failed: dict
+    :var deleted: number of deleted boxes
+    :type deleted: int
+    :var group: currently processed group's addresses
+    :type group: list
+    :var response: application calls group's response
+    :type response: :class:`AtomicTransactionResponse`
+    :var address: currently processed governance seat address
+    :type address: str
+    :return: two-tuple
+    """
+    addresses = list(addresses)
+    groups = [
+        addresses[start : start + group_size]
+        for start in range(0, len(addresses), group_size)
+    ]
+    started = time.monotonic()
+    if pipelined:
+        print(f"Submitting {len(groups)} groups of boxes deletion")
+        confirmed, failed = submit_pipelined(
+            client,
+            [
+                partial(
+                    _delete_boxes_composer, client, app_id, writing_parameters, group
+                )
+                for group in groups
+            ],
+        )
+        for index in confirmed:
+            for address in groups[index]:
+                permission_values_cache.invalidate(app_id, address)
+
+        _print_deleting_progress(
+            sum(len(groups[index]) for index in confirmed), len(addresses), started
+        )
+        print(f"Confirmed {len(confirmed)} groups, failed {len(failed)} groups")
+        return confirmed, failed
+
+    confirmed, deleted = {}, 0
+    for index, group in enumerate(groups):
+        response = _execute_composer(
+            client, _delete_boxes_composer, app_id, writing_parameters, group
+        )
+        for address in group:
+            permission_values_cache.invalidate(app_id, address)
+
+        deleted += len(group)
+        confirmed[index] = response.confirmed_round
+        _print_deleting_progress(deleted, len(addresses), started)
+
+    return confirmed, {}
+
+
+def _simulated_group(client, action, addresses, atc):
+    """Return report of simulating `atc` group of `action` for `addresses`.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param action: group's boxes action ("write" or "delete")
+    :type action: str
+    :param addresses: collection of group's addresses
+    :type addresses: list
+    :param atc: transaction composer instance
+    :type atc: :class:`AtomicTransactionComposer`
+    :var response: group simulation's response
+    :type response: :class:`SimulateAtomicTransactionResponse`
+    :return: dict
+    """
+    response = atc.simulate(client)
+    return {
+        "action": action,
+        "addresses": list(addresses),
+        "transactions": len(response.tx_ids),
+        "budget": response.simulate_response["txn-groups"][0].get(
+            "app-budget-consumed", 0
+        ),
+        "fee": sum(txn.txn.fee for txn in atc.build_group()),
+        "failure": response.failure_message or None,
+    }
+
+
+def simulate_box_updates(
+    client,
+    app_id,
+    writing_parameters,
+    values,
+    deletes=(),
+    group_size=BOXES_WRITING_GROUP_SIZE,
+    workers=BOXES_FETCHING_WORKERS,
+):
+    """Simulate writing `values` and deleting `deletes` boxes without submitting.
+
+    Boxes are split into the same atomic groups as by :func:`write_boxes` and
+    every group is run through Node's simulate endpoint by up to `workers`
+    concurrent threads, so opcode budget and fees are validated without
+    waiting for any confirmation.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param values: collection of addresses and related serialized values
+    :type values: dict
+    :param deletes: collection of addresses to delete boxes for
+    :type deletes: list
+    :param group_size: maximum number of boxes written in atomic group
+    :type group_size: int
+    :param workers: maximum number of concurrent simulating threads
+    :type workers: int
+    :var addresses: collection of addresses to write boxes for
+    :type addresses: list
+    :var deleted: collection of addresses to delete boxes for
+    :type deleted: list
+    :var groups: collection of groups' actions, addresses and composers
+    :type groups: list
+    :var executor: thread pool executor instance
+    :type executor: :class:`ThreadPoolExecutor`
+    :return: list
+    """
+    addresses, deleted = list(values), list(deletes)
+    group_size = _write_group_size(group_size)
+    groups = [
+        (
+            "write",
+            addresses[start : start + group_size],
+            _write_boxes_composer(
+                client,
+                app_id,
+                writing_parameters,
+                values,
+                addresses[start : start + group_size],
+            ),
+        )
+        for start in range(0, len(addresses), group_size)
+    ] + [
+        (
+            "delete",
+            deleted[start : start + BOXES_DELETING_GROUP_SIZE],
+            _delete_boxes_composer(
+                client,
+                app_id,
+                writing_parameters,
+                deleted[start : start + BOXES_DELETING_GROUP_SIZE],
+            ),
+        )
+        for start in range(0, len(deleted), BOXES_DELETING_GROUP_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        return list(
+            executor.map(lambda group: _simulated_group(client, *group), groups)
+        )
 
 
-def write_foundation_boxes(client, app_id, writing_parameters, data):
+def write_foundation_boxes(
+    client, app_id, writing_parameters, data, current=None, journal=None
+):
     """Write to the boxes owned by `app_id` values extracted from provided `data`.
 
+    Boxes are written in atomic groups by :func:`write_boxes`, skipping the ones
+    with serialized values equal to their `current` contents if provided.
+    Written groups are recorded in `journal` if provided.
+
     :param client: Algorand Node client instance
     :type client: :class:`AlgodClient`
     :param app_id: Permission dApp identifier
@@ -595,13 +1743,90 @@ def write_foundation_boxes(client, app_id, writing_parameters, data):
     :type writing_parameters: dict
     :param data: collection of addresses and associated integer values
     :type data: dict
+    :param current: collection of addresses and related current box contents
+    :type current: dict
+    :param journal: write journal file path
+    :type journal: :class:`pathlib.Path`
+    :var values: collection of addresses and related serialized values
+    :type values: dict
     :var address: currently processed governance seat address
     :type address: str
-    :var values: currently processed integer values collection
-    :type values: list
-    :var value: currently processed serialized base64 encoded values collection
-    :type value: str
+    :var integers: currently processed integer values collection
+    :type integers: list
     """
-    for address, values in data.items():
-        value = serialize_values(values)
-        write_box(client, app_id, writing_parameters, address, value)
+    values = {
+        address: serialize_box_values(integers) for address, integers in data.items()
+    }
+    if current is not None:
+        values = changed_box_values(values, current)
+
+    write_boxes(client, app_id, writing_parameters, values, journal=journal)
+
+
+def migrate_boxes_to_raw_values(
+    client,
+    app_id,
+    writing_parameters,
+    workers=BOXES_FETCHING_WORKERS,
+    group_size=BOXES_WRITING_GROUP_SIZE,
+    pipelined=False,
+):
+    """Rewrite all `app_id` boxes holding version 1 values in version 2 raw format.
+
+    Boxes are fetched by up to `workers` concurrent threads and the ones still
+    in base64 encoded format are written in atomic groups by :func:`write_boxes`,
+    so the job can be safely repeated until no box is left to migrate.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param workers: maximum number of concurrent box fetching threads
+    :type workers: int
+    :param group_size: maximum number of boxes written in atomic group
+    :type group_size: int
+    :param pipelined: submit all groups without waiting for confirmations
+    :type pipelined: bool
+    :var responses: collection of box names and related Node's responses
+    :type responses: dict
+    :var values: collection of addresses and related raw serialized values
+    :type values: dict
+    :var box_name: currently processed box's name
+    :type box_name: bytes
+    :var response: currently processed box's Node response
+    :type response: dict
+    :var content: currently processed box's content
+    :type content: bytes
+    :return: two-tuple
+    """
+    if app_id is None:
+        raise ValueError("Permission dApp ID isn't set!")
+
+    responses = permission_dapp_box_responses(
+        client, app_id, application_box_names(client, app_id), workers=workers
+    )
+    values = {}
+    for box_name, response in responses.items():
+        if response is None:
+            continue
+
+        content = base64.b64decode(response.get("value"))
+        if values_data_version(content) == 1:
+            values[encode_address(box_name)] = serialize_raw_values(
+                deserialize_values_data(content)
+            )
+
+    print(f"Migrating {len(values)} of {len(responses)} boxes")
+    if not values:
+        return {}, {}
+
+    return write_boxes(
+        client,
+        app_id,
+        writing_parameters,
+        values,
+        group_size=group_size,
+        pipelined=pipelined,
+    )
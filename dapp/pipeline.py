@@ -0,0 +1,215 @@
+"""Module with functions for pipelined transactions submission and tracking."""
+
+from algosdk.error import AlgodHTTPError
+
+from cache import suggested_params_cache
+from configuration import PIPELINE_MAX_RETRIES, PIPELINE_MAX_WAIT_ROUNDS
+
+
+def _transaction_state(client, txid):
+    """Return two-tuple of confirmed round and failure reason for `txid`.
+
+    Both values are None for a transaction still waiting in the pool or for
+    a transaction Node can't report about, as such one isn't rejected for sure.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param txid: blockchain transaction ID
+    :type txid: str
+    :var txinfo: pending transaction information
+    :type txinfo: dict
+    :return: two-tuple
+    """
+    try:
+        txinfo = client.pending_transaction_info(txid)
+    except AlgodHTTPError:
+        return None, None
+
+    if txinfo.get("confirmed-round"):
+        return txinfo.get("confirmed-round"), None
+
+    return None, txinfo.get("pool-error") or None
+
+
+def _is_expired(txid, last_round, waited, max_rounds, last_valid):
+    """Return True if pending `txid` can't be confirmed anymore.
+
+    Transaction with known last valid round is expired when that round is
+    reached, while the other ones are considered expired after `max_rounds`.
+
+    :param txid: blockchain transaction ID
+    :type txid: str
+    :param last_round: last round reported by Node
+    :type last_round: int
+    :param waited: number of rounds waited for
+    :type waited: int
+    :param max_rounds: number of rounds after which pending transactions fail
+    :type max_rounds: int
+    :param last_valid: collection of transaction IDs and related last valid rounds
+    :type last_valid: dict
+    :return: bool
+    """
+    if txid in last_valid:
+        return last_round >= last_valid[txid]
+
+    return waited >= max_rounds
+
+
+def _expired_reason(txid, max_rounds, last_valid):
+    """Return failure reason for expired `txid`.
+
+    :param txid: blockchain transaction ID
+    :type txid: str
+    :param max_rounds: number of rounds after which pending transactions fail
+    :type max_rounds: int
+    :param last_valid: collection of transaction IDs and related last valid rounds
+    :type last_valid: dict
+    :return: str
+    """
+    if txid in last_valid:
+        return f"not confirmed until last valid round {last_valid[txid]}"
+
+    return f"not confirmed in {max_rounds} rounds"
+
+
+def track_confirmations(
+    client, txids, max_rounds=PIPELINE_MAX_WAIT_ROUNDS, last_valid=None
+):
+    """Wait for all `txids` and return collections of confirmed and failed ones.
+
+    All outstanding transactions are checked once per round, so the waiting
+    time is bound by the slowest transaction instead of their number.
+    Transaction is failed only if it's rejected by Node or if it's expired,
+    and transactions with provided last valid round are tracked until that
+    round, as they can be confirmed until then.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param txids: collection of blockchain transaction IDs
+    :type txids: list
+    :param max_rounds: number of rounds after which pending transactions fail
+    :type max_rounds: int
+    :param last_valid: collection of transaction IDs and related last valid rounds
+    :type last_valid: dict
+    :var confirmed: collection of confirmed transaction IDs and related rounds
+    :type confirmed: dict
+    :var failed: collection of failed transaction IDs and related reasons
+    :type failed: dict
+    :var pending: collection of outstanding transaction IDs
+    :type pending: list
+    :var last_round: last round waited for
+    :type last_round: int
+    :var waited: number of rounds waited for
+    :type waited: int
+    :var txid: currently processed transaction ID
+    :type txid: str
+    :var confirmed_round: currently processed transaction's confirmed round
+    :type confirmed_round: int
+    :var reason: currently processed transaction's failure reason
+    :type reason: str
+    :return: two-tuple
+    """
+    confirmed, failed, pending = {}, {}, list(txids)
+    if not pending:
+        return confirmed, failed
+
+    last_valid = last_valid or {}
+    last_round, waited = client.status().get("last-round"), 0
+    while True:
+        for txid in pending:
+            confirmed_round, reason = _transaction_state(client, txid)
+            if confirmed_round:
+                confirmed[txid] = confirmed_round
+            elif reason:
+                failed[txid] = reason
+            elif _is_expired(txid, last_round, waited, max_rounds, last_valid):
+                failed[txid] = _expired_reason(txid, max_rounds, last_valid)
+
+        pending = [
+            txid for txid in pending if txid not in confirmed and txid not in failed
+        ]
+        if not pending:
+            break
+
+        waited += 1
+        last_round += 1
+        client.status_after_block(last_round)
+
+    return confirmed, failed
+
+
+def submit_pipelined(
+    client,
+    builders,
+    max_retries=PIPELINE_MAX_RETRIES,
+    max_rounds=PIPELINE_MAX_WAIT_ROUNDS,
+):
+    """Submit all atomic groups without waiting and track them together.
+
+    Every builder is a callable returning new composed atomic transaction
+    composer. Submitted groups are tracked until their last valid round, so
+    only the groups rejected by Node or expired ones are built again with
+    freshly fetched suggested parameters and resubmitted up to `max_retries`
+    times, and a group can't be applied twice.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param builders: collection of atomic transaction composer builders
+    :type builders: list
+    :param max_retries: maximum number of resubmissions of failed groups
+    :type max_retries: int
+    :param max_rounds: number of rounds after which pending groups without
+        known last valid round fail
+    :type max_rounds: int
+    :var confirmed: collection of builder positions and related confirmed rounds
+    :type confirmed: dict
+    :var failed: collection of builder positions and related failure reasons
+    :type failed: dict
+    :var remaining: positions of builders to submit in current attempt
+    :type remaining: list
+    :var attempt: current submission attempt
+    :type attempt: int
+    :var submitted: collection of groups' first transaction IDs and positions
+    :type submitted: dict
+    :var last_valid: collection of groups' first transaction IDs and last valid rounds
+    :type last_valid: dict
+    :var index: currently processed builder position
+    :type index: int
+    :var atc: currently processed group's transaction composer
+    :type atc: :class:`AtomicTransactionComposer`
+    :var txid: currently processed group's first transaction ID
+    :type txid: str
+    :var done: collection of confirmed transaction IDs and related rounds
+    :type done: dict
+    :var errors: collection of failed transaction IDs and related reasons
+    :type errors: dict
+    :return: two-tuple
+    """
+    confirmed, failed, remaining = {}, {}, list(range(len(builders)))
+    for attempt in range(max_retries + 1):
+        if attempt:
+            print(f"Resubmitting {len(remaining)} failed groups")
+            suggested_params_cache.invalidate(client)
+
+        failed, submitted, last_valid = {}, {}, {}
+        for index in remaining:
+            try:
+                atc = builders[index]()
+                txid = atc.submit(client)[0]
+            except AlgodHTTPError as exception:
+                failed[index] = str(exception)
+                continue
+
+            submitted[txid] = index
+            last_valid[txid] = atc.build_group()[0].txn.last_valid_round
+
+        done, errors = track_confirmations(
+            client, submitted, max_rounds=max_rounds, last_valid=last_valid
+        )
+        confirmed.update({submitted[txid]: round_ for txid, round_ in done.items()})
+        failed.update({submitted[txid]: reason for txid, reason in errors.items()})
+        remaining = sorted(failed)
+        if not remaining:
+            break
+
+    return confirmed, failed
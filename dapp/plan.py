@@ -0,0 +1,163 @@
+"""Module with functions for planning, simulating and applying box updates."""
+
+import json
+
+from helpers import read_json, serialize_box_values
+from network import (
+    changed_subscriptions_and_staking_values,
+    is_unchanged_box,
+    new_stakers_values,
+    new_subscribers_values,
+    simulate_box_updates,
+    write_boxes,
+)
+
+
+def box_updates_plan(app_id, permissions, subscriptions, stakings, current):
+    """Return plan of box writes the update run makes for provided input.
+
+    Box values are calculated and written in the same order as in
+    :func:`check_and_update_permission_dapp_boxes`, so an address can be planned
+    more than once and writes of values equal to `current` box contents are
+    left out the same way. Update run doesn't delete boxes, so neither does
+    the plan.
+
+    :param app_id: Permission dApp identifier
+    :type app_id: int
+    :param permissions: collection of addresses and related votes and permission values
+    :type permissions: dict
+    :param subscriptions: Subtopia subscribers addresses and related tiers' values
+    :type subscriptions: dict
+    :param stakings: collection  of all governance staking addresses and related amounts
+    :type stakings: dict
+    :param current: collection of addresses and related current box contents
+    :type current: dict
+    :var actions: collection of planned per address actions
+    :type actions: list
+    :var skipped: number of skipped unchanged box writes
+    :type skipped: int
+    :var values: currently processed update step's addresses and related values
+    :type values: dict
+    :var address: currently processed address
+    :type address: str
+    :var new: currently processed address' new values
+    :type new: list
+    :return: dict
+    """
+    actions, skipped = [], 0
+    for values in (
+        new_subscribers_values(permissions, subscriptions),
+        new_stakers_values(permissions, stakings),
+        changed_subscriptions_and_staking_values(permissions, subscriptions, stakings),
+    ):
+        for address, new in values.items():
+            if is_unchanged_box(current.get(address), serialize_box_values(new)):
+                skipped += 1
+                continue
+
+            actions.append(
+                {
+                    "action": "update" if address in current else "create",
+                    "address": address,
+                    "old": permissions.get(address),
+                    "new": new,
+                }
+            )
+
+    return {"app_id": app_id, "actions": actions, "skipped": skipped}
+
+
+def plan_changes(plan):
+    """Return collection of addresses and serialized values written by `plan`.
+
+    Later action for an address overrides the former ones, as in the update run.
+
+    :param plan: box updates plan
+    :type plan: dict
+    :var entry: currently processed plan's action
+    :type entry: dict
+    :return: dict
+    """
+    return {
+        entry["address"]: serialize_box_values(entry["new"])
+        for entry in plan.get("actions", [])
+    }
+
+
+def simulate_plan(client, writing_parameters, plan, workers=1):
+    """Run `plan` through Node's simulate endpoint and add simulation report to it.
+
+    Nothing is submitted to the blockchain.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param plan: box updates plan
+    :type plan: dict
+    :param workers: maximum number of concurrent simulating threads
+    :type workers: int
+    :var groups: collection of simulated groups' reports
+    :type groups: list
+    :return: dict
+    """
+    groups = simulate_box_updates(
+        client,
+        plan["app_id"],
+        writing_parameters,
+        plan_changes(plan),
+        workers=workers,
+    )
+    plan["simulation"] = {
+        "groups": groups,
+        "fee": sum(group["fee"] for group in groups),
+        "budget": sum(group["budget"] for group in groups),
+        "failed": sum(1 for group in groups if group["failure"]),
+    }
+    return plan
+
+
+def apply_plan(client, writing_parameters, plan, pipelined=False):
+    """Write boxes as planned by provided `plan`.
+
+    :param client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :param writing_parameters: instances sneeded for writing boxes to blockchain
+    :type writing_parameters: dict
+    :param plan: box updates plan
+    :type plan: dict
+    :param pipelined: submit all groups without waiting for confirmations
+    :type pipelined: bool
+    :var values: collection of addresses and related serialized values
+    :type values: dict
+    :return: two-tuple
+    """
+    values = plan_changes(plan)
+    if not values:
+        return {}, {}
+
+    return write_boxes(
+        client, plan["app_id"], writing_parameters, values, pipelined=pipelined
+    )
+
+
+def load_plan(filename):
+    """Return box updates plan saved in `filename` JSON file.
+
+    :param filename: full path to JSON file
+    :type filename: :class:`pathlib.Path`
+    :return: dict
+    """
+    return read_json(filename)
+
+
+def save_plan(plan, filename):
+    """Save box updates `plan` to `filename` JSON file.
+
+    :param plan: box updates plan
+    :type plan: dict
+    :param filename: full path to JSON file
+    :type filename: :class:`pathlib.Path`
+    """
+    with open(filename, "w") as json_file:
+        json.dump(plan, json_file, indent=2)
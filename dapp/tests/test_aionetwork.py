@@ -0,0 +1,495 @@
+"""Testing module for :py:mod:`aionetwork` module."""
+
+import asyncio
+import base64
+import json
+from unittest import mock
+
+import pytest
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
+
+from aionetwork import (
+    AsyncAlgodClient,
+    AsyncIndexerClient,
+    _application_transactions,
+    application_transaction,
+    box_names,
+    current_governance_staking_for_address,
+    deserialized_permission_dapp_box_value,
+    fetch_subscriptions_for_address,
+    fetch_subscriptions_from_boxes,
+    gather_bounded,
+    governance_stakings,
+    permission_dapp_snapshot,
+    permission_dapp_values_from_boxes,
+)
+from configuration import (
+    BOXES_PAGE_LIMIT,
+    STAKING_APP_ID,
+    STAKING_KEY,
+    SUBTOPIA_ASASTATSER_APP_ID,
+    SUBTOPIA_CLUSTER_APP_ID,
+    SUBTOPIA_INTRO_APP_ID,
+)
+from helpers import box_name_from_address
+
+
+def _session_with_response(mocker, status, data, text=None):
+    response = mocker.MagicMock()
+    response.status = status
+    response.reason = "Reason"
+    response.json = mocker.AsyncMock(return_value=data)
+    response.text = mocker.AsyncMock(
+        return_value=json.dumps(data) if text is None else text
+    )
+    session = mocker.MagicMock()
+    session.get.return_value.__aenter__ = mocker.AsyncMock(return_value=response)
+    session.get.return_value.__aexit__ = mocker.AsyncMock(return_value=False)
+    return session
+
+
+# # CLIENTS
+class TestAionetworkClients:
+    """Testing class for :py:mod:`aionetwork` client classes."""
+
+    # # AsyncAlgodClient
+    def test_aionetwork_async_algod_client_algod_request_functionality(self, mocker):
+        session = _session_with_response(mocker, 200, {"foo": "bar"})
+        client = AsyncAlgodClient("token", "http://node/", session)
+        returned = asyncio.run(client.algod_request("/status", params={"a": 1}))
+        assert returned == {"foo": "bar"}
+        session.get.assert_called_once_with(
+            "http://node/v2/status",
+            params={"a": 1},
+            headers={"X-Algo-API-Token": "token"},
+        )
+
+    def test_aionetwork_async_algod_client_algod_request_raises_for_error(self, mocker):
+        session = _session_with_response(mocker, 404, {"message": "box not found"})
+        client = AsyncAlgodClient("", "http://node", session)
+        with pytest.raises(AlgodHTTPError) as exception:
+            asyncio.run(client.algod_request("/applications/5/box"))
+        assert "box not found" in exception.value.args
+        assert exception.value.code == 404
+        session.get.return_value.__aenter__.return_value.json.assert_not_called()
+
+    def test_aionetwork_async_algod_client_algod_request_for_plain_text_error(
+        self, mocker
+    ):
+        session = _session_with_response(mocker, 502, None, text="<html>502</html>")
+        client = AsyncAlgodClient("", "http://node", session)
+        with pytest.raises(AlgodHTTPError) as exception:
+            asyncio.run(client.algod_request("/status"))
+        assert "<html>502</html>" in exception.value.args
+        assert exception.value.code == 502
+
+    def test_aionetwork_async_algod_client_algod_request_for_empty_error(self, mocker):
+        session = _session_with_response(mocker, 504, None, text="")
+        client = AsyncAlgodClient("", "http://node", session)
+        with pytest.raises(AlgodHTTPError) as exception:
+            asyncio.run(client.algod_request("/status"))
+        assert "Reason" in exception.value.args
+
+    def test_aionetwork_async_algod_client_application_box_by_name(self, mocker):
+        client = AsyncAlgodClient("", "http://node", mocker.MagicMock())
+        mocked_request = mocker.patch.object(
+            client, "algod_request", new_callable=mocker.AsyncMock
+        )
+        returned = asyncio.run(client.application_box_by_name(505, b"\x01\x02"))
+        assert returned == mocked_request.return_value
+        mocked_request.assert_awaited_once_with(
+            "/applications/505/box", params={"name": "b64:AQI="}
+        )
+
+    def test_aionetwork_async_algod_client_account_info(self, mocker):
+        client = AsyncAlgodClient("", "http://node", mocker.MagicMock())
+        mocked_request = mocker.patch.object(
+            client, "algod_request", new_callable=mocker.AsyncMock
+        )
+        asyncio.run(client.account_info("address"))
+        mocked_request.assert_awaited_once_with("/accounts/address")
+
+    # # AsyncIndexerClient
+    def test_aionetwork_async_indexer_client_search_transactions(self, mocker):
+        session = _session_with_response(mocker, 200, {"transactions": []})
+        client = AsyncIndexerClient("token", "http://indexer", session)
+        returned = asyncio.run(
+            client.search_transactions(
+                application_id=505, limit=1000, min_round=None, next_page="abc"
+            )
+        )
+        assert returned == {"transactions": []}
+        session.get.assert_called_once_with(
+            "http://indexer/v2/transactions",
+            params={"application-id": 505, "limit": 1000, "next": "abc"},
+            headers={"X-Indexer-API-Token": "token"},
+        )
+
+    def test_aionetwork_async_indexer_client_search_transactions_raises(self, mocker):
+        session = _session_with_response(mocker, 500, {"message": "error"})
+        client = AsyncIndexerClient("", "http://indexer", session)
+        with pytest.raises(IndexerHTTPError) as exception:
+            asyncio.run(client.search_transactions(application_id=505))
+        assert "error" in exception.value.args
+
+    def test_aionetwork_async_indexer_client_search_transactions_for_plain_text(
+        self, mocker
+    ):
+        session = _session_with_response(mocker, 429, None, text="Too Many Requests")
+        client = AsyncIndexerClient("", "http://indexer", session)
+        with pytest.raises(IndexerHTTPError) as exception:
+            asyncio.run(client.search_transactions(application_id=505))
+        assert "Too Many Requests" in exception.value.args
+
+
+# # HELPERS
+class TestAionetworkHelpers:
+    """Testing class for :py:mod:`aionetwork` helper functions."""
+
+    # # gather_bounded
+    def test_aionetwork_gather_bounded_limits_concurrency(self):
+        running, peaks = [0], []
+
+        async def job(value):
+            running[0] += 1
+            peaks.append(running[0])
+            await asyncio.sleep(0)
+            running[0] -= 1
+            return value * 2
+
+        returned = asyncio.run(
+            gather_bounded((job(value) for value in range(10)), concurrency=3)
+        )
+        assert returned == [value * 2 for value in range(10)]
+        assert max(peaks) == 3
+
+    def test_aionetwork_gather_bounded_for_shared_semaphore(self):
+        running, peaks = [0], []
+
+        async def job(value):
+            running[0] += 1
+            peaks.append(running[0])
+            await asyncio.sleep(0)
+            running[0] -= 1
+            return value
+
+        async def gatherings():
+            semaphore = asyncio.Semaphore(3)
+            return await asyncio.gather(
+                gather_bounded((job(value) for value in range(5)), semaphore=semaphore),
+                gather_bounded((job(value) for value in range(5)), semaphore=semaphore),
+            )
+
+        returned = asyncio.run(gatherings())
+        assert returned == [list(range(5)), list(range(5))]
+        assert max(peaks) == 3
+
+    # # box_names
+    def test_aionetwork_box_names_follows_next_token(self, mocker):
+        client = mocker.MagicMock()
+        name1, name2 = b"name1", b"name2"
+        client.algod_request = mocker.AsyncMock(
+            side_effect=[
+                {
+                    "boxes": [{"name": base64.b64encode(name1).decode()}],
+                    "next-token": "token1",
+                },
+                {"boxes": [{"name": base64.b64encode(name2).decode()}]},
+            ]
+        )
+        returned = asyncio.run(box_names(client, 5050, limit=1))
+        assert returned == [name1, name2]
+        client.algod_request.assert_has_awaits(
+            [
+                mocker.call("/applications/5050/boxes", params={"max": 1}),
+                mocker.call(
+                    "/applications/5050/boxes", params={"max": 1, "next": "token1"}
+                ),
+            ]
+        )
+
+
+# # SUBCRIPTIONS
+class TestAionetworkSubscriptionsFunctions:
+    """Testing class for :py:mod:`aionetwork` subscriptions functions."""
+
+    # # fetch_subscriptions_for_address
+    def test_aionetwork_fetch_subscriptions_for_address_functionality(self, mocker):
+        client = mocker.MagicMock()
+        address = "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I"
+        responses = {
+            SUBTOPIA_INTRO_APP_ID: {
+                "value": "AAAAACuMc0sAAAAAAAAAAgAAAABnWCsBAAAAAGdp/8AAAAAAACeNAA=="
+            },
+            SUBTOPIA_CLUSTER_APP_ID: {
+                "value": "AAAAACuMejoAAAAAAAAAAgAAAABnWDPFAAAAAGd/wMUAAAAAACeNAA=="
+            },
+        }
+
+        async def box_by_name(app_id, box_name):
+            assert box_name == box_name_from_address(address)
+            if app_id not in responses:
+                raise AlgodHTTPError("box not found")
+            return responses[app_id]
+
+        client.application_box_by_name = box_by_name
+        returned = asyncio.run(fetch_subscriptions_for_address(client, address))
+        assert returned == {"Intro": 1735000000, "Cluster": 1736425669}
+
+    # # fetch_subscriptions_from_boxes
+    def test_aionetwork_fetch_subscriptions_from_boxes_functionality(self, mocker):
+        client = mocker.MagicMock()
+        name1 = "cQWUzn1mozSwFjfbuIUJlTjN/dz4zHUs60ey06uw/kY="
+        name2 = "UaclYCXAuWPiHXrf8oGGJP7qWeTwM3TaAFTYJHAsz4o="
+        boxes = {
+            SUBTOPIA_INTRO_APP_ID: {"boxes": [{"name": name1}, {"name": name2}]},
+            SUBTOPIA_ASASTATSER_APP_ID: {"boxes": [{"name": name2}]},
+        }
+        client.algod_request = mocker.AsyncMock(
+            side_effect=lambda path, params: boxes.get(
+                int(path.split("/")[2]), {"boxes": []}
+            )
+        )
+        active = {"value": "AAAAACuMe5cAAAAAAAAAAgAAAABnWDVkAAAAAAAAAAAAAAAAAAAAAA=="}
+        expired = {"value": "AAAAACuMc0sAAAAAAAAAAgAAAABnWCsBAAAAAGdp/8AAAAAAACeNAA=="}
+        values = {
+            (SUBTOPIA_INTRO_APP_ID, base64.b64decode(name1)): active,
+            (SUBTOPIA_INTRO_APP_ID, base64.b64decode(name2)): expired,
+            (SUBTOPIA_ASASTATSER_APP_ID, base64.b64decode(name2)): active,
+        }
+        client.application_box_by_name = mocker.AsyncMock(
+            side_effect=lambda app_id, box_name: values[(app_id, box_name)]
+        )
+        with mock.patch("network.datetime") as mocked_datetime:
+            mocked_datetime.now.return_value.timestamp.return_value = 1736000000
+            returned = asyncio.run(fetch_subscriptions_from_boxes(client))
+        assert returned == {
+            "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I": [
+                (2500000000, 2329968943)
+            ],
+            "KGTSKYBFYC4WHYQ5PLP7FAMGET7OUWPE6AZXJWQAKTMCI4BMZ6FGCPSHPQ": [
+                (18000000000, 23299689438)
+            ],
+        }
+        assert client.application_box_by_name.await_count == 3
+
+
+# #  STAKING
+class TestAionetworkStakingFunctions:
+    """Testing class for :py:mod:`aionetwork` governance staking functions."""
+
+    # # current_governance_staking_for_address
+    def test_aionetwork_current_governance_staking_for_address_no_staking(self, mocker):
+        client = mocker.MagicMock()
+        client.account_info = mocker.AsyncMock()
+        returned = asyncio.run(
+            current_governance_staking_for_address(client, "address")
+        )
+        assert returned == 0
+        client.account_info.assert_not_awaited()
+
+    def test_aionetwork_current_governance_staking_for_address_for_error(self, mocker):
+        client = mocker.MagicMock()
+        client.account_info = mocker.AsyncMock(side_effect=AlgodHTTPError(""))
+        returned = asyncio.run(
+            current_governance_staking_for_address(
+                client, "address", staking_key=STAKING_KEY
+            )
+        )
+        assert returned == 0
+
+    def test_aionetwork_current_governance_staking_for_address_functionality(
+        self, mocker
+    ):
+        client = mocker.MagicMock()
+        state = {
+            "id": STAKING_APP_ID,
+            "key-value": [
+                {
+                    "key": "AA==",
+                    "value": {
+                        "bytes": "AQAAAAAL68IAAQAAAAAAACMnAQAAAAABYspUAQAAAAAAAA"
+                        "AAAAAAAAAAAAAAAAAAABXBdBEic6PeGeRg",
+                        "type": 1,
+                        "uint": 0,
+                    },
+                }
+            ],
+        }
+        client.account_info = mocker.AsyncMock(
+            return_value={"apps-local-state": [{"id": 505}, state]}
+        )
+        returned = asyncio.run(
+            current_governance_staking_for_address(
+                client, "address", staking_key=STAKING_KEY
+            )
+        )
+        assert returned == 200000000
+        client.account_info.assert_awaited_once_with("address")
+
+    # # governance_stakings
+    def test_aionetwork_governance_stakings_functionality(self, mocker):
+        client = mocker.MagicMock()
+        mocked_staking = mocker.patch(
+            "aionetwork.current_governance_staking_for_address",
+            new_callable=mocker.AsyncMock,
+            side_effect=[100, 0],
+        )
+        returned = asyncio.run(
+            governance_stakings(client, ["address1", "address2"], staking_key="AA==")
+        )
+        assert returned == {"address1": 100, "address2": 0}
+        assert mocked_staking.await_count == 2
+
+
+# # INDEXER
+class TestAionetworkIndexerFunctions:
+    """Testing class for :py:mod:`aionetwork` indexer functions."""
+
+    # # _application_transactions
+    def test_aionetwork_application_transactions_retries_on_error(self, mocker):
+        indexer_client = mocker.MagicMock()
+        indexer_client.search_transactions = mocker.AsyncMock(
+            side_effect=[Exception("error"), {"transactions": []}]
+        )
+        mocker.patch("aionetwork.asyncio.sleep", new_callable=mocker.AsyncMock)
+        mocker.patch("builtins.print")
+        params = {"application_id": 505}
+        returned = asyncio.run(
+            _application_transactions(params, indexer_client, next_page="abc")
+        )
+        assert returned == {"transactions": []}
+        indexer_client.search_transactions.assert_awaited_with(
+            application_id=505, next_page="abc"
+        )
+        assert params == {"application_id": 505}
+
+    def test_aionetwork_application_transactions_exits_for_max_retries(self, mocker):
+        indexer_client = mocker.MagicMock()
+        indexer_client.search_transactions = mocker.AsyncMock(
+            side_effect=Exception("error")
+        )
+        mocker.patch("aionetwork.asyncio.sleep", new_callable=mocker.AsyncMock)
+        mocker.patch("builtins.print")
+        returned = asyncio.run(_application_transactions({}, indexer_client, retries=2))
+        assert returned == {}
+        assert indexer_client.search_transactions.await_count == 3
+
+    # # application_transaction
+    def test_aionetwork_application_transaction_functionality(self, mocker):
+        indexer_client = mocker.MagicMock()
+        transaction1, transaction2, transaction3 = {"id": 1}, {"id": 2}, {"id": 3}
+        indexer_client.search_transactions = mocker.AsyncMock(
+            side_effect=[
+                {"transactions": [transaction1, transaction2], "next-token": "abc"},
+                {"transactions": [transaction3], "next-token": "def"},
+                {"transactions": []},
+            ]
+        )
+
+        async def collect():
+            return [
+                transaction
+                async for transaction in application_transaction({}, indexer_client)
+            ]
+
+        returned = asyncio.run(collect())
+        assert returned == [transaction1, transaction2, transaction3]
+        indexer_client.search_transactions.assert_awaited_with(next_page="def")
+
+
+# # PERMISSION DAPP
+class TestAionetworkPermissionDappFunctions:
+    """Testing class for :py:mod:`aionetwork` Permission dApp functions."""
+
+    # # deserialized_permission_dapp_box_value
+    def test_aionetwork_deserialized_permission_dapp_returns_none_for_no_box(
+        self, mocker
+    ):
+        client = mocker.MagicMock()
+        client.application_box_by_name = mocker.AsyncMock(
+            side_effect=AlgodHTTPError("box not found")
+        )
+        returned = asyncio.run(
+            deserialized_permission_dapp_box_value(client, 505, b"name")
+        )
+        assert returned is None
+
+    def test_aionetwork_deserialized_permission_dapp_raises_for_other_errors(
+        self, mocker
+    ):
+        client = mocker.MagicMock()
+        client.application_box_by_name = mocker.AsyncMock(
+            side_effect=AlgodHTTPError("foo bar")
+        )
+        with pytest.raises(AlgodHTTPError):
+            asyncio.run(deserialized_permission_dapp_box_value(client, 505, b"name"))
+
+    def test_aionetwork_deserialized_permission_dapp_box_value_functionality(
+        self, mocker
+    ):
+        client = mocker.MagicMock()
+        value = (
+            "QUFBQUFBQUhvU0FBQUFCMGFsS0lBQUFBQUFBQUFBQUFBQUFBQUFB"
+            "QUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFkR3BTaUFBRQ=="
+        )
+        client.application_box_by_name = mocker.AsyncMock(return_value={"value": value})
+        returned = asyncio.run(
+            deserialized_permission_dapp_box_value(client, 505, b"name")
+        )
+        assert returned == [500000, 500000000000, 0, 0, 0, 0, 500000000000, 4]
+        client.application_box_by_name.assert_awaited_once_with(505, b"name")
+
+    # # permission_dapp_values_from_boxes
+    def test_aionetwork_permission_dapp_values_from_boxes_raises_for_no_app_id(
+        self, mocker
+    ):
+        with pytest.raises(ValueError) as exception:
+            asyncio.run(permission_dapp_values_from_boxes(mocker.MagicMock(), None))
+        assert str(exception.value) == "Permission dApp ID isn't set!"
+
+    def test_aionetwork_permission_dapp_values_from_boxes_functionality(self, mocker):
+        client = mocker.MagicMock()
+        names = [
+            "kh+jKvvPrg8LnAjH5OrWstXqJLucdZLRBUJCtsuFyBQ=",
+            "hBV+y5sLUru3xZ5GdkhVkl+dL5901V/Jxvh+YzNG3JE=",
+        ]
+        client.algod_request = mocker.AsyncMock(
+            return_value={"boxes": [{"name": name} for name in names]}
+        )
+        mocker.patch(
+            "aionetwork.deserialized_permission_dapp_box_value",
+            new_callable=mocker.AsyncMock,
+            side_effect=[[1, 2], None],
+        )
+        returned = asyncio.run(permission_dapp_values_from_boxes(client, 5050))
+        assert returned == {
+            "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU": [1, 2]
+        }
+        client.algod_request.assert_awaited_once_with(
+            "/applications/5050/boxes", params={"max": BOXES_PAGE_LIMIT}
+        )
+
+    # # permission_dapp_snapshot
+    def test_aionetwork_permission_dapp_snapshot_shares_semaphore(self, mocker):
+        mocker.patch(
+            "aionetwork.environment_variables",
+            return_value={"algod_token_testnet": "", "algod_address_testnet": "x"},
+        )
+        mocker.patch("aionetwork.permission_dapp_id", return_value=5050)
+        mocker.patch("aionetwork.client_session", return_value=mocker.AsyncMock())
+        mocked_values = mocker.patch(
+            "aionetwork.permission_dapp_values_from_boxes",
+            new_callable=mocker.AsyncMock,
+            return_value={"address1": [1, 2]},
+        )
+        mocked_subscriptions = mocker.patch(
+            "aionetwork.fetch_subscriptions_from_boxes",
+            new_callable=mocker.AsyncMock,
+            return_value={"address2": [(100, 10)]},
+        )
+        returned = asyncio.run(permission_dapp_snapshot(concurrency=7))
+        assert returned == [{"address1": [1, 2]}, {"address2": [(100, 10)]}]
+        semaphore = mocked_values.await_args.kwargs["semaphore"]
+        assert mocked_subscriptions.await_args.kwargs["semaphore"] is semaphore
+        assert semaphore._value == 7
@@ -0,0 +1,158 @@
+"""Testing module for :py:mod:`analytics` module."""
+
+import numpy as np
+
+from analytics import (
+    DOCS_DTYPE,
+    HEADER_DTYPE,
+    decode_snapshot,
+    docs_permissions,
+    snapshot_from_mirror,
+    staking_tiers_histogram,
+    subscription_tiers_histogram,
+    top_permissions,
+    total_permission,
+)
+from helpers import (
+    deserialize_values_data,
+    serialize_raw_values,
+    serialize_values,
+)
+from mirror import mirror_connection
+
+ADDRESS1 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+ADDRESS2 = "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U"
+ADDRESS3 = "YCUJYAHIBMQKZT4YAA2LOBKXGDAFLQNFJNLOUFY6L57CL7PQLAAYCLLV2A"
+
+VALUES1 = [10, 3000, 2_500_000_000, 2329968943, 0, 0, 1000, 1, 2000, 2]
+VALUES2 = [0, 5000, 0, 0, 600_000_000_000, 5000, 0, 0]
+VALUES3 = [0, 7000, 38_000_000_000, 7000, 500_000_000_000, 0]
+
+
+def _snapshot_data():
+    return {
+        ADDRESS1: serialize_values(VALUES1),
+        ADDRESS2: serialize_values(VALUES2),
+        ADDRESS3: serialize_values(VALUES3),
+    }
+
+
+class TestAnalyticsSnapshotFunctions:
+    """Testing class for :py:mod:`analytics` snapshot functions."""
+
+    # # HEADER_DTYPE
+    def test_analytics_dtypes_sizes(self):
+        assert HEADER_DTYPE.itemsize == 48
+        assert HEADER_DTYPE.names == (
+            "votes",
+            "permission",
+            "subscription_amount",
+            "subscription_permission",
+            "staking_amount",
+            "staking_permission",
+        )
+        assert DOCS_DTYPE.itemsize == 9
+
+    # # decode_snapshot
+    def test_analytics_decode_snapshot_for_no_data(self):
+        returned = decode_snapshot({})
+        assert len(returned["addresses"]) == 0
+        assert len(returned["header"]) == 0
+        assert len(returned["docs"]) == 0
+        assert list(returned["offsets"]) == [0]
+
+    def test_analytics_decode_snapshot_functionality(self):
+        data = _snapshot_data()
+        returned = decode_snapshot(data)
+        assert list(returned["addresses"]) == [ADDRESS1, ADDRESS2, ADDRESS3]
+        assert list(returned["offsets"]) == [0, 2, 3, 3]
+        assert list(returned["docs"]["amount"]) == [1000, 2000, 0]
+        assert list(returned["docs"]["doc_index"]) == [1, 2, 0]
+        for position, address in enumerate(returned["addresses"]):
+            start, end = returned["offsets"][position : position + 2]
+            values = list(returned["header"][position].tolist()) + [
+                value for pair in returned["docs"][start:end].tolist() for value in pair
+            ]
+            assert values == deserialize_values_data(data[address])
+
+    def test_analytics_decode_snapshot_for_raw_values(self):
+        data = _snapshot_data()
+        raw_data = {
+            ADDRESS1: serialize_raw_values(VALUES1),
+            ADDRESS2: data[ADDRESS2],
+            ADDRESS3: serialize_raw_values(VALUES3),
+        }
+        returned = decode_snapshot(raw_data)
+        expected = decode_snapshot(data)
+        assert list(returned["offsets"]) == list(expected["offsets"])
+        assert returned["header"].tobytes() == expected["header"].tobytes()
+        assert returned["docs"].tobytes() == expected["docs"].tobytes()
+
+    # # snapshot_from_mirror
+    def test_analytics_snapshot_from_mirror_functionality(self):
+        connection = mirror_connection(path=":memory:")
+        connection.executemany(
+            "INSERT INTO boxes (name, address, value, data, round) "
+            "VALUES (?, ?, ?, '[]', 0)",
+            [
+                (address.encode(), address, value.encode())
+                for address, value in _snapshot_data().items()
+            ],
+        )
+        returned = snapshot_from_mirror(connection)
+        connection.close()
+        assert list(returned["addresses"]) == sorted([ADDRESS1, ADDRESS2, ADDRESS3])
+        assert total_permission(returned) == 15000
+
+
+class TestAnalyticsAggregatesFunctions:
+    """Testing class for :py:mod:`analytics` aggregates functions."""
+
+    # # docs_permissions
+    def test_analytics_docs_permissions_functionality(self):
+        returned = docs_permissions(decode_snapshot(_snapshot_data()))
+        assert returned.dtype == np.uint64
+        assert list(returned) == [3000, 0, 0]
+
+    # # staking_tiers_histogram
+    def test_analytics_staking_tiers_histogram_functionality(self):
+        returned = staking_tiers_histogram(decode_snapshot(_snapshot_data()))
+        assert list(returned) == [2, 1, 0, 0]
+
+    # # subscription_tiers_histogram
+    def test_analytics_subscription_tiers_histogram_functionality(self):
+        returned = subscription_tiers_histogram(decode_snapshot(_snapshot_data()))
+        assert returned == {
+            "Intro": 1,
+            "Asastatser": 0,
+            "Professional": 1,
+            "Cluster": 0,
+        }
+
+    def test_analytics_subscription_tiers_histogram_for_multiple_tiers(self):
+        data = {
+            ADDRESS1: serialize_raw_values([0, 0, 20_500_000_000, 0, 0, 0]),
+            ADDRESS2: serialize_raw_values([0, 0, 540_500_000_000, 0, 0, 0]),
+            ADDRESS3: serialize_raw_values([0, 0, 18_000_000_000, 0, 0, 0]),
+        }
+        returned = subscription_tiers_histogram(decode_snapshot(data))
+        assert returned == {
+            "Intro": 2,
+            "Asastatser": 2,
+            "Professional": 1,
+            "Cluster": 1,
+        }
+
+    # # top_permissions
+    def test_analytics_top_permissions_functionality(self):
+        returned = top_permissions(decode_snapshot(_snapshot_data()), count=2)
+        assert returned == [(ADDRESS3, 7000), (ADDRESS2, 5000)]
+
+    def test_analytics_top_permissions_for_count_greater_than_size(self):
+        returned = top_permissions(decode_snapshot(_snapshot_data()))
+        assert returned == [(ADDRESS3, 7000), (ADDRESS2, 5000), (ADDRESS1, 3000)]
+
+    # # total_permission
+    def test_analytics_total_permission_functionality(self):
+        returned = total_permission(decode_snapshot(_snapshot_data()))
+        assert returned == 15000
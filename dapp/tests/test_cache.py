@@ -0,0 +1,244 @@
+"""Testing module for :py:mod:`cache` module."""
+
+from algosdk.transaction import SuggestedParams
+
+from cache import (
+    NotSubscribedCache,
+    PermissionValuesCache,
+    SuggestedParamsCache,
+    not_subscribed_cache,
+    permission_values_cache,
+    suggested_params_cache,
+)
+from configuration import (
+    PERMISSION_CACHE_NOT_FOUND_TTL,
+    PERMISSION_CACHE_SIZE,
+    PERMISSION_CACHE_TTL,
+    SUBSCRIPTION_CACHE_NOT_FOUND_TTL,
+    SUBSCRIPTION_CACHE_SIZE,
+    SUGGESTED_PARAMS_MAX_AGE,
+    SUGGESTED_PARAMS_ROUND_TIME,
+    SUGGESTED_PARAMS_SAFETY_ROUNDS,
+)
+
+ADDRESS1 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+ADDRESS2 = "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U"
+ADDRESS3 = "YCUJYAHIBMQKZT4YAA2LOBKXGDAFLQNFJNLOUFY6L57CL7PQLAAYCLLV2A"
+
+
+def _suggested_params(first=1000, last=2000, fee=0):
+    return SuggestedParams(
+        fee, first, last, "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI="
+    )
+
+
+class TestCachePermissionValuesCache:
+    """Testing class for :py:mod:`cache.PermissionValuesCache` class."""
+
+    # # PermissionValuesCache
+    def test_cache_permission_values_cache_default_limits(self):
+        cache = PermissionValuesCache()
+        assert cache.size == PERMISSION_CACHE_SIZE
+        assert cache.ttl == PERMISSION_CACHE_TTL
+        assert cache.not_found_ttl == PERMISSION_CACHE_NOT_FOUND_TTL
+        assert len(cache) == 0
+
+    def test_cache_permission_values_cache_module_instance(self):
+        assert isinstance(permission_values_cache, PermissionValuesCache)
+
+    def test_cache_permission_values_cache_get_for_missing_entry(self):
+        cache = PermissionValuesCache()
+        assert cache.get(5050, ADDRESS1) == (False, None)
+
+    def test_cache_permission_values_cache_set_and_get(self):
+        cache = PermissionValuesCache()
+        values = [1, 2, 3]
+        cache.set(5050, ADDRESS1, values)
+        values.append(4)
+        returned = cache.get(5050, ADDRESS1)
+        assert returned == (True, [1, 2, 3])
+        returned[1].append(5)
+        assert cache.get(5050, ADDRESS1) == (True, [1, 2, 3])
+        assert cache.get(505, ADDRESS1) == (False, None)
+
+    def test_cache_permission_values_cache_stores_not_found(self):
+        cache = PermissionValuesCache()
+        cache.set(5050, ADDRESS1, None)
+        assert cache.get(5050, ADDRESS1) == (True, None)
+
+    def test_cache_permission_values_cache_expires_entries(self, mocker):
+        mocked_time = mocker.patch("cache.time.monotonic", return_value=1000)
+        cache = PermissionValuesCache(ttl=60, not_found_ttl=5)
+        cache.set(5050, ADDRESS1, [1, 2])
+        cache.set(5050, ADDRESS2, None)
+        mocked_time.return_value = 1004
+        assert cache.get(5050, ADDRESS1) == (True, [1, 2])
+        assert cache.get(5050, ADDRESS2) == (True, None)
+        mocked_time.return_value = 1005
+        assert cache.get(5050, ADDRESS1) == (True, [1, 2])
+        assert cache.get(5050, ADDRESS2) == (False, None)
+        mocked_time.return_value = 1060
+        assert cache.get(5050, ADDRESS1) == (False, None)
+        assert len(cache) == 0
+
+    def test_cache_permission_values_cache_evicts_least_recently_used(self):
+        cache = PermissionValuesCache(size=2)
+        cache.set(5050, ADDRESS1, [1])
+        cache.set(5050, ADDRESS2, [2])
+        cache.get(5050, ADDRESS1)
+        cache.set(5050, ADDRESS3, [3])
+        assert len(cache) == 2
+        assert cache.get(5050, ADDRESS1) == (True, [1])
+        assert cache.get(5050, ADDRESS2) == (False, None)
+        assert cache.get(5050, ADDRESS3) == (True, [3])
+
+    def test_cache_permission_values_cache_invalidate(self):
+        cache = PermissionValuesCache()
+        cache.set(5050, ADDRESS1, [1])
+        cache.set(5050, ADDRESS2, [2])
+        cache.invalidate(5050, ADDRESS1)
+        cache.invalidate(5050, ADDRESS3)
+        assert cache.get(5050, ADDRESS1) == (False, None)
+        assert cache.get(5050, ADDRESS2) == (True, [2])
+
+    def test_cache_permission_values_cache_clear(self):
+        cache = PermissionValuesCache()
+        cache.set(5050, ADDRESS1, [1])
+        cache.set(5050, ADDRESS2, None)
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestCacheNotSubscribedCache:
+    """Testing class for :py:mod:`cache.NotSubscribedCache` class."""
+
+    # # NotSubscribedCache
+    def test_cache_not_subscribed_cache_default_limits(self):
+        cache = NotSubscribedCache()
+        assert cache.size == SUBSCRIPTION_CACHE_SIZE
+        assert cache.ttl == SUBSCRIPTION_CACHE_NOT_FOUND_TTL
+        assert len(cache) == 0
+
+    def test_cache_not_subscribed_cache_module_instance(self):
+        assert isinstance(not_subscribed_cache, NotSubscribedCache)
+
+    def test_cache_not_subscribed_cache_set_and_get(self):
+        cache = NotSubscribedCache()
+        assert cache.get(5050, ADDRESS1) is False
+        cache.set(5050, ADDRESS1)
+        assert cache.get(5050, ADDRESS1) is True
+        assert cache.get(505, ADDRESS1) is False
+
+    def test_cache_not_subscribed_cache_expires_entries(self, mocker):
+        mocked_time = mocker.patch("cache.time.monotonic", return_value=1000)
+        cache = NotSubscribedCache(ttl=300)
+        cache.set(5050, ADDRESS1)
+        mocked_time.return_value = 1299
+        assert cache.get(5050, ADDRESS1) is True
+        mocked_time.return_value = 1300
+        assert cache.get(5050, ADDRESS1) is False
+        assert len(cache) == 0
+
+    def test_cache_not_subscribed_cache_evicts_least_recently_used(self):
+        cache = NotSubscribedCache(size=2)
+        cache.set(5050, ADDRESS1)
+        cache.set(5050, ADDRESS2)
+        cache.get(5050, ADDRESS1)
+        cache.set(5050, ADDRESS3)
+        assert len(cache) == 2
+        assert cache.get(5050, ADDRESS1) is True
+        assert cache.get(5050, ADDRESS2) is False
+        assert cache.get(5050, ADDRESS3) is True
+
+    def test_cache_not_subscribed_cache_invalidate_and_clear(self):
+        cache = NotSubscribedCache()
+        cache.set(5050, ADDRESS1)
+        cache.set(5050, ADDRESS2)
+        cache.invalidate(5050, ADDRESS1)
+        cache.invalidate(5050, ADDRESS3)
+        assert cache.get(5050, ADDRESS1) is False
+        assert cache.get(5050, ADDRESS2) is True
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestCacheSuggestedParamsCache:
+    """Testing class for :py:mod:`cache.SuggestedParamsCache` class."""
+
+    # # SuggestedParamsCache
+    def test_cache_suggested_params_cache_default_limits(self):
+        cache = SuggestedParamsCache()
+        assert cache.max_age == SUGGESTED_PARAMS_MAX_AGE
+        assert cache.round_time == SUGGESTED_PARAMS_ROUND_TIME
+        assert cache.safety_rounds == SUGGESTED_PARAMS_SAFETY_ROUNDS
+
+    def test_cache_suggested_params_cache_module_instance(self):
+        assert isinstance(suggested_params_cache, SuggestedParamsCache)
+
+    def test_cache_suggested_params_cache_get_reuses_params(self, mocker):
+        client = mocker.MagicMock()
+        params = _suggested_params()
+        client.suggested_params.return_value = params
+        cache = SuggestedParamsCache()
+        returned1, returned2 = cache.get(client), cache.get(client)
+        client.suggested_params.assert_called_once_with()
+        assert returned1 is not params and returned2 is not returned1
+        assert (returned1.first, returned1.last, returned1.gh) == (
+            1000,
+            2000,
+            params.gh,
+        )
+        returned1.flat_fee, returned1.fee = True, 1000
+        assert cache.get(client).fee == params.fee
+
+    def test_cache_suggested_params_cache_get_per_node(self, mocker):
+        client1, client2 = mocker.MagicMock(), mocker.MagicMock()
+        client1.suggested_params.return_value = _suggested_params()
+        client2.suggested_params.return_value = _suggested_params(first=5)
+        cache = SuggestedParamsCache()
+        assert cache.get(client1).first == 1000
+        assert cache.get(client2).first == 5
+
+    def test_cache_suggested_params_cache_refreshes_for_max_age(self, mocker):
+        mocked_time = mocker.patch("cache.time.monotonic", return_value=100)
+        client = mocker.MagicMock()
+        client.suggested_params.side_effect = [
+            _suggested_params(),
+            _suggested_params(first=1022, last=2022),
+        ]
+        cache = SuggestedParamsCache(max_age=60, round_time=3, safety_rounds=10)
+        assert cache.get(client).first == 1000
+        mocked_time.return_value = 159
+        assert cache.get(client).first == 1000
+        mocked_time.return_value = 160
+        assert cache.get(client).first == 1022
+        assert client.suggested_params.call_count == 2
+
+    def test_cache_suggested_params_cache_refreshes_for_validity_window(self, mocker):
+        mocked_time = mocker.patch("cache.time.monotonic", return_value=100)
+        client = mocker.MagicMock()
+        client.suggested_params.side_effect = [
+            _suggested_params(first=1000, last=1020),
+            _suggested_params(first=1004, last=1024),
+        ]
+        cache = SuggestedParamsCache(max_age=60, round_time=3, safety_rounds=10)
+        assert cache.get(client).first == 1000
+        mocked_time.return_value = 129
+        assert cache.get(client).first == 1000
+        mocked_time.return_value = 130
+        assert cache.get(client).first == 1004
+
+    def test_cache_suggested_params_cache_invalidate(self, mocker):
+        client1, client2 = mocker.MagicMock(), mocker.MagicMock()
+        client1.suggested_params.return_value = _suggested_params()
+        client2.suggested_params.return_value = _suggested_params()
+        cache = SuggestedParamsCache()
+        cache.get(client1), cache.get(client2)
+        cache.invalidate(client1)
+        cache.get(client1), cache.get(client2)
+        assert client1.suggested_params.call_count == 2
+        assert client2.suggested_params.call_count == 1
+        cache.invalidate()
+        cache.get(client1), cache.get(client2)
+        assert client1.suggested_params.call_count == 3
+        assert client2.suggested_params.call_count == 2
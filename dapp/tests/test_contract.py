@@ -7,7 +7,7 @@ import pytest
 from algopy import arc4
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
-from contract import PermissionDApp
+from contract import BoxEntry, PermissionDApp, RawBoxEntry
 
 
 def _app(context: AlgopyTestContext, contract: PermissionDApp):
@@ -15,6 +15,26 @@ def _app(context: AlgopyTestContext, contract: PermissionDApp):
     return context.ledger.get_app(contract)
 
 
+def _boxes(box_names, values):
+    """Return ARC4 array of box name and value pairs for `write_boxes` calls."""
+    return arc4.DynamicArray[BoxEntry](
+        *[
+            BoxEntry((arc4.DynamicBytes(box_name), arc4.String(value)))
+            for box_name, value in zip(box_names, values)
+        ]
+    )
+
+
+def _raw_boxes(box_names, values):
+    """Return ARC4 array of box name and raw value pairs for `write_boxes_raw`."""
+    return arc4.DynamicArray[RawBoxEntry](
+        *[
+            RawBoxEntry((arc4.DynamicBytes(box_name), arc4.DynamicBytes(value)))
+            for box_name, value in zip(box_names, values)
+        ]
+    )
+
+
 @pytest.fixture()
 def context() -> Generator[AlgopyTestContext, None, None]:
     """Fixture to provide a testing context."""
@@ -220,6 +240,44 @@ class TestPermissionDApp:
         box_content = context.ledger.get_box(app.id, box_name)
         assert box_content == value2.encode("utf-8")
 
+    def test_permission_dapp_write_box_replaces_same_length_in_place(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        app = _app(context, contract)
+        box_name = context.any.bytes(32)
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_box(arc4.DynamicBytes(box_name), arc4.String("value_1"))
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_box(arc4.DynamicBytes(box_name), arc4.String("value_2"))
+
+        assert context.ledger.get_box(app.id, box_name) == b"value_2"
+
+    def test_permission_dapp_write_box_resizes_for_different_length(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        app = _app(context, contract)
+        box_name = context.any.bytes(32)
+
+        for value in ("short", "a_much_longer_value", "tiny"):
+            with context.txn.create_group(active_txn_overrides={"sender": creator}):
+                contract.write_box(arc4.DynamicBytes(box_name), arc4.String(value))
+
+            assert context.ledger.get_box(app.id, box_name) == value.encode("utf-8")
+
     def test_permission_dapp_write_box_creates_new_box(
         self, context: AlgopyTestContext
     ) -> None:
@@ -249,6 +307,224 @@ class TestPermissionDApp:
         box_content = context.ledger.get_box(app.id, box_name)
         assert box_content == value.encode("utf-8")
 
+    # write_boxes
+    def test_permission_dapp_write_boxes_by_creator(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        app = _app(context, contract)
+        box_names = [context.any.bytes(32) for _ in range(3)]
+        values = ["first_value", "second_value", "third_value"]
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_boxes(_boxes(box_names, values))
+
+        for box_name, value in zip(box_names, values):
+            assert context.ledger.get_box(app.id, box_name) == value.encode("utf-8")
+
+    def test_permission_dapp_write_boxes_overwrites_existing(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        app = _app(context, contract)
+        box_name1, box_name2 = context.any.bytes(32), context.any.bytes(32)
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_box(
+                arc4.DynamicBytes(box_name1),
+                arc4.String("a_much_longer_first_value"),
+            )
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_boxes(
+                _boxes([box_name1, box_name2], ["short", "second_value"])
+            )
+
+        assert context.ledger.get_box(app.id, box_name1) == b"short"
+        assert context.ledger.get_box(app.id, box_name2) == b"second_value"
+
+    def test_permission_dapp_write_boxes_for_empty_array(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_boxes(_boxes([], []))
+
+    def test_permission_dapp_write_boxes_fails_for_non_creator(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.any.account()
+        non_creator = context.any.account()
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        boxes = _boxes([context.any.bytes(32)], ["test_value"])
+
+        with pytest.raises(AssertionError, match="Only creator can write to boxes"):
+            with context.txn.create_group(active_txn_overrides={"sender": non_creator}):
+                contract.write_boxes(boxes)
+
+    def test_permission_dapp_write_boxes_fails_for_wrong_box_size(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        boxes = _boxes(
+            [context.any.bytes(32), context.any.bytes(16)], ["value1", "value2"]
+        )
+
+        with pytest.raises(AssertionError, match="Box name must be exactly 32 bytes"):
+            with context.txn.create_group(active_txn_overrides={"sender": creator}):
+                contract.write_boxes(boxes)
+
+    # write_box_raw
+    def test_permission_dapp_write_box_raw_by_creator(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        app = _app(context, contract)
+        box_name = context.any.bytes(32)
+        value = b"\x02" + bytes(range(48))
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_box_raw(
+                arc4.DynamicBytes(box_name), arc4.DynamicBytes(value)
+            )
+
+        assert context.ledger.get_box(app.id, box_name) == value
+
+    def test_permission_dapp_write_box_raw_replaces_string_value(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        app = _app(context, contract)
+        box_name = context.any.bytes(32)
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_box(arc4.DynamicBytes(box_name), arc4.String("base64text"))
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_box_raw(
+                arc4.DynamicBytes(box_name), arc4.DynamicBytes(b"\x02\x00\x01")
+            )
+
+        assert context.ledger.get_box(app.id, box_name) == b"\x02\x00\x01"
+
+    def test_permission_dapp_write_box_raw_fails_for_non_creator(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.any.account()
+        non_creator = context.any.account()
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        with pytest.raises(AssertionError, match="Only creator can write to boxes"):
+            with context.txn.create_group(active_txn_overrides={"sender": non_creator}):
+                contract.write_box_raw(
+                    arc4.DynamicBytes(context.any.bytes(32)),
+                    arc4.DynamicBytes(b"\x02"),
+                )
+
+    def test_permission_dapp_write_box_raw_fails_for_wrong_box_size(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        with pytest.raises(AssertionError, match="Box name must be exactly 32 bytes"):
+            with context.txn.create_group(active_txn_overrides={"sender": creator}):
+                contract.write_box_raw(
+                    arc4.DynamicBytes(context.any.bytes(16)),
+                    arc4.DynamicBytes(b"\x02"),
+                )
+
+    # write_boxes_raw
+    def test_permission_dapp_write_boxes_raw_by_creator(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        app = _app(context, contract)
+        box_names = [context.any.bytes(32) for _ in range(3)]
+        values = [b"\x02" + bytes([index]) * 48 for index in range(3)]
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract.write_boxes_raw(_raw_boxes(box_names, values))
+
+        for box_name, value in zip(box_names, values):
+            assert context.ledger.get_box(app.id, box_name) == value
+
+    def test_permission_dapp_write_boxes_raw_fails_for_non_creator(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.any.account()
+        non_creator = context.any.account()
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        boxes = _raw_boxes([context.any.bytes(32)], [b"\x02"])
+
+        with pytest.raises(AssertionError, match="Only creator can write to boxes"):
+            with context.txn.create_group(active_txn_overrides={"sender": non_creator}):
+                contract.write_boxes_raw(boxes)
+
+    def test_permission_dapp_write_boxes_raw_fails_for_wrong_box_size(
+        self, context: AlgopyTestContext
+    ) -> None:
+        creator = context.default_sender
+
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            contract = PermissionDApp()
+            contract.create_application()
+
+        boxes = _raw_boxes([context.any.bytes(32), context.any.bytes(16)], [b"1", b"2"])
+
+        with pytest.raises(AssertionError, match="Box name must be exactly 32 bytes"):
+            with context.txn.create_group(active_txn_overrides={"sender": creator}):
+                contract.write_boxes_raw(boxes)
+
     # delete_box
     def test_permission_dapp_delete_box_by_creator(
         self, context: AlgopyTestContext
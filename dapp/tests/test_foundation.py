@@ -7,12 +7,14 @@ import pytest
 
 import foundation
 from configuration import (
+    BOXES_FETCHING_WORKERS,
     CURRENT_STAKING_POSITION,
     DAO_DISCUSSIONS_DOCS,
     DOCS_STARTING_POSITION,
     PERMISSION_APP_ID,
     PERMISSION_APP_ID_TESTNET,
     STAKING_DOCS,
+    WRITE_JOURNAL,
 )
 from foundation import (
     _calculate_and_update_votes_and_permissions,
@@ -24,6 +26,7 @@ from foundation import (
     _update_current_staking_for_foundation,
     _update_current_staking_for_non_foundation,
     check_and_update_permission_dapp_boxes,
+    plan_permission_dapp_boxes,
     prepare_and_write_data,
 )
 
@@ -148,6 +151,16 @@ class TestFoundationHelpersFunctions:
         mocked_client.assert_called_once_with(algod_token, algod_address)
         client.application_boxes.assert_called_once_with(PERMISSION_APP_ID)
 
+    def test_foundation_initial_check_for_resume(self, mocker):
+        client = mocker.MagicMock()
+        mocker.patch("foundation.AlgodClient", return_value=client)
+        client.application_boxes.return_value = {"boxes": [1, 2, 3, 4]}
+        env = mocker.MagicMock()
+        mocker.patch("foundation.environment_variables", return_value=env)
+        returned = _initial_check(resume=True)
+        assert returned == (env, client)
+        client.application_boxes.assert_not_called()
+
     def test_foundation_initial_check_functionality(self, mocker):
         client = mocker.MagicMock()
         mocked_client = mocker.patch("foundation.AlgodClient", return_value=client)
@@ -445,16 +458,26 @@ class TestFoundationFoundationFunctions:
         )
         mocked_data = mocker.patch("foundation._prepare_data")
         mocked_parameters = mocker.patch("foundation.box_writing_parameters")
+        mocked_contents = mocker.patch("foundation.permission_dapp_box_contents")
+        mocked_reset = mocker.patch("foundation.reset_journal")
         mocked_write = mocker.patch("foundation.write_foundation_boxes")
         prepare_and_write_data(network="mainnet")
-        mocked_initial.assert_called_once_with(network="mainnet")
+        mocked_initial.assert_called_once_with(network="mainnet", resume=False)
         mocked_data.assert_called_once_with(env, network="mainnet")
         mocked_parameters.assert_called_once_with(env, network="mainnet")
+        mocked_contents.assert_not_called()
         mocked_write.assert_called_once_with(
             client,
             PERMISSION_APP_ID,
             mocked_parameters.return_value,
             mocked_data.return_value,
+            current=None,
+            journal=Path(foundation.__file__).resolve().parent
+            / WRITE_JOURNAL.format(network="mainnet"),
+        )
+        mocked_reset.assert_called_once_with(
+            Path(foundation.__file__).resolve().parent
+            / WRITE_JOURNAL.format(network="mainnet")
         )
 
     def test_foundation_prepare_and_write_data_functionality(self, mocker):
@@ -464,18 +487,49 @@ class TestFoundationFoundationFunctions:
         )
         mocked_data = mocker.patch("foundation._prepare_data")
         mocked_parameters = mocker.patch("foundation.box_writing_parameters")
+        mocked_contents = mocker.patch("foundation.permission_dapp_box_contents")
+        mocked_reset = mocker.patch("foundation.reset_journal")
         mocked_write = mocker.patch("foundation.write_foundation_boxes")
         prepare_and_write_data()
-        mocked_initial.assert_called_once_with(network="testnet")
+        mocked_initial.assert_called_once_with(network="testnet", resume=False)
         mocked_data.assert_called_once_with(env, network="testnet")
         mocked_parameters.assert_called_once_with(env, network="testnet")
+        mocked_contents.assert_not_called()
         mocked_write.assert_called_once_with(
             client,
             PERMISSION_APP_ID_TESTNET,
             mocked_parameters.return_value,
             mocked_data.return_value,
+            current=None,
+            journal=Path(foundation.__file__).resolve().parent
+            / WRITE_JOURNAL.format(network="testnet"),
+        )
+        mocked_reset.assert_called_once_with(
+            Path(foundation.__file__).resolve().parent
+            / WRITE_JOURNAL.format(network="testnet")
         )
 
+    def test_foundation_prepare_and_write_data_for_resume(self, mocker):
+        env, client = mocker.MagicMock(), mocker.MagicMock()
+        mocked_initial = mocker.patch(
+            "foundation._initial_check", return_value=[env, client]
+        )
+        mocker.patch("foundation._prepare_data")
+        mocker.patch("foundation.box_writing_parameters")
+        mocked_contents = mocker.patch("foundation.permission_dapp_box_contents")
+        mocked_reset = mocker.patch("foundation.reset_journal")
+        mocked_write = mocker.patch("foundation.write_foundation_boxes")
+        prepare_and_write_data(resume=True)
+        mocked_initial.assert_called_once_with(network="testnet", resume=True)
+        mocked_reset.assert_not_called()
+        mocked_contents.assert_called_once_with(
+            client, PERMISSION_APP_ID_TESTNET, workers=BOXES_FETCHING_WORKERS
+        )
+        assert mocked_write.call_args.kwargs["current"] == mocked_contents.return_value
+        assert mocked_write.call_args.kwargs["journal"] == Path(
+            foundation.__file__
+        ).resolve().parent / WRITE_JOURNAL.format(network="testnet")
+
 
 # # STAKING
 class TestFoundationStakingFunctions:
@@ -608,8 +662,13 @@ class TestFoundationUpdateFunctions:
             "foundation.current_governance_staking_for_address",
             side_effect=[staking1, staking2, staking3],
         )
+        current = {address1: b"\x02data1", address2: b""}
         mocked_permissions = mocker.patch(
-            "foundation.permission_dapp_values_from_boxes"
+            "foundation.permission_dapp_box_contents", return_value=current
+        )
+        permissions = [1, 2, 3]
+        mocked_deserialize = mocker.patch(
+            "foundation.deserialize_values_data", return_value=permissions
         )
         mocked_check_subscribers = mocker.patch(
             "foundation.check_and_update_new_subscribers"
@@ -626,7 +685,9 @@ class TestFoundationUpdateFunctions:
         mocked_client.assert_has_calls(calls, any_order=True)
         assert mocked_client.call_count == 2
         mocked_parameters.assert_called_once_with(env, network="mainnet")
-        mocked_subscriptions.assert_called_once_with(client)
+        mocked_subscriptions.assert_called_once_with(
+            client, workers=BOXES_FETCHING_WORKERS
+        )
         mocked_governance.assert_called_once_with()
         calls = [
             mocker.call(mainnet_client, address1),
@@ -635,28 +696,34 @@ class TestFoundationUpdateFunctions:
         ]
         mocked_staking.assert_has_calls(calls, any_order=True)
         assert mocked_staking.call_count == 3
-        mocked_permissions.assert_called_once_with(client, PERMISSION_APP_ID)
+        mocked_permissions.assert_called_once_with(
+            client, PERMISSION_APP_ID, workers=BOXES_FETCHING_WORKERS
+        )
+        mocked_deserialize.assert_called_once_with(b"\x02data1")
         mocked_check_subscribers.assert_called_once_with(
             client,
             PERMISSION_APP_ID,
             writing_parameters,
-            mocked_permissions.return_value,
+            {address1: permissions},
             mocked_subscriptions.return_value,
+            current,
         )
         mocked_check_stakers.assert_called_once_with(
             client,
             PERMISSION_APP_ID,
             writing_parameters,
-            mocked_permissions.return_value,
+            {address1: permissions},
             {address1: staking1, address2: staking2, address3: staking3},
+            current,
         )
         mocked_check_changed.assert_called_once_with(
             client,
             PERMISSION_APP_ID,
             writing_parameters,
-            mocked_permissions.return_value,
+            {address1: permissions},
             mocked_subscriptions.return_value,
             {address1: staking1, address2: staking2, address3: staking3},
+            current,
         )
 
     def test_foundation_check_and_update_permission_dapp_boxes_functionality(
@@ -700,8 +767,13 @@ class TestFoundationUpdateFunctions:
             "foundation.current_governance_staking_for_address",
             side_effect=[staking1, staking2, staking3],
         )
+        current = {address1: b"\x02data1", address2: b""}
         mocked_permissions = mocker.patch(
-            "foundation.permission_dapp_values_from_boxes"
+            "foundation.permission_dapp_box_contents", return_value=current
+        )
+        permissions = [1, 2, 3]
+        mocked_deserialize = mocker.patch(
+            "foundation.deserialize_values_data", return_value=permissions
         )
         mocked_check_subscribers = mocker.patch(
             "foundation.check_and_update_new_subscribers"
@@ -719,7 +791,9 @@ class TestFoundationUpdateFunctions:
         mocked_client.assert_has_calls(calls, any_order=True)
         assert mocked_client.call_count == 2
         mocked_parameters.assert_called_once_with(env, network="testnet")
-        mocked_subscriptions.assert_called_once_with(client)
+        mocked_subscriptions.assert_called_once_with(
+            client, workers=BOXES_FETCHING_WORKERS
+        )
         mocked_governance.assert_called_once_with()
         calls = [
             mocker.call(mainnet_client, address1),
@@ -728,26 +802,153 @@ class TestFoundationUpdateFunctions:
         ]
         mocked_staking.assert_has_calls(calls, any_order=True)
         assert mocked_staking.call_count == 3
-        mocked_permissions.assert_called_once_with(client, PERMISSION_APP_ID_TESTNET)
+        mocked_permissions.assert_called_once_with(
+            client, PERMISSION_APP_ID_TESTNET, workers=BOXES_FETCHING_WORKERS
+        )
+        mocked_deserialize.assert_called_once_with(b"\x02data1")
         mocked_check_subscribers.assert_called_once_with(
             client,
             PERMISSION_APP_ID_TESTNET,
             writing_parameters,
-            mocked_permissions.return_value,
+            {address1: permissions},
             mocked_subscriptions.return_value,
+            current,
         )
         mocked_check_stakers.assert_called_once_with(
             client,
             PERMISSION_APP_ID_TESTNET,
             writing_parameters,
-            mocked_permissions.return_value,
+            {address1: permissions},
             {address1: staking1, address2: staking2, address3: staking3},
+            current,
         )
         mocked_check_changed.assert_called_once_with(
             client,
             PERMISSION_APP_ID_TESTNET,
             writing_parameters,
-            mocked_permissions.return_value,
+            {address1: permissions},
             mocked_subscriptions.return_value,
             {address1: staking1, address2: staking2, address3: staking3},
+            current,
         )
+
+    def test_foundation_check_and_update_permission_dapp_boxes_from_mirror(
+        self, mocker
+    ):
+        mocker.patch("foundation.environment_variables", return_value={})
+        client, mainnet_client = mocker.MagicMock(), mocker.MagicMock()
+        mocker.patch("foundation.AlgodClient", side_effect=[client, mainnet_client])
+        writing_parameters = mocker.MagicMock()
+        mocker.patch(
+            "foundation.box_writing_parameters", return_value=writing_parameters
+        )
+        mocked_fetch = mocker.patch("foundation.fetch_subscriptions_from_boxes")
+        mocker.patch("foundation.governance_staking_addresses", return_value=[])
+        connection = mocker.MagicMock()
+        mocked_connection = mocker.patch(
+            "foundation.mirror_connection", return_value=connection
+        )
+        mocked_index = mocker.patch("foundation.sync_subscriptions")
+        subscriptions = mocker.MagicMock()
+        mocked_indexed = mocker.patch(
+            "foundation.indexed_subscriptions", return_value=subscriptions
+        )
+        mocked_sync = mocker.patch("foundation.sync_mirror")
+        indexer_client = mocker.MagicMock()
+        mocked_indexer = mocker.patch(
+            "foundation.indexer_instance", return_value=indexer_client
+        )
+        permissions = mocker.MagicMock()
+        mocked_mirrored = mocker.patch(
+            "foundation.mirrored_permission_values", return_value=permissions
+        )
+        current = mocker.MagicMock()
+        mocked_current = mocker.patch(
+            "foundation.mirrored_box_contents", return_value=current
+        )
+        mocked_permissions = mocker.patch("foundation.permission_dapp_box_contents")
+        mocked_check_subscribers = mocker.patch(
+            "foundation.check_and_update_new_subscribers"
+        )
+        mocker.patch("foundation.check_and_update_new_stakers")
+        mocker.patch("foundation.check_and_update_changed_subscriptions_and_staking")
+        check_and_update_permission_dapp_boxes(network="mainnet", mirror=True)
+        mocked_connection.assert_called_once_with(network="mainnet")
+        mocked_fetch.assert_not_called()
+        mocked_index.assert_called_once_with(connection, client, indexer_client)
+        mocked_indexed.assert_called_once_with(connection)
+        mocked_indexer.assert_called_once_with(network="mainnet")
+        mocked_sync.assert_called_once_with(
+            connection, client, indexer_client, PERMISSION_APP_ID
+        )
+        mocked_current.assert_called_once_with(connection)
+        mocked_mirrored.assert_called_once_with(connection)
+        mocked_permissions.assert_not_called()
+        mocked_check_subscribers.assert_called_once_with(
+            client,
+            PERMISSION_APP_ID,
+            writing_parameters,
+            permissions,
+            subscriptions,
+            current,
+        )
+
+    # # plan_permission_dapp_boxes
+    def test_foundation_plan_permission_dapp_boxes_without_simulation(self, mocker):
+        state = {
+            "client": mocker.MagicMock(),
+            "app_id": PERMISSION_APP_ID,
+            "writing_parameters": mocker.MagicMock(),
+            "permissions": mocker.MagicMock(),
+            "subscriptions": mocker.MagicMock(),
+            "stakings": mocker.MagicMock(),
+            "current": mocker.MagicMock(),
+        }
+        mocked_state = mocker.patch(
+            "foundation._permission_dapp_boxes_state", return_value=state
+        )
+        mocked_plan = mocker.patch("foundation.box_updates_plan")
+        mocked_simulate = mocker.patch("foundation.simulate_plan")
+        mocked_save = mocker.patch("foundation.save_plan")
+        returned = plan_permission_dapp_boxes(
+            network="mainnet", mirror=True, simulate=False
+        )
+        assert returned == mocked_plan.return_value
+        mocked_state.assert_called_once_with(network="mainnet", mirror=True)
+        mocked_plan.assert_called_once_with(
+            PERMISSION_APP_ID,
+            state["permissions"],
+            state["subscriptions"],
+            state["stakings"],
+            state["current"],
+        )
+        mocked_simulate.assert_not_called()
+        mocked_save.assert_not_called()
+
+    def test_foundation_plan_permission_dapp_boxes_functionality(self, mocker):
+        state = {
+            "client": mocker.MagicMock(),
+            "app_id": PERMISSION_APP_ID_TESTNET,
+            "writing_parameters": mocker.MagicMock(),
+            "permissions": mocker.MagicMock(),
+            "subscriptions": mocker.MagicMock(),
+            "stakings": mocker.MagicMock(),
+            "current": mocker.MagicMock(),
+        }
+        mocked_state = mocker.patch(
+            "foundation._permission_dapp_boxes_state", return_value=state
+        )
+        mocked_plan = mocker.patch("foundation.box_updates_plan")
+        mocked_simulate = mocker.patch("foundation.simulate_plan")
+        mocked_save = mocker.patch("foundation.save_plan")
+        filename = mocker.MagicMock()
+        returned = plan_permission_dapp_boxes(filename=filename)
+        assert returned == mocked_simulate.return_value
+        mocked_state.assert_called_once_with(network="testnet", mirror=False)
+        mocked_simulate.assert_called_once_with(
+            state["client"],
+            state["writing_parameters"],
+            mocked_plan.return_value,
+            workers=BOXES_FETCHING_WORKERS,
+        )
+        mocked_save.assert_called_once_with(mocked_simulate.return_value, filename)
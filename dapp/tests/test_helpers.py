@@ -2,6 +2,7 @@
 
 import base64
 import json
+import struct
 from pathlib import Path
 from unittest import mock
 
@@ -10,37 +11,48 @@ import pytest
 import helpers
 from configuration import (
     INDEXER_ADDRESS,
+    INDEXER_ADDRESS_TESTNET,
     INDEXER_TOKEN,
     PERMISSION_APP_ID,
     PERMISSION_APP_ID_TESTNET,
     STAKING_APP_ID,
     STAKING_APP_MIN_ROUND,
+    VALUES_RAW_VERSION,
 )
 from contract import PermissionDApp
 from helpers import (
-    _application_transaction,
+    SubtopiaSubscription,
     _application_transactions,
-    _docs_positions_offset_and_length_pairs,
-    _extract_uint,
-    _indexer_instance,
-    _starting_positions_offset_and_length_pairs,
+    _unpack_values,
     _value_length_from_values_position,
-    _values_offset_and_length_pairs,
+    _values_count_from_size,
+    _values_struct,
     app_schemas,
+    application_transaction,
     box_name_from_address,
     box_writing_parameters,
     calculate_votes_and_permission,
     compile_program,
+    decode_values_data,
+    deserialize_box_value,
     deserialize_values_data,
     environment_variables,
     governance_staking_addresses,
+    indexer_instance,
     load_contract,
+    parse_cometa_staking_amount,
+    parse_cometa_staking_amounts,
+    parse_subtopia_box,
+    parse_subtopia_boxes,
     pause,
     permission_dapp_id,
     permission_for_amount,
     private_key_from_mnemonic,
     read_json,
+    serialize_box_values,
+    serialize_raw_values,
     serialize_values,
+    values_data_version,
     wait_for_confirmation,
 )
 
@@ -120,121 +132,6 @@ def _valid_boxes_values_and_data():
 class TestHelpersValuesFunctions:
     """Testing class for :py:mod:`helpers` values functions."""
 
-    # # _docs_positions_offset_and_length_pairs
-    @pytest.mark.parametrize(
-        "size,result",
-        [
-            (0, []),
-            (9, [(48, 8), (56, 1)]),
-            (18, [(48, 8), (56, 1), (57, 8), (65, 1)]),
-            (27, [(48, 8), (56, 1), (57, 8), (65, 1), (66, 8), (74, 1)]),
-            (
-                36,
-                [
-                    (48, 8),
-                    (56, 1),
-                    (57, 8),
-                    (65, 1),
-                    (66, 8),
-                    (74, 1),
-                    (75, 8),
-                    (83, 1),
-                ],
-            ),
-            (
-                108,
-                [
-                    (48, 8),
-                    (56, 1),
-                    (57, 8),
-                    (65, 1),
-                    (66, 8),
-                    (74, 1),
-                    (75, 8),
-                    (83, 1),
-                    (84, 8),
-                    (92, 1),
-                    (93, 8),
-                    (101, 1),
-                    (102, 8),
-                    (110, 1),
-                    (111, 8),
-                    (119, 1),
-                    (120, 8),
-                    (128, 1),
-                    (129, 8),
-                    (137, 1),
-                    (138, 8),
-                    (146, 1),
-                    (147, 8),
-                    (155, 1),
-                ],
-            ),
-        ],
-    )
-    def test_helpers_docs_positions_offset_and_length_pairs_functionality(
-        self, size, result
-    ):
-        returned = _docs_positions_offset_and_length_pairs(size)
-        assert returned == result
-
-    # # _extract_uint
-    @pytest.mark.parametrize(
-        "index,length,result",
-        [
-            (0, 8, 10000000),
-            (8, 8, 200000000),
-            (16, 8, 0),
-            (24, 8, 0),
-            (32, 8, 2000500),
-            (40, 8, 2055200),
-            (48, 8, 1000),
-            (56, 1, 1),
-            (57, 8, 1100),
-            (65, 1, 2),
-            (66, 8, 1200),
-            (74, 1, 3),
-            (75, 8, 1300),
-            (83, 1, 4),
-            (84, 8, 1400),
-            (92, 1, 5),
-            (93, 8, 1500),
-            (101, 1, 6),
-            (102, 8, 1600),
-            (110, 1, 7),
-            (111, 8, 1700),
-            (119, 1, 8),
-            (120, 8, 1800),
-            (128, 1, 9),
-            (129, 8, 1900),
-            (137, 1, 10),
-            (138, 8, 2000),
-            (146, 1, 11),
-            (147, 8, 2010),
-            (155, 1, 12),
-        ],
-    )
-    def test_helpers_extract_uint_functionality(self, index, length, result):
-        data = (
-            "AAAAAACYloAAAAAAC+vCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB6GdAAAAAAAH1wgAAAAAAA"
-            "AA+gBAAAAAAAABEwCAAAAAAAABLADAAAAAAAABRQEAAAAAAAABXgFAAAAAAAABdwGAAAAAA"
-            "AABkAHAAAAAAAABqQIAAAAAAAABwgJAAAAAAAAB2wKAAAAAAAAB9ALAAAAAAAAB9oM"
-        )
-        returned = _extract_uint(base64.b64decode(data), index, length)
-        assert returned == result
-
-    # # _starting_positions_offset_and_length_pairs
-    def test_helpers_starting_positions_offset_and_length_pairs_functionality(self):
-        returned = _starting_positions_offset_and_length_pairs()
-        assert returned == [
-            (0, 8),
-            (8, 8),
-            (16, 8),
-            (24, 8),
-            (32, 8),
-            (40, 8),
-        ]
-
     # # _value_length_from_values_position
     @pytest.mark.parametrize(
         "position,length",
@@ -259,23 +156,87 @@ class TestHelpersValuesFunctions:
         returned = _value_length_from_values_position(position)
         assert returned == length
 
-    # # _values_offset_and_length_pairs
-    def test_helpers_values_offset_and_length_pairs_functionality(self, mocker):
-        docs_data_size = mocker.MagicMock()
-        starting = [(0, 8), (8, 1)]
-        docs = [(48, 8), (56, 1)]
-        mocked_starting = mocker.patch(
-            "helpers._starting_positions_offset_and_length_pairs",
-            return_value=starting,
+    # # _unpack_values
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_unpack_values_functionality(self, values, data):
+        decoded = base64.b64decode(data)
+        assert _unpack_values(decoded) == values
+        assert _unpack_values(memoryview(decoded)) == values
+
+    # # _values_count_from_size
+    @pytest.mark.parametrize(
+        "size,count",
+        [
+            (0, 6),
+            (48, 6),
+            (56, 6),
+            (57, 8),
+            (65, 8),
+            (66, 10),
+            (183, 36),
+            (192, 36),
+            (300, 36),
+        ],
+    )
+    def test_helpers_values_count_from_size_functionality(self, size, count):
+        returned = _values_count_from_size(size)
+        assert returned == count
+
+    # # _values_struct
+    @pytest.mark.parametrize(
+        "count,struct_format",
+        [
+            (0, ">"),
+            (6, ">QQQQQQ"),
+            (7, ">QQQQQQQ"),
+            (8, ">QQQQQQQB"),
+            (10, ">QQQQQQQBQB"),
+        ],
+    )
+    def test_helpers_values_struct_functionality(self, count, struct_format):
+        returned = _values_struct(count)
+        assert returned.format == struct_format
+        assert returned.size == (
+            8 * len(struct_format.replace("B", "")[1:]) + struct_format.count("B")
         )
-        mocked_docs = mocker.patch(
-            "helpers._docs_positions_offset_and_length_pairs",
-            return_value=docs,
+
+    def test_helpers_values_struct_is_cached(self):
+        assert _values_struct(12) is _values_struct(12)
+
+    # # values_data_version
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_values_data_version_for_base64_data(self, values, data):
+        assert values_data_version(data) == 1
+        assert values_data_version(data.encode()) == 1
+
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_values_data_version_for_raw_data(self, values, data):
+        returned = values_data_version(serialize_raw_values(values))
+        assert returned == VALUES_RAW_VERSION
+
+    def test_helpers_values_data_version_for_empty_data(self):
+        assert values_data_version(b"") == 1
+
+    # # decode_values_data
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_decode_values_data_functionality(self, values, data):
+        decoded = base64.b64decode(data)
+        assert decode_values_data(data) == decoded
+        assert decode_values_data(data.encode()) == decoded
+        assert decode_values_data(serialize_raw_values(values)) == decoded
+
+    # # deserialize_box_value
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_deserialize_box_value_functionality(self, values, data):
+        returned = deserialize_box_value(base64.b64encode(data.encode()).decode())
+        assert returned == values
+
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_deserialize_box_value_for_raw_data(self, values, data):
+        returned = deserialize_box_value(
+            base64.b64encode(serialize_raw_values(values)).decode()
         )
-        returned = _values_offset_and_length_pairs(docs_data_size)
-        assert returned == starting + docs
-        mocked_starting.assert_called_once_with()
-        mocked_docs.assert_called_once_with(docs_data_size)
+        assert returned == values
 
     # # deserialize_values_data
     @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
@@ -283,12 +244,110 @@ class TestHelpersValuesFunctions:
         returned = deserialize_values_data(data)
         assert returned == values
 
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_deserialize_values_data_for_bytes(self, values, data):
+        returned = deserialize_values_data(data.encode())
+        assert returned == values
+
+    def test_helpers_deserialize_values_data_ignores_incomplete_pair(self):
+        data = base64.b64encode(
+            base64.b64decode(serialize_values([1, 2, 3, 4, 5, 6, 7, 8])) + b"\x00" * 8
+        ).decode()
+        returned = deserialize_values_data(data)
+        assert returned == [1, 2, 3, 4, 5, 6, 7, 8]
+
+    def test_helpers_deserialize_values_data_for_more_than_max_pairs(self):
+        values = [1, 2, 3, 4, 5, 6] + [1000, 1] * 16
+        returned = deserialize_values_data(serialize_values(values))
+        assert returned == values[:36]
+
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_deserialize_values_data_for_raw_data(self, values, data):
+        returned = deserialize_values_data(serialize_raw_values(values))
+        assert returned == values
+
+    # # serialize_box_values
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_serialize_box_values_functionality(self, values, data):
+        returned = serialize_box_values(values)
+        assert returned == data
+
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_serialize_box_values_for_raw_values(self, mocker, values, data):
+        mocker.patch("helpers.WRITE_RAW_VALUES", True)
+        returned = serialize_box_values(values)
+        assert returned == serialize_raw_values(values)
+
+    # # serialize_raw_values
+    @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
+    def test_helpers_serialize_raw_values_functionality(self, values, data):
+        returned = serialize_raw_values(values)
+        assert returned == bytes((VALUES_RAW_VERSION,)) + base64.b64decode(data)
+        assert len(returned) < len(data)
+
     # # serialize_values
     @pytest.mark.parametrize("values,data", _valid_boxes_values_and_data())
     def test_helpers_serialize_values_functionality(self, values, data):
         returned = serialize_values(values)
         assert returned == data
 
+    def test_helpers_serialize_values_for_unpaired_amount(self):
+        returned = serialize_values([1, 2, 3, 4, 5, 6, 7])
+        assert base64.b64decode(returned) == b"".join(
+            value.to_bytes(8, "big") for value in range(1, 8)
+        )
+
+
+# # RECORDS
+class TestHelpersRecordsFunctions:
+    """Testing class for :py:mod:`helpers` records parsing functions."""
+
+    # # parse_subtopia_box
+    def test_helpers_parse_subtopia_box_functionality(self):
+        raw = base64.b64decode(
+            "AAAAACuMc0sAAAAAAAAAAgAAAABnWCsBAAAAAGdp/8AAAAAAACeNAA=="
+        )
+        returned = parse_subtopia_box(raw)
+        assert isinstance(returned, SubtopiaSubscription)
+        assert returned == (730624843, 2, 1733831425, 1735000000, 2592000)
+        assert returned.end == 1735000000
+
+    def test_helpers_parse_subtopia_box_raises_for_invalid_size(self):
+        with pytest.raises(struct.error):
+            parse_subtopia_box(b"value")
+
+    # # parse_subtopia_boxes
+    def test_helpers_parse_subtopia_boxes_for_no_values(self):
+        assert parse_subtopia_boxes([]) == []
+
+    def test_helpers_parse_subtopia_boxes_functionality(self):
+        raws = [struct.pack(">5Q", 5050, 2, 1000, end, 500) for end in (1500, 0)]
+        returned = parse_subtopia_boxes(iter(raws))
+        assert returned == [
+            SubtopiaSubscription(5050, 2, 1000, 1500, 500),
+            SubtopiaSubscription(5050, 2, 1000, 0, 500),
+        ]
+
+    def test_helpers_parse_subtopia_boxes_raises_for_invalid_size(self):
+        raws = [bytes(39), bytes(41)]
+        with pytest.raises(ValueError) as exception:
+            parse_subtopia_boxes(raws)
+        assert str(exception.value) == "Invalid Subtopia box value size!"
+
+    # # parse_cometa_staking_amount
+    def test_helpers_parse_cometa_staking_amount_functionality(self):
+        raw = base64.b64decode("AQAAAAAL68IAAQAAAAAAACMnAQAAAAABYspU")
+        assert parse_cometa_staking_amount(raw) == 200000000
+
+    def test_helpers_parse_cometa_staking_amount_raises_for_invalid_size(self):
+        with pytest.raises(struct.error):
+            parse_cometa_staking_amount(bytes(8))
+
+    # # parse_cometa_staking_amounts
+    def test_helpers_parse_cometa_staking_amounts_functionality(self):
+        raws = [b"\x01" + struct.pack(">Q", amount) + bytes(4) for amount in (5, 0)]
+        assert parse_cometa_staking_amounts(raws) == [5, 0]
+
 
 # # CONTRACT
 class TestHelpersContractFunctions:
@@ -400,7 +459,7 @@ class TestHelpersContractFunctions:
 class TestHelpersStakingFunctions:
     """Testing class for :py:mod:`helpers` staking functions."""
 
-    # # _application_transaction
+    # # application_transaction
     def test_helpers_application_transaction_functionality_for_no_transactions(
         self, mocker
     ):
@@ -412,7 +471,7 @@ class TestHelpersStakingFunctions:
         mocked_transactions = mocker.patch(
             "helpers._application_transactions", return_value={"transactions": []}
         )
-        yielded = list(_application_transaction(params, indexer_client))
+        yielded = list(application_transaction(params, indexer_client))
         assert yielded == []
         mocked_transactions.assert_called_once_with(params, indexer_client, delay=1)
         mocked_pause.assert_not_called()
@@ -442,7 +501,7 @@ class TestHelpersStakingFunctions:
                 {"transactions": [], "next-token": mocker.MagicMock()},
             ],
         )
-        yielded = list(_application_transaction(params, indexer_client))
+        yielded = list(application_transaction(params, indexer_client))
         assert yielded == [txn1, txn2, txn3, txn4, txn5]
         mocked_pause.assert_called_with(1)
         assert mocked_pause.call_count == 2
@@ -604,15 +663,23 @@ class TestHelpersStakingFunctions:
         mocked_pause.assert_has_calls(calls, any_order=True)
         assert mocked_pause.call_count == retries * 2 + 1
 
-    # # _indexer_instance
+    # # indexer_instance
     def test_helpers_indexer_instance_functionality(self, mocker):
         mocked_indexer = mocker.patch("helpers.IndexerClient")
-        returned = _indexer_instance()
+        returned = indexer_instance()
         assert returned == mocked_indexer.return_value
         mocked_indexer.assert_called_once_with(
             INDEXER_TOKEN, INDEXER_ADDRESS, headers={"User-Agent": "algosdk"}
         )
 
+    def test_helpers_indexer_instance_for_testnet(self, mocker):
+        mocked_indexer = mocker.patch("helpers.IndexerClient")
+        returned = indexer_instance(network="testnet")
+        assert returned == mocked_indexer.return_value
+        mocked_indexer.assert_called_once_with(
+            INDEXER_TOKEN, INDEXER_ADDRESS_TESTNET, headers={"User-Agent": "algosdk"}
+        )
+
     # # governance_staking_addresses
     def test_helpers_governance_staking_addresses_functionality(self):
         returned = governance_staking_addresses()
@@ -621,7 +688,7 @@ class TestHelpersStakingFunctions:
     def test_helpers_governance_staking_addresses_for_provided_staking_app(
         self, mocker
     ):
-        mocked_indexer = mocker.patch("helpers._indexer_instance")
+        mocked_indexer = mocker.patch("helpers.indexer_instance")
         address1, address2, address3, address4, address5 = (
             "address1",
             "address2",
@@ -639,7 +706,7 @@ class TestHelpersStakingFunctions:
             {"sender": address5},
         ]
         mocked_transaction = mocker.patch(
-            "helpers._application_transaction", return_value=txns
+            "helpers.application_transaction", return_value=txns
         )
         staking_app_id, staking_min_round = STAKING_APP_ID, STAKING_APP_MIN_ROUND
         returned = governance_staking_addresses(
@@ -17,12 +17,20 @@ from algokit_utils import (
 )
 from algokit_utils.applications import AppClient, AppClientParams
 from algosdk.account import generate_account
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
 from algosdk.error import AlgodHTTPError
 from algosdk.transaction import ApplicationDeleteTxn, ApplicationUpdateTxn
 from dotenv import load_dotenv
 
 from contract import PermissionDApp
-from helpers import compile_program, wait_for_confirmation
+from helpers import (
+    compile_program,
+    deserialize_box_value,
+    load_contract,
+    serialize_raw_values,
+    serialize_values,
+    wait_for_confirmation,
+)
 from network import box_name_from_address, create_app
 
 load_dotenv(Path(__file__).parent.parent / ".env")
@@ -455,6 +463,254 @@ class TestContractWriteBox(BaseTestContract):
         assert base64.b64decode(box_info["value"]) == value.encode("utf-8")
 
 
+class TestContractWriteBoxCost(BaseTestContract):
+    """Testing class for :class:`contract.contract.PermissionDApp` write_box costs."""
+
+    name = "write_box_cost"
+
+    def _write_box(self, creator_account, box_name, value):
+        self.permission_client.send.call(
+            AppClientMethodCallParams(
+                method="write_box",
+                args=[box_name, value],
+                sender=creator_account.address,
+                signer=creator_account.signer,
+                box_references=[box_name],
+            )
+        )
+
+    def _simulated_budget(self, creator_account, box_name, calls):
+        """Return opcode budget consumed by simulated group of method `calls`."""
+        algod = self.permission_client.algorand.client.algod
+        contract = load_contract()
+        sp = algod.suggested_params()
+        atc = AtomicTransactionComposer()
+        for method, args in calls:
+            atc.add_method_call(
+                app_id=self.permission_client.app_id,
+                method=contract.get_method_by_name(method),
+                sender=creator_account.address,
+                sp=sp,
+                signer=creator_account.signer,
+                method_args=args,
+                boxes=[(self.permission_client.app_id, box_name)],
+            )
+
+        response = atc.simulate(algod)
+        assert response.failure_message == ""
+        return response.simulate_response["txn-groups"][0]["app-budget-consumed"]
+
+    def test_contract_permission_dapp_write_box_same_length_costs_less(
+        self,
+        creator_account: SigningAccount,
+    ) -> None:
+        """Test that in place replace is cheaper than deleting and putting box."""
+        box_name = box_name_from_address(generate_account()[1])
+        self._write_box(creator_account, box_name, "value_1")
+
+        replace_budget = self._simulated_budget(
+            creator_account, box_name, [("write_box", [box_name, "value_2"])]
+        )
+        delete_and_put_budget = self._simulated_budget(
+            creator_account,
+            box_name,
+            [("delete_box", [box_name]), ("write_box", [box_name, "value_2"])],
+        )
+
+        assert replace_budget < delete_and_put_budget
+
+    def test_contract_permission_dapp_write_box_same_length_keeps_min_balance(
+        self,
+        creator_account: SigningAccount,
+    ) -> None:
+        """Test that in place update doesn't change application's minimum balance."""
+        algod = self.permission_client.algorand.client.algod
+        box_name = box_name_from_address(generate_account()[1])
+        self._write_box(creator_account, box_name, "value_1")
+        min_balance = algod.account_info(self.permission_client.app_address)[
+            "min-balance"
+        ]
+
+        self._write_box(creator_account, box_name, "value_2")
+
+        account_info = algod.account_info(self.permission_client.app_address)
+        assert account_info["min-balance"] == min_balance
+        box_info = algod.application_box_by_name(
+            self.permission_client.app_id, box_name
+        )
+        assert base64.b64decode(box_info["value"]) == b"value_2"
+
+
+class TestContractWriteBoxes(BaseTestContract):
+    """Testing class for :class:`contract.contract.PermissionDApp` write_boxes method."""
+
+    name = "write_boxes"
+
+    def test_contract_permission_dapp_write_boxes_by_creator(
+        self,
+        creator_account: SigningAccount,
+    ) -> None:
+        """Test that creator can write multiple boxes in a single call."""
+        box_names = [box_name_from_address(generate_account()[1]) for _ in range(7)]
+        values = [f"value{index}" for index in range(len(box_names))]
+
+        self.permission_client.send.call(
+            AppClientMethodCallParams(
+                method="write_boxes",
+                args=[list(zip(box_names, values))],
+                sender=creator_account.address,
+                signer=creator_account.signer,
+                box_references=box_names,
+            )
+        )
+
+        algod = self.permission_client.algorand.client.algod
+        for box_name, value in zip(box_names, values):
+            box_info = algod.application_box_by_name(
+                self.permission_client.app_id, box_name
+            )
+            assert base64.b64decode(box_info["value"]) == value.encode("utf-8")
+
+    def test_contract_permission_dapp_write_boxes_overwrites_existing(
+        self,
+        creator_account: SigningAccount,
+    ) -> None:
+        """Test that writing multiple boxes overwrites existing content."""
+        box_name = box_name_from_address(TEST_ADDRESS)
+
+        for value in ("a_much_longer_first_value", "short"):
+            self.permission_client.send.call(
+                AppClientMethodCallParams(
+                    method="write_boxes",
+                    args=[[(box_name, value)]],
+                    sender=creator_account.address,
+                    signer=creator_account.signer,
+                    box_references=[box_name],
+                )
+            )
+
+        box_info = self.permission_client.algorand.client.algod.application_box_by_name(
+            self.permission_client.app_id, box_name
+        )
+        assert base64.b64decode(box_info["value"]) == b"short"
+
+    def test_contract_permission_dapp_write_boxes_fails_for_non_creator(
+        self,
+        user_account: SigningAccount,
+    ) -> None:
+        box_name = box_name_from_address(TEST_ADDRESS)
+
+        with pytest.raises(LogicError, match="Only creator can write to boxes"):
+            self.permission_client.send.call(
+                AppClientMethodCallParams(
+                    method="write_boxes",
+                    args=[[(box_name, "test_value")]],
+                    sender=user_account.address,
+                    signer=user_account.signer,
+                    box_references=[box_name],
+                )
+            )
+
+    def test_contract_permission_dapp_write_boxes_fails_for_wrong_box_size(
+        self,
+        creator_account: SigningAccount,
+    ) -> None:
+        """Test that every box name must be exactly 32 bytes."""
+        box_name = box_name_from_address(TEST_ADDRESS)
+
+        with pytest.raises(LogicError, match="Box name must be exactly 32 bytes"):
+            self.permission_client.send.call(
+                AppClientMethodCallParams(
+                    method="write_boxes",
+                    args=[[(box_name, "value1"), (box_name[:9], "value2")]],
+                    sender=creator_account.address,
+                    signer=creator_account.signer,
+                    box_references=[box_name, box_name[:9]],
+                )
+            )
+
+
+class TestContractWriteBoxRaw(BaseTestContract):
+    """Testing class for :class:`contract.contract.PermissionDApp` raw writing methods."""
+
+    name = "write_box_raw"
+
+    def test_contract_permission_dapp_write_box_raw_by_creator(
+        self,
+        creator_account: SigningAccount,
+    ) -> None:
+        """Test that creator can write raw values replacing base64 encoded ones."""
+        box_name = box_name_from_address(TEST_ADDRESS)
+        values = [10, 3000, 0, 0, 0, 0, 1000, 1]
+
+        self.permission_client.send.call(
+            AppClientMethodCallParams(
+                method="write_box",
+                args=[box_name, serialize_values(values)],
+                sender=creator_account.address,
+                signer=creator_account.signer,
+                box_references=[box_name],
+            )
+        )
+        self.permission_client.send.call(
+            AppClientMethodCallParams(
+                method="write_box_raw",
+                args=[box_name, serialize_raw_values(values)],
+                sender=creator_account.address,
+                signer=creator_account.signer,
+                box_references=[box_name],
+            )
+        )
+
+        box_info = self.permission_client.algorand.client.algod.application_box_by_name(
+            self.permission_client.app_id, box_name
+        )
+        assert base64.b64decode(box_info["value"]) == serialize_raw_values(values)
+        assert deserialize_box_value(box_info["value"]) == values
+
+    def test_contract_permission_dapp_write_boxes_raw_by_creator(
+        self,
+        creator_account: SigningAccount,
+    ) -> None:
+        """Test that creator can write multiple raw values in a single call."""
+        box_names = [box_name_from_address(generate_account()[1]) for _ in range(8)]
+        values = [serialize_raw_values([index] * 6) for index in range(len(box_names))]
+
+        self.permission_client.send.call(
+            AppClientMethodCallParams(
+                method="write_boxes_raw",
+                args=[list(zip(box_names, values))],
+                sender=creator_account.address,
+                signer=creator_account.signer,
+                box_references=box_names,
+            )
+        )
+
+        algod = self.permission_client.algorand.client.algod
+        for box_name, value in zip(box_names, values):
+            box_info = algod.application_box_by_name(
+                self.permission_client.app_id, box_name
+            )
+            assert base64.b64decode(box_info["value"]) == value
+
+    def test_contract_permission_dapp_write_box_raw_fails_for_non_creator(
+        self,
+        user_account: SigningAccount,
+    ) -> None:
+        box_name = box_name_from_address(TEST_ADDRESS)
+
+        with pytest.raises(LogicError, match="Only creator can write to boxes"):
+            self.permission_client.send.call(
+                AppClientMethodCallParams(
+                    method="write_box_raw",
+                    args=[box_name, serialize_raw_values([0] * 6)],
+                    sender=user_account.address,
+                    signer=user_account.signer,
+                    box_references=[box_name],
+                )
+            )
+
+
 class TestContractDeleteBox(TestContractWriteBox):
     """Testing class for :class:`contract.contract.PermissionDApp` delete_box method."""
 
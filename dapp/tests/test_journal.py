@@ -0,0 +1,130 @@
+"""Testing module for :py:mod:`journal` module."""
+
+import base64
+import json
+
+from algosdk.error import AlgodHTTPError
+
+from helpers import box_name_from_address
+from journal import (
+    _current_box_content,
+    append_journal_entry,
+    confirmed_journal_writes,
+    read_journal,
+    reset_journal,
+)
+
+ADDRESS1 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+
+
+def _planned(txid, contents, app_id=5050):
+    return {"event": "planned", "app_id": app_id, "txid": txid, "contents": contents}
+
+
+def _confirmed(txid, contents, app_id=5050):
+    return {
+        "event": "confirmed",
+        "app_id": app_id,
+        "txid": txid,
+        "round": 1000,
+        "contents": contents,
+    }
+
+
+class TestJournalFunctions:
+    """Testing class for :py:mod:`journal` functions."""
+
+    # # append_journal_entry
+    def test_journal_append_journal_entry_functionality(self, tmp_path, mocker):
+        mocker.patch("journal.time.time", return_value=1700000000.5)
+        path = tmp_path / "journal.jsonl"
+        append_journal_entry(path, {"event": "planned"})
+        append_journal_entry(path, {"event": "confirmed"})
+        lines = path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"event": "planned", "time": 1700000000.5},
+            {"event": "confirmed", "time": 1700000000.5},
+        ]
+
+    # # read_journal
+    def test_journal_read_journal_for_missing_file(self, tmp_path):
+        assert read_journal(tmp_path / "journal.jsonl") == []
+
+    def test_journal_read_journal_skips_incomplete_line(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        path.write_text('{"event": "planned"}\n{"event": "conf')
+        assert read_journal(path) == [{"event": "planned"}]
+
+    # # reset_journal
+    def test_journal_reset_journal_functionality(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        append_journal_entry(path, {"event": "planned"})
+        reset_journal(path)
+        assert read_journal(path) == []
+
+    # # _current_box_content
+    def test_journal_current_box_content_functionality(self, mocker):
+        client = mocker.MagicMock()
+        client.application_box_by_name.return_value = {
+            "value": base64.b64encode(b"\x02\x01").decode()
+        }
+        assert _current_box_content(client, 5050, ADDRESS1) == "0201"
+        client.application_box_by_name.assert_called_once_with(
+            5050, box_name_from_address(ADDRESS1)
+        )
+
+    def test_journal_current_box_content_for_missing_box(self, mocker):
+        client = mocker.MagicMock()
+        client.application_box_by_name.side_effect = AlgodHTTPError("box not found")
+        assert _current_box_content(client, 5050, ADDRESS1) is None
+
+    # # confirmed_journal_writes
+    def test_journal_confirmed_journal_writes_for_missing_journal(
+        self, tmp_path, mocker
+    ):
+        client = mocker.MagicMock()
+        returned = confirmed_journal_writes(client, tmp_path / "journal.jsonl", 5050)
+        assert returned == {}
+        client.application_box_by_name.assert_not_called()
+
+    def test_journal_confirmed_journal_writes_functionality(self, tmp_path, mocker):
+        path = tmp_path / "journal.jsonl"
+        for entry in (
+            _planned("txid1", {"address1": "0201", "address2": "0202"}),
+            _confirmed("txid1", {"address1": "0201", "address2": "0202"}),
+            _planned("txid2", {"address3": "0203"}),
+            _planned("txid3", {"address4": "0204", "address7": "0207"}),
+            _planned("txid4", {"address5": "0205"}, app_id=505),
+            _confirmed("txid5", {"address6": "0206"}),
+            _planned("txid6", {"address6": "0206"}),
+        ):
+            append_journal_entry(path, entry)
+
+        contents = {"address3": "0203", "address4": "0204", "address7": "0200"}
+        mocked_content = mocker.patch(
+            "journal._current_box_content",
+            side_effect=lambda client, app_id, address: contents.get(address),
+        )
+        client = mocker.MagicMock()
+        returned = confirmed_journal_writes(client, path, 5050)
+        assert returned == {
+            "address1": "0201",
+            "address2": "0202",
+            "address3": "0203",
+            "address6": "0206",
+        }
+        mocked_content.assert_has_calls(
+            [
+                mocker.call(client, 5050, "address3"),
+                mocker.call(client, 5050, "address4"),
+                mocker.call(client, 5050, "address7"),
+            ]
+        )
+        assert mocked_content.call_count == 3
+        entry = read_journal(path)[-1]
+        assert entry["event"] == "confirmed"
+        assert entry["txid"] == "txid2"
+        assert entry["contents"] == {"address3": "0203"}
+        mocked_content.reset_mock()
+        assert confirmed_journal_writes(client, path, 5050) == returned
+        assert mocked_content.call_count == 2
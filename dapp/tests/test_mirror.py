@@ -0,0 +1,609 @@
+"""Testing module for :py:mod:`mirror` module."""
+
+import base64
+import json
+import struct
+import time
+
+import pytest
+from algosdk.encoding import encode_address
+
+from helpers import serialize_raw_values, serialize_values
+from mirror import (
+    _box_names_from_transaction,
+    _due_subscription_addresses,
+    _mirror_row,
+    _subscriptions_horizon,
+    indexed_subscriptions,
+    mirror_connection,
+    mirror_state,
+    mirrored_box_contents,
+    mirrored_box_values,
+    mirrored_permission_values,
+    refresh_mirror,
+    set_mirror_state,
+    sync_mirror,
+    sync_subscriptions,
+    sync_subscriptions_index,
+    touched_box_names,
+    update_mirror_boxes,
+    update_subscriptions_index,
+)
+
+ADDRESS1 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+BOX_NAME1 = base64.b64decode("kh+jKvvPrg8LnAjH5OrWstXqJLucdZLRBUJCtsuFyBQ=")
+ADDRESS2 = "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U"
+BOX_NAME2 = base64.b64decode("hBV+y5sLUru3xZ5GdkhVkl+dL5901V/Jxvh+YzNG3JE=")
+
+
+def _response(values, round_=100):
+    return {
+        "value": base64.b64encode(serialize_values(values).encode()).decode(),
+        "round": round_,
+    }
+
+
+@pytest.fixture
+def connection():
+    connection = mirror_connection(path=":memory:")
+    yield connection
+    connection.close()
+
+
+class TestMirrorDatabaseFunctions:
+    """Testing class for :py:mod:`mirror` database functions."""
+
+    # # mirror_connection
+    def test_mirror_mirror_connection_creates_tables(self, connection):
+        tables = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+        assert tables == {"boxes", "state", "subscriptions"}
+
+    def test_mirror_mirror_connection_default_path(self, mocker):
+        mocked_connect = mocker.patch("mirror.sqlite3.connect")
+        mirror_connection(network="mainnet")
+        path = mocked_connect.call_args[0][0]
+        assert path.name == "permission_dapp_mainnet.sqlite3"
+
+    # # mirror_state
+    def test_mirror_mirror_state_returns_default_for_no_key(self, connection):
+        assert mirror_state(connection, "synced_round") is None
+        assert mirror_state(connection, "synced_round", default=5) == 5
+
+    # # set_mirror_state
+    def test_mirror_set_mirror_state_functionality(self, connection):
+        set_mirror_state(connection, "synced_round", 1000)
+        set_mirror_state(connection, "synced_round", 1005)
+        assert mirror_state(connection, "synced_round") == 1005
+
+
+class TestMirrorBoxesFunctions:
+    """Testing class for :py:mod:`mirror` boxes functions."""
+
+    # # _mirror_row
+    def test_mirror_mirror_row_functionality(self):
+        values = [500000, 500000000000, 0, 0, 0, 0, 500000000000, 4]
+        returned = _mirror_row(BOX_NAME1, _response(values, round_=505))
+        assert returned == (
+            BOX_NAME1,
+            ADDRESS1,
+            serialize_values(values).encode(),
+            json.dumps(values),
+            505,
+        )
+
+    def test_mirror_mirror_row_for_raw_values(self):
+        values = [500000, 500000000000, 0, 0, 0, 0, 500000000000, 4]
+        response = {
+            "value": base64.b64encode(serialize_raw_values(values)).decode(),
+            "round": 505,
+        }
+        returned = _mirror_row(BOX_NAME1, response)
+        assert returned == (
+            BOX_NAME1,
+            ADDRESS1,
+            serialize_raw_values(values),
+            json.dumps(values),
+            505,
+        )
+
+    # # update_mirror_boxes
+    def test_mirror_update_mirror_boxes_writes_only_changed_rows(self, connection):
+        values1, values2 = [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]
+        returned = update_mirror_boxes(
+            connection,
+            {BOX_NAME1: _response(values1), BOX_NAME2: _response(values2)},
+        )
+        assert returned == (2, 0)
+        returned = update_mirror_boxes(
+            connection,
+            {
+                BOX_NAME1: _response(values1, round_=200),
+                BOX_NAME2: _response([0, 0, 0, 0, 0, 0], round_=200),
+            },
+        )
+        assert returned == (1, 0)
+        rounds = dict(connection.execute("SELECT address, round FROM boxes"))
+        assert rounds == {ADDRESS1: 100, ADDRESS2: 200}
+        assert mirrored_permission_values(connection) == {
+            ADDRESS1: values1,
+            ADDRESS2: [0, 0, 0, 0, 0, 0],
+        }
+
+    def test_mirror_update_mirror_boxes_removes_not_found_boxes(self, connection):
+        update_mirror_boxes(
+            connection,
+            {
+                BOX_NAME1: _response([1, 2, 3, 4, 5, 6]),
+                BOX_NAME2: _response([1, 2, 3, 4, 5, 6]),
+            },
+        )
+        returned = update_mirror_boxes(connection, {BOX_NAME1: None})
+        assert returned == (0, 1)
+        assert list(mirrored_box_values(connection)) == [BOX_NAME2]
+
+    # # mirrored_box_contents
+    def test_mirror_mirrored_box_contents_functionality(self, connection):
+        values1, values2 = [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]
+        update_mirror_boxes(
+            connection,
+            {BOX_NAME1: _response(values1), BOX_NAME2: _response(values2)},
+        )
+        returned = mirrored_box_contents(connection)
+        assert returned == {
+            ADDRESS1: serialize_values(values1).encode(),
+            ADDRESS2: serialize_values(values2).encode(),
+        }
+
+    # # mirrored_permission_values
+    def test_mirror_mirrored_permission_values_for_address(self, connection):
+        values1, values2 = [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]
+        update_mirror_boxes(
+            connection,
+            {BOX_NAME1: _response(values1), BOX_NAME2: _response(values2)},
+        )
+        returned = mirrored_permission_values(connection, address=ADDRESS2)
+        assert returned == {ADDRESS2: values2}
+
+    # # refresh_mirror
+    def test_mirror_refresh_mirror_raises_for_no_app_id(self, connection, mocker):
+        with pytest.raises(ValueError) as exception:
+            refresh_mirror(connection, mocker.MagicMock(), None)
+        assert str(exception.value) == "Permission dApp ID isn't set!"
+
+    def test_mirror_refresh_mirror_functionality(self, connection, mocker):
+        update_mirror_boxes(connection, {BOX_NAME2: _response([1, 2, 3, 4, 5, 6])})
+        client = mocker.MagicMock()
+        client.status.return_value = {"last-round": 5000}
+        mocked_names = mocker.patch("mirror.application_box_names")
+        values = [7, 8, 9, 10, 11, 12]
+        mocked_responses = mocker.patch(
+            "mirror.permission_dapp_box_responses",
+            return_value={BOX_NAME1: _response(values)},
+        )
+        returned = refresh_mirror(connection, client, 5050, workers=4)
+        assert returned == (1, 1)
+        mocked_names.assert_called_once_with(client, 5050)
+        mocked_responses.assert_called_once_with(
+            client, 5050, mocked_names.return_value, workers=4
+        )
+        assert mirrored_permission_values(connection) == {ADDRESS1: values}
+        assert mirror_state(connection, "synced_round") == 5000
+
+
+class TestMirrorSyncFunctions:
+    """Testing class for :py:mod:`mirror` incremental sync functions."""
+
+    # # _box_names_from_transaction
+    def test_mirror_box_names_from_transaction_for_other_app(self):
+        transaction = {
+            "application-transaction": {
+                "application-id": 505,
+                "box-references": [
+                    {"app": 0, "name": base64.b64encode(BOX_NAME1).decode()}
+                ],
+            }
+        }
+        assert _box_names_from_transaction(transaction, 5050) == set()
+
+    def test_mirror_box_names_from_transaction_for_box_references(self):
+        transaction = {
+            "application-transaction": {
+                "application-id": 5050,
+                "box-references": [
+                    {"app": 0, "name": base64.b64encode(BOX_NAME1).decode()},
+                    {"app": 5050, "name": base64.b64encode(BOX_NAME2).decode()},
+                    {"app": 505, "name": "AA=="},
+                    {"app": 0, "name": ""},
+                ],
+            }
+        }
+        returned = _box_names_from_transaction(transaction, 5050)
+        assert returned == {BOX_NAME1, BOX_NAME2}
+
+    def test_mirror_box_names_from_transaction_for_arguments(self):
+        argument = base64.b64encode(b"\x00\x20" + BOX_NAME1).decode()
+        transaction = {
+            "application-transaction": {
+                "application-id": 5050,
+                "application-args": ["AAAAAA==", argument],
+            }
+        }
+        returned = _box_names_from_transaction(transaction, 5050)
+        assert returned == {BOX_NAME1}
+
+    def test_mirror_box_names_from_transaction_for_invalid_arguments(self):
+        transaction = {
+            "application-transaction": {
+                "application-id": 5050,
+                "application-args": ["AAAAAA==", "AAI="],
+            }
+        }
+        assert _box_names_from_transaction(transaction, 5050) == set()
+
+    # # touched_box_names
+    def test_mirror_touched_box_names_functionality(self, mocker):
+        indexer_client = mocker.MagicMock()
+        transaction1, transaction2 = mocker.MagicMock(), mocker.MagicMock()
+        mocked_transaction = mocker.patch(
+            "mirror.application_transaction",
+            return_value=iter([transaction1, transaction2]),
+        )
+        mocked_names = mocker.patch(
+            "mirror._box_names_from_transaction",
+            side_effect=[{BOX_NAME1}, {BOX_NAME1, BOX_NAME2}],
+        )
+        returned = touched_box_names(indexer_client, 5050, 1001)
+        assert returned == {BOX_NAME1, BOX_NAME2}
+        mocked_transaction.assert_called_once_with(
+            {
+                "application_id": 5050,
+                "txn_type": "appl",
+                "limit": 1000,
+                "min_round": 1001,
+            },
+            indexer_client,
+        )
+        mocked_names.assert_has_calls(
+            [mocker.call(transaction1, 5050), mocker.call(transaction2, 5050)]
+        )
+
+    def test_mirror_touched_box_names_with_senders(self, mocker):
+        transactions = [{"sender": ADDRESS1}, {"sender": ADDRESS2}, {}]
+        mocker.patch("mirror.application_transaction", return_value=iter(transactions))
+        mocker.patch(
+            "mirror._box_names_from_transaction",
+            side_effect=[{BOX_NAME2}, set(), set()],
+        )
+        returned = touched_box_names(mocker.MagicMock(), 5050, 1001, senders=True)
+        assert returned == {BOX_NAME1, BOX_NAME2}
+
+    # # sync_mirror
+    def test_mirror_sync_mirror_refreshes_for_first_sync(self, connection, mocker):
+        client, indexer_client = mocker.MagicMock(), mocker.MagicMock()
+        indexer_client.health.return_value = {"round": 5000}
+        mocked_refresh = mocker.patch("mirror.refresh_mirror")
+        mocked_touched = mocker.patch("mirror.touched_box_names")
+        returned = sync_mirror(connection, client, indexer_client, 5050, workers=2)
+        assert returned == mocked_refresh.return_value
+        mocked_refresh.assert_called_once_with(connection, client, 5050, workers=2)
+        mocked_touched.assert_not_called()
+
+    def test_mirror_sync_mirror_refreshes_for_too_large_gap(self, connection, mocker):
+        set_mirror_state(connection, "synced_round", 1000)
+        client, indexer_client = mocker.MagicMock(), mocker.MagicMock()
+        indexer_client.health.return_value = {"round": 1101}
+        mocked_refresh = mocker.patch("mirror.refresh_mirror")
+        mocked_touched = mocker.patch("mirror.touched_box_names")
+        sync_mirror(connection, client, indexer_client, 5050, max_gap=100)
+        mocked_refresh.assert_called_once()
+        mocked_touched.assert_not_called()
+
+    def test_mirror_sync_mirror_functionality(self, connection, mocker):
+        update_mirror_boxes(
+            connection,
+            {
+                BOX_NAME1: _response([1, 2, 3, 4, 5, 6]),
+                BOX_NAME2: _response([1, 2, 3, 4, 5, 6]),
+            },
+        )
+        set_mirror_state(connection, "synced_round", 1000)
+        client, indexer_client = mocker.MagicMock(), mocker.MagicMock()
+        indexer_client.health.return_value = {"round": 1100}
+        mocked_refresh = mocker.patch("mirror.refresh_mirror")
+        mocked_touched = mocker.patch(
+            "mirror.touched_box_names", return_value={BOX_NAME2}
+        )
+        values = [7, 8, 9, 10, 11, 12]
+        mocked_responses = mocker.patch(
+            "mirror.permission_dapp_box_responses",
+            return_value={BOX_NAME2: _response(values)},
+        )
+        returned = sync_mirror(connection, client, indexer_client, 5050, workers=2)
+        assert returned == (1, 0)
+        mocked_refresh.assert_not_called()
+        mocked_touched.assert_called_once_with(indexer_client, 5050, 1001)
+        mocked_responses.assert_called_once_with(client, 5050, [BOX_NAME2], workers=2)
+        assert mirrored_permission_values(connection) == {
+            ADDRESS1: [1, 2, 3, 4, 5, 6],
+            ADDRESS2: values,
+        }
+        assert mirror_state(connection, "synced_round") == 1100
+
+
+def _subtopia_value(end):
+    return base64.b64encode(
+        struct.pack(">5Q", 730624664, 2, 1000, end, 2592000)
+    ).decode()
+
+
+def _index_subscriptions(connection, rows):
+    connection.executemany(
+        "INSERT INTO subscriptions (app_id, address, subscription_end) "
+        "VALUES (?, ?, ?)",
+        rows,
+    )
+
+
+class TestMirrorSubscriptionsFunctions:
+    """Testing class for :py:mod:`mirror` subscriptions expiry index functions."""
+
+    # # _due_subscription_addresses
+    def test_mirror_due_subscription_addresses_functionality(self, connection):
+        _index_subscriptions(
+            connection,
+            [
+                (5050, "address1", 0),
+                (5050, "address2", 1000),
+                (5050, "address3", 2000),
+                (5050, "address4", 3000),
+                (5051, "address5", 1000),
+            ],
+        )
+        returned = _due_subscription_addresses(connection, 5050, 0, 2000)
+        assert returned == {"address2", "address3"}
+
+    def test_mirror_due_subscription_addresses_skips_already_due(self, connection):
+        _index_subscriptions(
+            connection,
+            [
+                (5050, "address1", 500),
+                (5050, "address2", 1000),
+                (5050, "address3", 2000),
+            ],
+        )
+        returned = _due_subscription_addresses(connection, 5050, 1000, 3000)
+        assert returned == {"address3"}
+
+    # # sync_subscriptions_index
+    def test_mirror_sync_subscriptions_index_functionality(self, connection, mocker):
+        now = int(time.time())
+        box_names = [bytes([index]) * 32 for index in range(6)]
+        addresses = [encode_address(box_name) for box_name in box_names]
+        mocker.patch(
+            "mirror.SUBSCRIPTION_PERMISSIONS",
+            {5050: (100, 10, "Intro"), 5051: (200, 20, "Cluster")},
+        )
+        _index_subscriptions(
+            connection,
+            [
+                (5050, addresses[0], 0),
+                (5050, addresses[1], now + 864000),
+                (5050, addresses[2], now + 3600),
+                (5050, addresses[3], now - 864000),
+                (5050, addresses[4], now + 864000),
+            ],
+        )
+        client = mocker.MagicMock()
+        listed = {5050: box_names[:4] + box_names[5:], 5051: [box_names[1]]}
+        mocked_names = mocker.patch(
+            "mirror.application_box_names",
+            side_effect=lambda client, app_id: iter(listed[app_id]),
+        )
+        ends = {
+            5050: {box_names[2]: now + 2_592_000, box_names[3]: now - 864000},
+            5051: {box_names[1]: 0},
+        }
+        mocked_ends = mocker.patch(
+            "mirror.fetch_subscription_ends",
+            side_effect=lambda client, app_id, box_names, workers: {
+                box_name: ends[app_id].get(box_name, now + 5000)
+                for box_name in box_names
+            },
+        )
+        returned = sync_subscriptions_index(
+            connection, client, interval=172800, workers=3
+        )
+        assert returned == 4
+        mocked_names.assert_has_calls(
+            [mocker.call(client, 5050), mocker.call(client, 5051)]
+        )
+        mocked_ends.assert_has_calls(
+            [
+                mocker.call(
+                    client, 5050, [box_names[2], box_names[3], box_names[5]], workers=3
+                ),
+                mocker.call(client, 5051, [box_names[1]], workers=3),
+            ]
+        )
+        assert sorted(
+            connection.execute(
+                "SELECT app_id, address, subscription_end FROM subscriptions"
+            )
+        ) == sorted(
+            [
+                (5050, addresses[0], 0),
+                (5050, addresses[1], now + 864000),
+                (5050, addresses[2], now + 2_592_000),
+                (5050, addresses[3], now - 864000),
+                (5050, addresses[5], now + 5000),
+                (5051, addresses[1], 0),
+            ]
+        )
+
+    def test_mirror_sync_subscriptions_index_skips_not_due_boxes(
+        self, connection, mocker
+    ):
+        now = int(time.time())
+        mocker.patch("mirror.SUBSCRIPTION_PERMISSIONS", {5050: (100, 10, "Intro")})
+        _index_subscriptions(connection, [(5050, ADDRESS1, now + 864000)])
+        mocker.patch("mirror.application_box_names", return_value=iter([BOX_NAME1]))
+        mocked_ends = mocker.patch("mirror.fetch_subscription_ends", return_value={})
+        client = mocker.MagicMock()
+        assert sync_subscriptions_index(connection, client) == 0
+        mocked_ends.assert_called_once_with(client, 5050, [], workers=mocker.ANY)
+
+    def test_mirror_sync_subscriptions_index_for_lapsed_and_renewed_box(
+        self, connection, mocker
+    ):
+        now = int(time.time())
+        mocker.patch("mirror.SUBSCRIPTION_PERMISSIONS", {5050: (100, 10, "Intro")})
+        mocker.patch(
+            "mirror.application_box_names",
+            side_effect=lambda client, app_id: [BOX_NAME1],
+        )
+        mocked_ends = mocker.patch(
+            "mirror.fetch_subscription_ends",
+            side_effect=[{BOX_NAME1: now - 864000}, {BOX_NAME1: now + 2_592_000}],
+        )
+        client = mocker.MagicMock()
+        assert sync_subscriptions_index(connection, client, workers=2) == 1
+        assert indexed_subscriptions(connection) == {}
+        assert sync_subscriptions_index(connection, client, workers=2) == 1
+        mocked_ends.assert_called_with(client, 5050, [BOX_NAME1], workers=2)
+        assert indexed_subscriptions(connection) == {ADDRESS1: [(100, 10)]}
+
+    # # _subscriptions_horizon
+    def test_mirror_subscriptions_horizon_functionality(self, mocker):
+        mocked_datetime = mocker.patch("mirror.datetime")
+        mocked_datetime.now.return_value.timestamp.return_value = 1000000.5
+        assert _subscriptions_horizon(172800) == 1086400
+
+    # # update_subscriptions_index
+    def test_mirror_update_subscriptions_index_functionality(self, connection, mocker):
+        _index_subscriptions(
+            connection, [(5050, ADDRESS1, 1000), (5050, ADDRESS2, 2000)]
+        )
+        client = mocker.MagicMock()
+        mocked_responses = mocker.patch(
+            "mirror.permission_dapp_box_responses",
+            return_value={BOX_NAME1: {"value": _subtopia_value(5000)}, BOX_NAME2: None},
+        )
+        returned = update_subscriptions_index(
+            connection, client, 5050, {BOX_NAME1, BOX_NAME2}, workers=2
+        )
+        assert returned == 2
+        mocked_responses.assert_called_once_with(
+            client, 5050, {BOX_NAME1, BOX_NAME2}, workers=2
+        )
+        assert list(
+            connection.execute(
+                "SELECT app_id, address, subscription_end FROM subscriptions"
+            )
+        ) == [(5050, ADDRESS1, 5000)]
+
+    # # sync_subscriptions
+    def test_mirror_sync_subscriptions_full_sync_for_first_sync(
+        self, connection, mocker
+    ):
+        client, indexer_client = mocker.MagicMock(), mocker.MagicMock()
+        indexer_client.health.return_value = {"round": 5000}
+        mocked_full = mocker.patch("mirror.sync_subscriptions_index", return_value=10)
+        mocked_touched = mocker.patch("mirror.touched_box_names")
+        returned = sync_subscriptions(
+            connection, client, indexer_client, interval=3600, workers=2
+        )
+        assert returned == 10
+        mocked_full.assert_called_once_with(
+            connection, client, interval=3600, workers=2
+        )
+        mocked_touched.assert_not_called()
+        assert mirror_state(connection, "subscriptions_synced_round") == 5000
+
+    def test_mirror_sync_subscriptions_full_sync_for_big_gap(self, connection, mocker):
+        set_mirror_state(connection, "subscriptions_synced_round", 1000)
+        client, indexer_client = mocker.MagicMock(), mocker.MagicMock()
+        indexer_client.health.return_value = {"round": 1101}
+        mocked_full = mocker.patch("mirror.sync_subscriptions_index", return_value=10)
+        returned = sync_subscriptions(connection, client, indexer_client, max_gap=100)
+        assert returned == 10
+        mocked_full.assert_called_once()
+        assert mirror_state(connection, "subscriptions_synced_round") == 1101
+
+    def test_mirror_sync_subscriptions_functionality(self, connection, mocker):
+        now = int(time.time())
+        mocker.patch(
+            "mirror.SUBSCRIPTION_PERMISSIONS",
+            {5050: (100, 10, "Intro"), 5051: (200, 20, "Cluster")},
+        )
+        _index_subscriptions(
+            connection,
+            [
+                (5050, ADDRESS1, now + 864000),
+                (5050, encode_address(bytes(32)), now - 864000),
+                (5051, ADDRESS2, now - 3600),
+            ],
+        )
+        set_mirror_state(connection, "subscriptions_synced_round", 1000)
+        set_mirror_state(connection, "subscriptions_horizon", now - 7200)
+        mocker.patch("mirror._subscriptions_horizon", return_value=now + 3600)
+        client, indexer_client = mocker.MagicMock(), mocker.MagicMock()
+        indexer_client.health.return_value = {"round": 1100}
+        mocked_full = mocker.patch("mirror.sync_subscriptions_index")
+        touched = {5050: {BOX_NAME1}, 5051: set()}
+        mocked_touched = mocker.patch(
+            "mirror.touched_box_names",
+            side_effect=lambda indexer_client, app_id, min_round, senders: touched[
+                app_id
+            ],
+        )
+        mocked_update = mocker.patch(
+            "mirror.update_subscriptions_index", side_effect=[1, 1]
+        )
+        returned = sync_subscriptions(connection, client, indexer_client, workers=2)
+        assert returned == 2
+        mocked_full.assert_not_called()
+        mocked_touched.assert_has_calls(
+            [
+                mocker.call(indexer_client, 5050, 1001, senders=True),
+                mocker.call(indexer_client, 5051, 1001, senders=True),
+            ]
+        )
+        mocked_update.assert_has_calls(
+            [
+                mocker.call(connection, client, 5050, {BOX_NAME1}, workers=2),
+                mocker.call(connection, client, 5051, {BOX_NAME2}, workers=2),
+            ]
+        )
+        assert mirror_state(connection, "subscriptions_synced_round") == 1100
+        assert mirror_state(connection, "subscriptions_horizon") == now + 3600
+
+    # # indexed_subscriptions
+    def test_mirror_indexed_subscriptions_for_empty_index(self, connection):
+        assert indexed_subscriptions(connection) == {}
+
+    def test_mirror_indexed_subscriptions_functionality(self, connection, mocker):
+        now = int(time.time())
+        mocker.patch(
+            "mirror.SUBSCRIPTION_PERMISSIONS",
+            {5050: (100, 10, "Intro"), 5051: (200, 20, "Cluster")},
+        )
+        _index_subscriptions(
+            connection,
+            [
+                (5050, "address1", 0),
+                (5050, "address2", now - 3600),
+                (5050, "address3", now - 172800),
+                (5051, "address2", now + 3600),
+                (5052, "address4", 0),
+            ],
+        )
+        returned = indexed_subscriptions(connection)
+        assert returned == {
+            "address1": [(100, 10)],
+            "address2": [(100, 10), (200, 20)],
+        }
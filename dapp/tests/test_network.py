@@ -1,39 +1,134 @@
 """Testing module for :py:mod:`network` module."""
 
 import base64
+import struct
 from unittest import mock
 
 import pytest
 from algosdk.error import AlgodHTTPError
 
+from cache import NotSubscribedCache, PermissionValuesCache
 from configuration import (
+    APP_CALL_ARGS_MAX_SIZE,
+    BOXES_DELETING_GROUP_SIZE,
+    BOXES_PAGE_LIMIT,
+    BOXES_PER_WRITE_CALL,
+    MERGED_ACCOUNTS,
     STAKING_KEY,
     SUBSCRIPTION_PERMISSIONS,
     SUBTOPIA_ASASTATSER_APP_ID,
     SUBTOPIA_CLUSTER_APP_ID,
     SUBTOPIA_INTRO_APP_ID,
     SUBTOPIA_PROFESSIONAL_APP_ID,
+    VALUES_RAW_VERSION,
+)
+from helpers import (
+    box_name_from_address,
+    parse_subtopia_boxes,
+    serialize_raw_values,
+    serialize_values,
 )
-from helpers import box_name_from_address
 from network import (
-    _cometa_app_amount,
+    _active_tier_subscribers,
+    _box_content,
     _cometa_app_local_state_for_address,
+    _delete_boxes_composer,
+    _execute_composer,
+    _is_suggested_params_error,
+    _journal_contents,
+    _journaled_write_boxes_composer,
+    _print_deleting_progress,
+    _print_skipped_writes,
+    _simulated_group,
+    _subscription_end_for_box,
+    _txid_recording_builder,
+    _write_boxes_calls,
+    _write_group_size,
+    application_box_names,
+    changed_box_values,
+    changed_subscriptions_and_staking_values,
     check_and_update_changed_subscriptions_and_staking,
     check_and_update_new_stakers,
     check_and_update_new_subscribers,
+    cometa_app_amount,
     create_app,
     current_governance_staking_for_address,
     delete_app,
     delete_box,
+    delete_boxes_in_groups,
     deserialized_permission_dapp_box_value,
+    fetch_subscription_ends,
     fetch_subscriptions_for_address,
     fetch_subscriptions_from_boxes,
+    is_unchanged_box,
+    migrate_boxes_to_raw_values,
+    new_stakers_values,
+    new_subscribers_values,
+    permission_dapp_box_contents,
+    permission_dapp_box_response,
+    permission_dapp_box_responses,
     permission_dapp_values_from_boxes,
+    permission_values_for_addresses,
+    simulate_box_updates,
     write_box,
+    write_boxes,
     write_foundation_boxes,
 )
 
 
+def _raw_values(data):
+    return bytes((VALUES_RAW_VERSION,)) + base64.b64decode(data)
+
+
+def _subtopia_value(end):
+    return base64.b64encode(
+        struct.pack(">5Q", 730624664, 2, 1000, end, 2592000)
+    ).decode()
+
+
+# # BOXES
+class TestNetworkBoxesFunctions:
+    """Testing class for :py:mod:`network` boxes functions."""
+
+    # # application_box_names
+    def test_network_application_box_names_for_no_boxes(self, mocker):
+        client = mocker.MagicMock()
+        client.algod_request.return_value = {"boxes": []}
+        assert list(application_box_names(client, 5050)) == []
+        client.algod_request.assert_called_once_with(
+            "GET", "/applications/5050/boxes", params={"max": BOXES_PAGE_LIMIT}
+        )
+
+    def test_network_application_box_names_follows_next_token(self, mocker):
+        client = mocker.MagicMock()
+        name1, name2, name3 = b"name1", b"name2", b"name3"
+        client.algod_request.side_effect = [
+            {
+                "boxes": [
+                    {"name": base64.b64encode(name1).decode()},
+                    {"name": base64.b64encode(name2).decode()},
+                ],
+                "next-token": "token1",
+            },
+            {"boxes": [{"name": base64.b64encode(name3).decode()}]},
+        ]
+        returned = application_box_names(client, 5050, limit=2)
+        assert next(returned) == name1
+        client.algod_request.assert_called_once()
+        assert list(returned) == [name2, name3]
+        client.algod_request.assert_has_calls(
+            [
+                mocker.call("GET", "/applications/5050/boxes", params={"max": 2}),
+                mocker.call(
+                    "GET",
+                    "/applications/5050/boxes",
+                    params={"max": 2, "next": "token1"},
+                ),
+            ]
+        )
+        assert client.algod_request.call_count == 2
+
+
 # # SUBSCRIPTIONS
 class TestNetworkSubscriptionsFunctions:
     """Testing class for :py:mod:`network` subscriptions functions."""
@@ -72,12 +167,19 @@ class TestNetworkSubscriptionsFunctions:
         response3 = {
             "value": "AAAAACuMejoAAAAAAAAAAgAAAABnWDPFAAAAAGd/wMUAAAAAACeNAA=="
         }
-        client.application_box_by_name.side_effect = [
-            response1,
-            AlgodHTTPError(""),
-            response2,
-            response3,
-        ]
+        responses = {
+            SUBTOPIA_INTRO_APP_ID: response1,
+            SUBTOPIA_ASASTATSER_APP_ID: AlgodHTTPError(""),
+            SUBTOPIA_PROFESSIONAL_APP_ID: response2,
+            SUBTOPIA_CLUSTER_APP_ID: response3,
+        }
+
+        def _box_by_name(app_id, box_name):
+            if isinstance(responses[app_id], Exception):
+                raise responses[app_id]
+            return responses[app_id]
+
+        client.application_box_by_name.side_effect = _box_by_name
         returned = fetch_subscriptions_for_address(client, address)
         assert returned == {
             "Intro": 1735000000,
@@ -93,6 +195,69 @@ class TestNetworkSubscriptionsFunctions:
         client.application_box_by_name.assert_has_calls(calls, any_order=True)
         assert client.application_box_by_name.call_count == 4
 
+    def test_network_fetch_subscriptions_for_address_cached(self, mocker):
+        mocker.patch("network.not_subscribed_cache", NotSubscribedCache())
+        client = mocker.MagicMock()
+        address = "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I"
+        response = {"value": "AAAAACuMc0sAAAAAAAAAAgAAAABnWCsBAAAAAGdp/8AAAAAAACeNAA=="}
+        client.application_box_by_name.side_effect = lambda app_id, box_name: (
+            response if app_id == SUBTOPIA_INTRO_APP_ID else None
+        )
+        assert fetch_subscriptions_for_address(client, address, cached=True) == {
+            "Intro": 1735000000
+        }
+        assert client.application_box_by_name.call_count == 4
+        client.application_box_by_name.reset_mock()
+        assert fetch_subscriptions_for_address(client, address, cached=True) == {
+            "Intro": 1735000000
+        }
+        client.application_box_by_name.assert_called_once_with(
+            SUBTOPIA_INTRO_APP_ID, box_name_from_address(address)
+        )
+
+    # # _subscription_end_for_box
+    def test_network_subscription_end_for_box_functionality(self, mocker):
+        address = "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I"
+        mocked_cache = mocker.patch("network.not_subscribed_cache")
+        client = mocker.MagicMock()
+        client.application_box_by_name.return_value = {"value": "value1"}
+        mocked_end = mocker.patch("network.box_subscription_end", return_value=1000)
+        returned = _subscription_end_for_box(client, 5050, address)
+        assert returned == 1000
+        mocked_end.assert_called_once_with("value1")
+        mocked_cache.get.assert_not_called()
+        mocked_cache.set.assert_not_called()
+
+    def test_network_subscription_end_for_box_serves_cached(self, mocker):
+        address = "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I"
+        mocked_cache = mocker.patch("network.not_subscribed_cache")
+        mocked_cache.get.return_value = True
+        client = mocker.MagicMock()
+        returned = _subscription_end_for_box(client, 5050, address, cached=True)
+        assert returned is None
+        mocked_cache.get.assert_called_once_with(5050, address)
+        client.application_box_by_name.assert_not_called()
+
+    def test_network_subscription_end_for_box_caches_not_found(self, mocker):
+        address = "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I"
+        mocked_cache = mocker.patch("network.not_subscribed_cache")
+        mocked_cache.get.return_value = False
+        client = mocker.MagicMock()
+        client.application_box_by_name.side_effect = AlgodHTTPError("box not found")
+        returned = _subscription_end_for_box(client, 5050, address, cached=True)
+        assert returned is None
+        mocked_cache.set.assert_called_once_with(5050, address)
+
+    def test_network_subscription_end_for_box_not_caching_node_errors(self, mocker):
+        address = "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I"
+        mocked_cache = mocker.patch("network.not_subscribed_cache")
+        mocked_cache.get.return_value = False
+        client = mocker.MagicMock()
+        client.application_box_by_name.side_effect = AlgodHTTPError("timeout", 503)
+        returned = _subscription_end_for_box(client, 5050, address, cached=True)
+        assert returned is None
+        mocked_cache.set.assert_not_called()
+
     # # fetch_subscriptions_from_boxes
     def test_network_fetch_subscriptions_from_boxes_functionality(self, mocker):
         client = mocker.MagicMock()
@@ -123,7 +288,7 @@ class TestNetworkSubscriptionsFunctions:
                 {"name": "rbvVZ20vDDdZH0Pss2Rls29lSiPryTisYA5rTt3qilM="},
             ]
         }
-        client.application_boxes.side_effect = [boxes1, boxes2, boxes3, boxes4, boxes5]
+        client.algod_request.side_effect = [boxes1, boxes2, boxes3, boxes4, boxes5]
         response1 = {
             "value": "AAAAACuMc0sAAAAAAAAAAgAAAABnWCsBAAAAAGdp/8AAAAAAACeNAA=="
         }
@@ -199,9 +364,16 @@ class TestNetworkSubscriptionsFunctions:
             address4: [(38000000000, 258885438200)],
             address5: [(500000000000, 3236067977500)],
         }
-        calls = [mocker.call(app_id) for app_id in SUBSCRIPTION_PERMISSIONS]
-        client.application_boxes.assert_has_calls(calls, any_order=True)
-        assert client.application_boxes.call_count == len(SUBSCRIPTION_PERMISSIONS)
+        calls = [
+            mocker.call(
+                "GET",
+                f"/applications/{app_id}/boxes",
+                params={"max": BOXES_PAGE_LIMIT},
+            )
+            for app_id in SUBSCRIPTION_PERMISSIONS
+        ]
+        client.algod_request.assert_has_calls(calls, any_order=True)
+        assert client.algod_request.call_count == len(SUBSCRIPTION_PERMISSIONS)
         calls = [
             mocker.call(
                 SUBTOPIA_INTRO_APP_ID, base64.b64decode(boxes1["boxes"][0]["name"])
@@ -232,12 +404,102 @@ class TestNetworkSubscriptionsFunctions:
         client.application_box_by_name.assert_has_calls(calls, any_order=True)
         assert client.application_box_by_name.call_count == 8
 
+    def test_network_fetch_subscriptions_from_boxes_for_workers(self, mocker):
+        client = mocker.MagicMock()
+        tiers = list(SUBSCRIPTION_PERMISSIONS)
+        subscribers = {
+            tiers[0]: ["address1", "address2"],
+            tiers[1]: [],
+            tiers[2]: ["address2"],
+            tiers[3]: ["address3"],
+        }
+        mocked_subscribers = mocker.patch(
+            "network._active_tier_subscribers",
+            side_effect=lambda client, app_id, workers: subscribers[app_id],
+        )
+        returned = fetch_subscriptions_from_boxes(client, workers=4)
+        assert returned == {
+            "address1": [SUBSCRIPTION_PERMISSIONS[tiers[0]][:2]],
+            "address2": [
+                SUBSCRIPTION_PERMISSIONS[tiers[0]][:2],
+                SUBSCRIPTION_PERMISSIONS[tiers[2]][:2],
+            ],
+            "address3": [SUBSCRIPTION_PERMISSIONS[tiers[3]][:2]],
+        }
+        mocked_subscribers.assert_has_calls(
+            [mocker.call(client, app_id, workers=4) for app_id in tiers],
+            any_order=True,
+        )
+        assert mocked_subscribers.call_count == 4
+
+    # # _active_tier_subscribers
+    def test_network_active_tier_subscribers_functionality(self, mocker):
+        client = mocker.MagicMock()
+        box_names = [
+            base64.b64decode("cQWUzn1mozSwFjfbuIUJlTjN/dz4zHUs60ey06uw/kY="),
+            base64.b64decode("UaclYCXAuWPiHXrf8oGGJP7qWeTwM3TaAFTYJHAsz4o="),
+            base64.b64decode("0Sps8CZ0l7T7lMDJoNDTbMOc5WjvK0hBucrwIbhrxvc="),
+        ]
+        mocked_names = mocker.patch(
+            "network.application_box_names", return_value=iter(box_names)
+        )
+        ends = dict(zip(box_names, [1000, 2000, 3000]))
+        client.application_box_by_name.side_effect = lambda app_id, box_name: {
+            "value": _subtopia_value(ends[box_name])
+        }
+        mocker.patch(
+            "network.is_active_subscription", side_effect=lambda end: end != 2000
+        )
+        returned = _active_tier_subscribers(client, 5050, workers=3)
+        assert returned == [
+            "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I",
+            "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU",
+        ]
+        mocked_names.assert_called_once_with(client, 5050)
+        client.application_box_by_name.assert_has_calls(
+            [mocker.call(5050, box_name) for box_name in box_names], any_order=True
+        )
+        assert client.application_box_by_name.call_count == 3
+
+    # # fetch_subscription_ends
+    def test_network_fetch_subscription_ends_for_no_box_names(self, mocker):
+        client = mocker.MagicMock()
+        assert fetch_subscription_ends(client, 5050, []) == {}
+        client.application_box_by_name.assert_not_called()
+
+    def test_network_fetch_subscription_ends_functionality(self, mocker):
+        client = mocker.MagicMock()
+        client.application_box_by_name.side_effect = lambda app_id, box_name: {
+            "value": _subtopia_value(len(box_name))
+        }
+        mocked_parse = mocker.patch(
+            "network.parse_subtopia_boxes", wraps=parse_subtopia_boxes
+        )
+        returned = fetch_subscription_ends(
+            client, 5050, iter([b"name1", b"name02"]), workers=2
+        )
+        assert returned == {b"name1": 5, b"name02": 6}
+        client.application_box_by_name.assert_has_calls(
+            [mocker.call(5050, b"name1"), mocker.call(5050, b"name02")],
+            any_order=True,
+        )
+        mocked_parse.assert_called_once()
+
+    def test_network_fetch_subscription_ends_raises_for_invalid_value(self, mocker):
+        client = mocker.MagicMock()
+        client.application_box_by_name.return_value = {
+            "value": base64.b64encode(b"value").decode()
+        }
+        with pytest.raises(ValueError) as exception:
+            fetch_subscription_ends(client, 5050, [b"name1"])
+        assert str(exception.value) == "Invalid Subtopia box value size!"
+
 
 # # STAKING
 class TestNetworkStakingFunctions:
     """Testing class for :py:mod:`network` governance staking functions."""
 
-    # # _cometa_app_amount
+    # # cometa_app_amount
     def test_network_cometa_app_amount_returns_amount_for_staking_app(self):
         state = {
             "id": 2333078684,
@@ -254,7 +516,7 @@ class TestNetworkStakingFunctions:
             "opted-in-at-round": 23251531,
             "schema": {"num-byte-slice": 1, "num-uint": 0},
         }
-        returned = _cometa_app_amount(STAKING_KEY, state)
+        returned = cometa_app_amount(STAKING_KEY, state)
         assert returned == 200000000
 
     def test_network_cometa_app_amount_returns_zero_when_is_not_cometa_app(self):
@@ -272,7 +534,7 @@ class TestNetworkStakingFunctions:
             ],
             "schema": {"num-byte-slice": 8, "num-uint": 8},
         }
-        returned = _cometa_app_amount(STAKING_KEY, state)
+        returned = cometa_app_amount(STAKING_KEY, state)
         assert returned == 0
 
     def test_network_cometa_app_amount_returns_zero_for_too_small_bytes_value(self):
@@ -295,7 +557,7 @@ class TestNetworkStakingFunctions:
             "schema": {"num-byte-slice": 0, "num-uint": 3},
         }
         state["key-value"][0]["value"]["bytes"] = "AAAVfSUw=="
-        returned = _cometa_app_amount(STAKING_KEY, state)
+        returned = cometa_app_amount(STAKING_KEY, state)
         assert returned == 0
 
     # # _cometa_app_local_state_for_address
@@ -362,7 +624,7 @@ class TestNetworkStakingFunctions:
         mocked_state = mocker.patch(
             "network._cometa_app_local_state_for_address", return_value=None
         )
-        mocked_amount = mocker.patch("network._cometa_app_amount")
+        mocked_amount = mocker.patch("network.cometa_app_amount")
         returned = current_governance_staking_for_address(
             client, address, staking_key=STAKING_KEY
         )
@@ -376,7 +638,7 @@ class TestNetworkStakingFunctions:
         mocked_state = mocker.patch(
             "network._cometa_app_local_state_for_address", return_value=state
         )
-        mocked_amount = mocker.patch("network._cometa_app_amount")
+        mocked_amount = mocker.patch("network.cometa_app_amount")
         staking_key = STAKING_KEY
         returned = current_governance_staking_for_address(
             client, address, staking_key=staking_key
@@ -389,6 +651,112 @@ class TestNetworkStakingFunctions:
 class TestNetworkUpdateFunctions:
     """Testing class for :py:mod:`network` update functions."""
 
+    # # _box_content
+    def test_network_box_content_for_raw_values(self):
+        assert _box_content(b"\x02data") == b"\x02data"
+
+    def test_network_box_content_for_base64_values(self):
+        assert _box_content("AAAA") == b"AAAA"
+
+    # # _print_skipped_writes
+    def test_network_print_skipped_writes_for_no_skipped(self, mocker):
+        mocked_print = mocker.patch("network.print")
+        _print_skipped_writes(0)
+        mocked_print.assert_not_called()
+
+    def test_network_print_skipped_writes_functionality(self, mocker):
+        mocked_print = mocker.patch("network.print")
+        _print_skipped_writes(3)
+        mocked_print.assert_called_once_with(
+            "Skipped 3 unchanged box writes saving up to 3000 microAlgos in fees"
+        )
+
+    # # is_unchanged_box
+    def test_network_is_unchanged_box_for_no_content(self):
+        assert is_unchanged_box(None, serialize_raw_values([1, 2, 3, 4, 5, 6])) is False
+        assert is_unchanged_box(b"", serialize_raw_values([1, 2, 3, 4, 5, 6])) is False
+
+    def test_network_is_unchanged_box_functionality(self):
+        value = serialize_raw_values([1, 2, 3, 4, 5, 6, 100, 1])
+        assert is_unchanged_box(value, value) is True
+        assert (
+            is_unchanged_box(
+                serialize_values([1, 2, 3, 4, 5, 6, 100, 1]).encode(), value
+            )
+            is True
+        )
+        assert (
+            is_unchanged_box(
+                serialize_values([1, 2, 3, 4, 5, 6, 100, 2]).encode(), value
+            )
+            is False
+        )
+
+    # # changed_box_values
+    def test_network_changed_box_values_functionality(self, mocker):
+        mocked_print = mocker.patch("network._print_skipped_writes")
+        values = {
+            "address1": serialize_raw_values([1, 2, 3, 4, 5, 6]),
+            "address2": serialize_raw_values([2, 2, 3, 4, 5, 6]),
+            "address3": serialize_values([3, 2, 3, 4, 5, 6]),
+            "address4": serialize_raw_values([4, 2, 3, 4, 5, 6]),
+            "address5": serialize_raw_values([5, 2, 3, 4, 5, 6]),
+        }
+        current = {
+            "address1": serialize_raw_values([1, 2, 3, 4, 5, 6]),
+            "address2": serialize_raw_values([0, 2, 3, 4, 5, 6]),
+            "address3": serialize_values([3, 2, 3, 4, 5, 6]).encode(),
+            "address5": serialize_values([5, 2, 3, 4, 5, 6]).encode(),
+        }
+        returned = changed_box_values(values, current)
+        assert returned == {
+            "address2": values["address2"],
+            "address4": values["address4"],
+        }
+        mocked_print.assert_called_once_with(3)
+
+    # # changed_subscriptions_and_staking_values
+    def test_network_changed_subscriptions_and_staking_values_functionality(
+        self, mocker
+    ):
+        permissions = {
+            "address1": [1000, 500, 1000, 100, 5000, 200, 2000, 2],
+            "address2": [5000, 800, 2000, 200, 8000, 400, 3000, 2],
+            "address3": [0, 100, 1000, 100, 0, 0],
+        }
+        subscriptions = {"address1": [(1000, 100)], "address2": [(3000, 300)]}
+        stakings = {"address1": 5000, "address2": 8000, "address3": 0}
+        mocker.patch(
+            "network.calculate_votes_and_permission", side_effect=[(1, 2), (3, 4)]
+        )
+        returned = changed_subscriptions_and_staking_values(
+            permissions, subscriptions, stakings
+        )
+        assert returned == {
+            "address2": [1, 2, 3000, 300, 8000, 400, 3000, 2],
+            "address3": [3, 4, 0, 0, 0, 0],
+        }
+        assert permissions["address2"] == [5000, 800, 2000, 200, 8000, 400, 3000, 2]
+        assert permissions["address3"] == [0, 100, 1000, 100, 0, 0]
+
+    # # new_stakers_values
+    def test_network_new_stakers_values_functionality(self, mocker):
+        permissions = {"address4": mocker.MagicMock()}
+        stakings = {"address1": 1000, "address2": 0, "address3": 2000, "address4": 5}
+        mocker.patch("network.permission_for_amount", side_effect=[100, 0])
+        returned = new_stakers_values(permissions, stakings)
+        assert returned == {"address1": [0, 100, 0, 0, 1000, 100]}
+
+    # # new_subscribers_values
+    def test_network_new_subscribers_values_functionality(self, mocker):
+        permissions = {"address2": mocker.MagicMock()}
+        subscriptions = {
+            "address1": [(1000, 100), (2000, 200)],
+            "address2": [(5000, 500)],
+        }
+        returned = new_subscribers_values(permissions, subscriptions)
+        assert returned == {"address1": [0, 300, 3000, 300, 0, 0]}
+
     # # check_and_update_changed_subscriptions_and_staking
     def test_network_check_and_update_changed_subscriptions_and_staking_for_no_changes(
         self, mocker
@@ -399,7 +767,7 @@ class TestNetworkUpdateFunctions:
         }
         subscriptions = {"address1": [(1000, 100)], "address2": [(2000, 200)]}
         stakings = {"address1": 5000, "address2": 8000}
-        mocked_write = mocker.patch("network.write_box")
+        mocked_write = mocker.patch("network.write_boxes")
         check_and_update_changed_subscriptions_and_staking(
             mocker.MagicMock(),
             mocker.MagicMock(),
@@ -449,36 +817,21 @@ class TestNetworkUpdateFunctions:
         mocked_permission = mocker.patch(
             "network.permission_for_amount", return_value=permission4
         )
-        mocked_write = mocker.patch("network.write_box")
+        mocked_write = mocker.patch("network.write_boxes")
         check_and_update_changed_subscriptions_and_staking(
             client, app_id, writing_parameters, permissions, subscriptions, stakings
         )
         mocked_permission.assert_called_once_with(amount4)
-        calls = [
-            mocker.call(
-                client,
-                app_id,
-                writing_parameters,
-                address1,
-                "AAAAAAAAAAAAAAAAAAAINAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPoAAAAAAAAABkAAAAAAAAB9AC",
-            ),
-            mocker.call(
-                client,
-                app_id,
-                writing_parameters,
-                address3,
-                "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA",
-            ),
-            mocker.call(
-                client,
-                app_id,
-                writing_parameters,
-                address4,
-                "AAAAAAAAAAAAAAAAAAAGQAAAAAAAACcQAAAAAAAAA+gAAAAAAAALuAAAAAAAAAJY",
-            ),
-        ]
-        mocked_write.assert_has_calls(calls, any_order=True)
-        assert mocked_write.call_count == 3
+        mocked_write.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            {
+                address1: "AAAAAAAAAAAAAAAAAAAINAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAPoAAAAAAAAABkAAAAAAAAB9AC",
+                address3: "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA",
+                address4: "AAAAAAAAAAAAAAAAAAAGQAAAAAAAACcQAAAAAAAAA+gAAAAAAAALuAAAAAAAAAJY",
+            },
+        )
 
     # # check_and_update_new_stakers
     def test_network_check_and_update_new_stakers_for_no_new_stakers(self, mocker):
@@ -487,7 +840,7 @@ class TestNetworkUpdateFunctions:
             "address1": [(mocker.MagicMock(), mocker.MagicMock())],
             "address2": [(mocker.MagicMock(), mocker.MagicMock())],
         }
-        mocked_write = mocker.patch("network.write_box")
+        mocked_write = mocker.patch("network.write_boxes")
         check_and_update_new_stakers(
             mocker.MagicMock(),
             mocker.MagicMock(),
@@ -497,7 +850,7 @@ class TestNetworkUpdateFunctions:
         )
         mocked_write.assert_not_called()
 
-    def test_network_check_and_update_new_stakers_functionality(self, mocker):
+    def test_network_check_and_update_new_stakers_for_raw_values(self, mocker):
         client, app_id, writing_parameters = (
             mocker.MagicMock(),
             mocker.MagicMock(),
@@ -517,31 +870,56 @@ class TestNetworkUpdateFunctions:
             "network.permission_for_amount",
             side_effect=[permission1, permission2, permission3],
         )
-        mocked_write = mocker.patch("network.write_box")
+        mocker.patch("helpers.WRITE_RAW_VALUES", True)
+        mocked_write = mocker.patch("network.write_boxes")
         check_and_update_new_stakers(
             client, app_id, writing_parameters, permissions, stakings
         )
         calls = [mocker.call(amount1), mocker.call(amount2), mocker.call(amount3)]
         mocked_permission.assert_has_calls(calls, any_order=True)
         assert mocked_permission.call_count == 3
-        calls = [
-            mocker.call(
-                client,
-                app_id,
-                writing_parameters,
-                address1,
-                "AAAAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD6AAAAAAAAABk",
-            ),
-            mocker.call(
-                client,
-                app_id,
-                writing_parameters,
-                address3,
-                "AAAAAAAAAAAAAAAAAAABLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATiAAAAAAAAAEs",
-            ),
-        ]
-        mocked_write.assert_has_calls(calls, any_order=True)
-        assert mocked_write.call_count == 2
+        mocked_write.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            {
+                address1: _raw_values(
+                    "AAAAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD6AAAAAAAAABk"
+                ),
+                address3: _raw_values(
+                    "AAAAAAAAAAAAAAAAAAABLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATiAAAAAAAAAEs"
+                ),
+            },
+        )
+
+    def test_network_check_and_update_new_stakers_skips_unchanged_boxes(self, mocker):
+        client, app_id, writing_parameters = (
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+        )
+        stakings = {"address1": 1000, "address2": 5000}
+        mocker.patch("network.permission_for_amount", side_effect=[100, 300])
+        current = {
+            "address1": _raw_values(
+                "AAAAAAAAAAAAAAAAAAAAZAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAD6AAAAAAAAABk"
+            )
+        }
+        mocked_write = mocker.patch("network.write_boxes")
+        mocked_print = mocker.patch("network._print_skipped_writes")
+        returned = check_and_update_new_stakers(
+            client, app_id, writing_parameters, {}, stakings, current
+        )
+        assert returned == 1
+        mocked_write.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            {
+                "address2": "AAAAAAAAAAAAAAAAAAABLAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATiAAAAAAAAAEs"
+            },
+        )
+        mocked_print.assert_called_once_with(1)
 
     # # check_and_update_new_subscribers
     def test_network_check_and_update_new_subscribers_for_no_new_subscibers(
@@ -552,7 +930,7 @@ class TestNetworkUpdateFunctions:
             "address1": [(mocker.MagicMock(), mocker.MagicMock())],
             "address2": [(mocker.MagicMock(), mocker.MagicMock())],
         }
-        mocked_write = mocker.patch("network.write_box")
+        mocked_write = mocker.patch("network.write_boxes")
         check_and_update_new_subscribers(
             mocker.MagicMock(),
             mocker.MagicMock(),
@@ -584,28 +962,19 @@ class TestNetworkUpdateFunctions:
             address3: [(amount2, permission2), (amount3, permission3)],
             "address4": [(mocker.MagicMock(), mocker.MagicMock())],
         }
-        mocked_write = mocker.patch("network.write_box")
+        mocked_write = mocker.patch("network.write_boxes")
         check_and_update_new_subscribers(
             client, app_id, writing_parameters, permissions, subscriptions
         )
-        calls = [
-            mocker.call(
-                client,
-                app_id,
-                writing_parameters,
-                address2,
-                "AAAAAAAAAAAAAAAAAAAAZAAAAAAAAAPoAAAAAAAAAGQAAAAAAAAAAAAAAAAAAAAA",
-            ),
-            mocker.call(
-                client,
-                app_id,
-                writing_parameters,
-                address3,
-                "AAAAAAAAAAAAAAAAAAACvAAAAAAAABtYAAAAAAAAArwAAAAAAAAAAAAAAAAAAAAA",
-            ),
-        ]
-        mocked_write.assert_has_calls(calls, any_order=True)
-        assert mocked_write.call_count == 2
+        mocked_write.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            {
+                address2: "AAAAAAAAAAAAAAAAAAAAZAAAAAAAAAPoAAAAAAAAAGQAAAAAAAAAAAAAAAAAAAAA",
+                address3: "AAAAAAAAAAAAAAAAAAACvAAAAAAAABtYAAAAAAAAArwAAAAAAAAAAAAAAAAAAAAA",
+            },
+        )
 
 
 class TestNetworkPermissionDappFunctions:
@@ -669,7 +1038,78 @@ class TestNetworkPermissionDappFunctions:
         client.send_transactions.assert_called_once_with([mock_signed])
         mocked_wait.assert_called_once_with(client, "txid123")
 
+    # # _execute_composer
+    def test_network_execute_composer_functionality(self, mocker):
+        client, composer = mocker.MagicMock(), mocker.MagicMock()
+        mocked_invalidate = mocker.patch("network.suggested_params_cache.invalidate")
+        returned = _execute_composer(client, composer, 5050, "address1")
+        assert returned == composer.return_value.execute.return_value
+        composer.assert_called_once_with(client, 5050, "address1")
+        composer.return_value.execute.assert_called_once_with(client, 2)
+        mocked_invalidate.assert_not_called()
+
+    def test_network_execute_composer_retries_for_stale_parameters(self, mocker):
+        client, composer = mocker.MagicMock(), mocker.MagicMock()
+        response = mocker.MagicMock()
+        composer.return_value.execute.side_effect = [
+            AlgodHTTPError("txn dead: round 1000 outside of 800--999"),
+            response,
+        ]
+        mocked_invalidate = mocker.patch("network.suggested_params_cache.invalidate")
+        returned = _execute_composer(client, composer, 5050)
+        assert returned == response
+        assert composer.call_count == 2
+        composer.assert_called_with(client, 5050)
+        mocked_invalidate.assert_called_once_with(client)
+
+    def test_network_execute_composer_retries_only_once(self, mocker):
+        client, composer = mocker.MagicMock(), mocker.MagicMock()
+        composer.return_value.execute.side_effect = AlgodHTTPError(
+            "transaction fee 100 below threshold 1000"
+        )
+        mocker.patch("network.suggested_params_cache.invalidate")
+        with pytest.raises(AlgodHTTPError):
+            _execute_composer(client, composer, 5050)
+        assert composer.return_value.execute.call_count == 2
+
+    def test_network_execute_composer_raises_for_other_errors(self, mocker):
+        client, composer = mocker.MagicMock(), mocker.MagicMock()
+        composer.return_value.execute.side_effect = AlgodHTTPError("logic eval error")
+        mocked_invalidate = mocker.patch("network.suggested_params_cache.invalidate")
+        with pytest.raises(AlgodHTTPError):
+            _execute_composer(client, composer, 5050)
+        composer.assert_called_once_with(client, 5050)
+        mocked_invalidate.assert_not_called()
+
+    # # _is_suggested_params_error
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "txn dead: round 1000 outside of 800--999",
+            "transaction fee 100 below threshold 1000",
+            "fee too small",
+            "txgroup had 1000 in fees, which is less than the minimum 2000",
+        ],
+    )
+    def test_network_is_suggested_params_error_for_params_errors(self, message):
+        assert _is_suggested_params_error(AlgodHTTPError(message)) is True
+
+    def test_network_is_suggested_params_error_for_other_errors(self):
+        assert _is_suggested_params_error(AlgodHTTPError("logic eval error")) is False
+
     # # delete_box
+    def test_network_delete_box_for_stale_parameters(self, mocker):
+        client = mocker.MagicMock()
+        address = "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU"
+        atc = mocker.MagicMock()
+        atc.execute.side_effect = [AlgodHTTPError("txn dead"), mocker.MagicMock()]
+        mocker.patch("network.AtomicTransactionComposer", return_value=atc)
+        mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        delete_box(client, 5050, {"contract": mocker.MagicMock()}, address)
+        assert client.suggested_params.call_count == 2
+        assert atc.execute.call_count == 2
+
     def test_network_delete_box_functionality(self, mocker):
         client, app_id = mocker.MagicMock(), mocker.MagicMock()
         address = "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU"
@@ -689,6 +1129,7 @@ class TestNetworkPermissionDappFunctions:
         method = mocker.MagicMock()
         writing_parameters = {"sender": sender, "signer": signer, "contract": contract}
         contract.get_method_by_name.return_value = method
+        mocked_invalidate = mocker.patch("network.permission_values_cache.invalidate")
         delete_box(client, app_id, writing_parameters, address)
         mocked_composer.assert_called_once_with()
         client.suggested_params.assert_called_once_with()
@@ -703,6 +1144,7 @@ class TestNetworkPermissionDappFunctions:
             boxes=[(app_id, box_name)],
         )
         atc.execute.assert_called_once_with(client, 2)
+        mocked_invalidate.assert_called_once_with(app_id, address)
 
     # # deserialized_permission_dapp_box_value
     def test_network_deserialized_permission_dapp_returns_none_for_no_box(self, mocker):
@@ -711,7 +1153,7 @@ class TestNetworkPermissionDappFunctions:
             mocker.MagicMock(),
             mocker.MagicMock(),
         )
-        mocked_deserialize = mocker.patch("network.deserialize_values_data")
+        mocked_deserialize = mocker.patch("network.deserialize_box_value")
         client.application_box_by_name.side_effect = AlgodHTTPError("box not found")
         returned = deserialized_permission_dapp_box_value(client, app_id, box_name)
         assert returned is None
@@ -724,7 +1166,7 @@ class TestNetworkPermissionDappFunctions:
             mocker.MagicMock(),
             mocker.MagicMock(),
         )
-        mocked_deserialize = mocker.patch("network.deserialize_values_data")
+        mocked_deserialize = mocker.patch("network.deserialize_box_value")
         client.application_box_by_name.side_effect = AlgodHTTPError("foo bar")
         with pytest.raises(AlgodHTTPError):
             deserialized_permission_dapp_box_value(client, app_id, box_name)
@@ -747,6 +1189,107 @@ class TestNetworkPermissionDappFunctions:
         assert returned == [500000, 500000000000, 0, 0, 0, 0, 500000000000, 4]
         client.application_box_by_name.assert_called_once_with(app_id, box_name)
 
+    def test_network_deserialized_permission_dapp_box_value_for_cached(self, mocker):
+        client, app_id = mocker.MagicMock(), 5050
+        address = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+        box_name = box_name_from_address(address)
+        cache = PermissionValuesCache()
+        mocker.patch("network.permission_values_cache", cache)
+        client.application_box_by_name.return_value = {
+            "value": base64.b64encode(
+                serialize_values([1, 2, 0, 0, 0, 0]).encode()
+            ).decode()
+        }
+        returned = deserialized_permission_dapp_box_value(
+            client, app_id, box_name, cached=True
+        )
+        assert returned == [1, 2, 0, 0, 0, 0]
+        returned = deserialized_permission_dapp_box_value(
+            client, app_id, box_name, cached=True
+        )
+        assert returned == [1, 2, 0, 0, 0, 0]
+        client.application_box_by_name.assert_called_once_with(app_id, box_name)
+        assert cache.get(app_id, address) == (True, [1, 2, 0, 0, 0, 0])
+
+    def test_network_deserialized_permission_dapp_box_value_caches_not_found(
+        self, mocker
+    ):
+        client, app_id = mocker.MagicMock(), 5050
+        address = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+        box_name = box_name_from_address(address)
+        mocker.patch("network.permission_values_cache", PermissionValuesCache())
+        client.application_box_by_name.side_effect = AlgodHTTPError("box not found")
+        for _ in range(3):
+            returned = deserialized_permission_dapp_box_value(
+                client, app_id, box_name, cached=True
+            )
+            assert returned is None
+        client.application_box_by_name.assert_called_once_with(app_id, box_name)
+
+    # # permission_dapp_box_response
+    def test_network_permission_dapp_box_response_returns_none_for_no_box(self, mocker):
+        client = mocker.MagicMock()
+        client.application_box_by_name.side_effect = AlgodHTTPError("box not found")
+        returned = permission_dapp_box_response(client, 5050, b"name")
+        assert returned is None
+        client.application_box_by_name.assert_called_once_with(5050, b"name")
+
+    def test_network_permission_dapp_box_response_raises_for_other_errors(self, mocker):
+        client = mocker.MagicMock()
+        client.application_box_by_name.side_effect = AlgodHTTPError("foo bar")
+        with pytest.raises(AlgodHTTPError):
+            permission_dapp_box_response(client, 5050, b"name")
+
+    def test_network_permission_dapp_box_response_functionality(self, mocker):
+        client = mocker.MagicMock()
+        returned = permission_dapp_box_response(client, 5050, b"name")
+        assert returned == client.application_box_by_name.return_value
+
+    # # permission_dapp_box_responses
+    def test_network_permission_dapp_box_responses_functionality(self, mocker):
+        client = mocker.MagicMock()
+        response1, response2 = {"value": "AA=="}, None
+        mocked_response = mocker.patch(
+            "network.permission_dapp_box_response",
+            side_effect=lambda client, app_id, box_name: {
+                b"name1": response1,
+                b"name2": response2,
+            }[box_name],
+        )
+        returned = permission_dapp_box_responses(
+            client, 5050, [b"name1", b"name2"], workers=2
+        )
+        assert returned == {b"name1": response1, b"name2": response2}
+        assert mocked_response.call_count == 2
+
+    # # permission_dapp_box_contents
+    def test_network_permission_dapp_box_contents_raises_for_no_app_id(self, mocker):
+        with pytest.raises(ValueError) as exception:
+            permission_dapp_box_contents(mocker.MagicMock(), None)
+        assert str(exception.value) == "Permission dApp ID isn't set!"
+
+    def test_network_permission_dapp_box_contents_functionality(self, mocker):
+        client = mocker.MagicMock()
+        address1 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+        address2 = "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U"
+        name1, name2 = box_name_from_address(address1), box_name_from_address(address2)
+        mocked_names = mocker.patch(
+            "network.application_box_names", return_value=[name1, name2]
+        )
+        mocked_responses = mocker.patch(
+            "network.permission_dapp_box_responses",
+            return_value={
+                name1: {"value": base64.b64encode(b"\x02data").decode()},
+                name2: None,
+            },
+        )
+        returned = permission_dapp_box_contents(client, 5050, workers=4)
+        assert returned == {address1: b"\x02data"}
+        mocked_names.assert_called_once_with(client, 5050)
+        mocked_responses.assert_called_once_with(
+            client, 5050, [name1, name2], workers=4
+        )
+
     # # permission_dapp_values_from_boxes
     def test_network_permission_dapp_values_from_boxes_raises_for_no_app_id(
         self, mocker
@@ -767,7 +1310,7 @@ class TestNetworkPermissionDappFunctions:
                 {"name": "tdFRqNIIwrC1T95wS6adscJH4Wp0AWuHBTJ9UdcwBuw="},
             ]
         }
-        client.application_boxes.return_value = boxes
+        client.algod_request.return_value = boxes
         values1, values2, values3, values4 = (
             mocker.MagicMock(),
             mocker.MagicMock(),
@@ -791,7 +1334,9 @@ class TestNetworkPermissionDappFunctions:
             address3: values3,
             address4: values4,
         }
-        client.application_boxes.assert_called_once_with(app_id)
+        client.algod_request.assert_called_once_with(
+            "GET", f"/applications/{app_id}/boxes", params={"max": BOXES_PAGE_LIMIT}
+        )
         calls = [
             mocker.call(client, app_id, base64.b64decode(boxes["boxes"][i]["name"]))
             for i in range(len(boxes["boxes"]))
@@ -799,6 +1344,100 @@ class TestNetworkPermissionDappFunctions:
         mocked_deserialized.assert_has_calls(calls, any_order=True)
         assert mocked_deserialized.call_count == len(boxes["boxes"])
 
+    def test_network_permission_dapp_values_from_boxes_for_provided_workers(
+        self, mocker
+    ):
+        client = mocker.MagicMock()
+        app_id = 5050
+        boxes = {
+            "boxes": [
+                {"name": "kh+jKvvPrg8LnAjH5OrWstXqJLucdZLRBUJCtsuFyBQ="},
+                {"name": "wKicAOgLIKzPmAA0twVXMMBVwaVLVuoXHl9+Jf3wWAE="},
+                {"name": "hBV+y5sLUru3xZ5GdkhVkl+dL5901V/Jxvh+YzNG3JE="},
+            ]
+        }
+        client.algod_request.return_value = boxes
+        values = {
+            base64.b64decode(boxes["boxes"][0]["name"]): [1, 2],
+            base64.b64decode(boxes["boxes"][1]["name"]): None,
+            base64.b64decode(boxes["boxes"][2]["name"]): [3, 4],
+        }
+        mocked_deserialized = mocker.patch(
+            "network.deserialized_permission_dapp_box_value",
+            side_effect=lambda client, app_id, box_name: values[box_name],
+        )
+        returned = permission_dapp_values_from_boxes(client, app_id, workers=4)
+        assert returned == {
+            "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU": [1, 2],
+            "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U": [3, 4],
+        }
+        assert mocked_deserialized.call_count == len(boxes["boxes"])
+
+    def test_network_permission_dapp_values_from_boxes_raises_for_worker_error(
+        self, mocker
+    ):
+        client = mocker.MagicMock()
+        boxes = {"boxes": [{"name": "kh+jKvvPrg8LnAjH5OrWstXqJLucdZLRBUJCtsuFyBQ="}]}
+        client.algod_request.return_value = boxes
+        mocker.patch(
+            "network.deserialized_permission_dapp_box_value",
+            side_effect=AlgodHTTPError("foo bar"),
+        )
+        with pytest.raises(AlgodHTTPError):
+            permission_dapp_values_from_boxes(client, 5050, workers=4)
+
+    # # permission_values_for_addresses
+    def test_network_permission_values_for_addresses_raises_for_no_app_id(self, mocker):
+        with pytest.raises(ValueError) as exception:
+            permission_values_for_addresses(mocker.MagicMock(), None, [])
+        assert str(exception.value) == "Permission dApp ID isn't set!"
+
+    def test_network_permission_values_for_addresses_functionality(self, mocker):
+        client, app_id = mocker.MagicMock(), 5050
+        address1 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+        address2 = "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U"
+        merged, main = next(iter(MERGED_ACCOUNTS.items()))
+        values = {
+            box_name_from_address(address1): [1, 2],
+            box_name_from_address(address2): None,
+            box_name_from_address(main): [3, 4],
+        }
+        mocked_deserialized = mocker.patch(
+            "network.deserialized_permission_dapp_box_value",
+            side_effect=lambda client, app_id, box_name, cached: values[box_name],
+        )
+        returned = permission_values_for_addresses(
+            client, app_id, [address1, address2, merged, address1, main], workers=4
+        )
+        assert returned == {
+            address1: [1, 2],
+            address2: None,
+            merged: [3, 4],
+            main: [3, 4],
+        }
+        assert mocked_deserialized.call_count == 3
+        mocked_deserialized.assert_has_calls(
+            [
+                mocker.call(client, app_id, box_name, cached=False)
+                for box_name in values
+            ],
+            any_order=True,
+        )
+
+    def test_network_permission_values_for_addresses_for_cached(self, mocker):
+        client, app_id = mocker.MagicMock(), 5050
+        address = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+        mocked_deserialized = mocker.patch(
+            "network.deserialized_permission_dapp_box_value", return_value=[1, 2]
+        )
+        returned = permission_values_for_addresses(
+            client, app_id, [address], cached=True
+        )
+        assert returned == {address: [1, 2]}
+        mocked_deserialized.assert_called_once_with(
+            client, app_id, box_name_from_address(address), cached=True
+        )
+
     # # write_box
     def test_network_write_box_functionality(self, mocker):
         client, app_id, writing_parameters, value = (
@@ -825,6 +1464,7 @@ class TestNetworkPermissionDappFunctions:
         writing_parameters = {"sender": sender, "signer": signer, "contract": contract}
         method = mocker.MagicMock()
         contract.get_method_by_name.return_value = method
+        mocked_invalidate = mocker.patch("network.permission_values_cache.invalidate")
         write_box(client, app_id, writing_parameters, address, value)
         mocked_composer.assert_called_once_with()
         client.suggested_params.assert_called_once_with()
@@ -839,6 +1479,617 @@ class TestNetworkPermissionDappFunctions:
             boxes=[(app_id, box_name)],
         )
         atc.execute.assert_called_once_with(client, 2)
+        mocked_invalidate.assert_called_once_with(app_id, address)
+
+    def test_network_write_box_for_stale_parameters(self, mocker):
+        client = mocker.MagicMock()
+        address = "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU"
+        atc = mocker.MagicMock()
+        atc.execute.side_effect = [
+            AlgodHTTPError("transaction fee 100 below threshold 1000"),
+            mocker.MagicMock(),
+        ]
+        mocker.patch("network.AtomicTransactionComposer", return_value=atc)
+        mocked_invalidate = mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        value = serialize_values([1, 2, 3, 4, 5, 6])
+        write_box(client, 5050, {"contract": mocker.MagicMock()}, address, value)
+        assert client.suggested_params.call_count == 2
+        assert atc.execute.call_count == 2
+        mocked_invalidate.assert_called_once_with(5050, address)
+
+    def test_network_write_box_for_raw_value(self, mocker):
+        client, app_id, writing_parameters = (
+            mocker.MagicMock(),
+            5050,
+            {"contract": mocker.MagicMock()},
+        )
+        atc = mocker.MagicMock()
+        mocker.patch("network.AtomicTransactionComposer", return_value=atc)
+        mocker.patch("network.permission_values_cache.invalidate")
+        client.suggested_params.return_value.first = 1000
+        client.suggested_params.return_value.last = 2000
+        mocker.patch("builtins.print")
+        address = "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU"
+        value = serialize_raw_values([1, 2, 3, 4, 5, 6])
+        write_box(client, app_id, writing_parameters, address, value)
+        contract = writing_parameters["contract"]
+        contract.get_method_by_name.assert_called_once_with("write_box_raw")
+        assert atc.add_method_call.call_args.kwargs["method_args"] == [
+            box_name_from_address(address),
+            value,
+        ]
+
+    # # _write_boxes_calls
+    def test_network_write_boxes_calls_for_no_addresses(self):
+        assert _write_boxes_calls({}, []) == []
+
+    def test_network_write_boxes_calls_limits_boxes_per_call(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        addresses = [f"address{index}" for index in range(19)]
+        values = {address: "value" for address in addresses}
+        returned = _write_boxes_calls(values, addresses)
+        assert returned == [addresses[:8], addresses[8:16], addresses[16:]]
+        assert max(len(call) for call in returned) == BOXES_PER_WRITE_CALL
+
+    def test_network_write_boxes_calls_for_disabled_write_boxes_method(self):
+        addresses = [f"address{index}" for index in range(3)]
+        values = {address: "value" for address in addresses}
+        returned = _write_boxes_calls(values, addresses)
+        assert returned == [[address] for address in addresses]
+
+    def test_network_write_boxes_calls_limits_arguments_size(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        addresses = [f"address{index}" for index in range(5)]
+        values = {address: "v" * 600 for address in addresses}
+        returned = _write_boxes_calls(values, addresses)
+        assert returned == [addresses[:3], addresses[3:]]
+        for call in returned:
+            size = 4 + 2 + sum(42 + len(values[address]) for address in call)
+            assert size <= APP_CALL_ARGS_MAX_SIZE
+
+    def test_network_write_boxes_calls_for_value_exceeding_limit(self):
+        values = {"address1": "v" * 3000, "address2": "value"}
+        returned = _write_boxes_calls(values, list(values))
+        assert returned == [["address1"], ["address2"]]
+
+    def test_network_write_boxes_calls_splits_values_formats(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        values = {
+            "address1": "value",
+            "address2": "value",
+            "address3": b"value",
+            "address4": b"value",
+            "address5": "value",
+        }
+        returned = _write_boxes_calls(values, list(values))
+        assert returned == [
+            ["address1", "address2"],
+            ["address3", "address4"],
+            ["address5"],
+        ]
+
+    def test_network_write_boxes_calls_for_raw_values_size(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        addresses = [f"address{index}" for index in range(4)]
+        values = {address: b"\x02" * 600 for address in addresses}
+        returned = _write_boxes_calls(values, addresses)
+        assert returned == [addresses[:3], addresses[3:]]
+
+    # # _journal_contents
+    def test_network_journal_contents_functionality(self):
+        values = {"address1": b"\x02\x01", "address2": "AQ==", "address3": b"\x02"}
+        returned = _journal_contents(values, ["address1", "address2"])
+        assert returned == {"address1": "0201", "address2": b"AQ==".hex()}
+
+    # # _txid_recording_builder
+    def test_network_txid_recording_builder_functionality(self, mocker):
+        builder, txids = mocker.MagicMock(), {1: "txid0"}
+        transaction = mocker.MagicMock()
+        transaction.txn.get_txid.return_value = "txid1"
+        builder.return_value.build_group.return_value = [transaction]
+        returned = _txid_recording_builder(builder, txids, 1)
+        assert returned == builder.return_value
+        assert txids == {1: "txid1"}
+
+    # # _journaled_write_boxes_composer
+    def test_network_journaled_write_boxes_composer_functionality(self, mocker):
+        client, app_id, writing_parameters = mocker.MagicMock(), 5050, {}
+        values = {"address1": b"\x02\x01", "address2": b"\x02\x02"}
+        journal = mocker.MagicMock()
+        mocked_composer = mocker.patch("network._write_boxes_composer")
+        atc = mocked_composer.return_value
+        atc.build_group.return_value[0].txn.get_txid.return_value = "txid1"
+        mocked_append = mocker.patch("network.append_journal_entry")
+        returned = _journaled_write_boxes_composer(
+            client, app_id, writing_parameters, values, ["address2"], journal
+        )
+        assert returned == atc
+        mocked_composer.assert_called_once_with(
+            client, app_id, writing_parameters, values, ["address2"]
+        )
+        mocked_append.assert_called_once_with(
+            journal,
+            {
+                "event": "planned",
+                "app_id": app_id,
+                "txid": "txid1",
+                "contents": {"address2": "0202"},
+            },
+        )
+
+    # # write_boxes
+    def test_network_write_boxes_for_no_values(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        mocked_composer = mocker.patch("network.AtomicTransactionComposer")
+        write_boxes(client, 5050, writing_parameters, {})
+        mocked_composer.assert_not_called()
+        client.suggested_params.assert_not_called()
+
+    def test_network_write_boxes_functionality(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        client, app_id = mocker.MagicMock(), 5050
+        sender, signer, contract = (
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+        )
+        writing_parameters = {"sender": sender, "signer": signer, "contract": contract}
+        addresses = [
+            "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU",
+            "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU",
+            "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U",
+            "YCUJYAHIBMQKZT4YAA2LOBKXGDAFLQNFJNLOUFY6L57CL7PQLAAYCLLV2A",
+            "BXIQEAQV54DNPLDB7SQWCXZECV75ZZLANX743VGFIPJOB3R7AL4TA7WYNY",
+        ]
+        values = {address: f"value{index}" for index, address in enumerate(addresses)}
+        atc1, atc2, atc3 = mocker.MagicMock(), mocker.MagicMock(), mocker.MagicMock()
+        mocked_composer = mocker.patch(
+            "network.AtomicTransactionComposer", side_effect=[atc1, atc2, atc3]
+        )
+        sp = mocker.MagicMock()
+        sp.first, sp.last = 1000, 2000
+        client.suggested_params.return_value = sp
+        mocked_invalidate = mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        returned = write_boxes(client, app_id, writing_parameters, values, group_size=2)
+        assert returned == (
+            {
+                0: atc1.execute.return_value.confirmed_round,
+                1: atc2.execute.return_value.confirmed_round,
+                2: atc3.execute.return_value.confirmed_round,
+            },
+            {},
+        )
+        assert mocked_composer.call_count == 3
+        contract.get_method_by_name.assert_called_with("write_box")
+        client.suggested_params.assert_called_once_with()
+        contract.get_method_by_name.assert_has_calls(
+            [mocker.call("write_boxes"), mocker.call("write_boxes")]
+        )
+        for atc, group in ((atc1, addresses[:2]), (atc2, addresses[2:4])):
+            atc.add_method_call.assert_called_once_with(
+                app_id=app_id,
+                method=contract.get_method_by_name.return_value,
+                sender=sender,
+                sp=sp,
+                signer=signer,
+                method_args=[
+                    [
+                        (box_name_from_address(address), values[address])
+                        for address in group
+                    ]
+                ],
+                boxes=[(app_id, box_name_from_address(address)) for address in group],
+            )
+            atc.execute.assert_called_once_with(client, 2)
+        atc3.add_method_call.assert_called_once_with(
+            app_id=app_id,
+            method=contract.get_method_by_name.return_value,
+            sender=sender,
+            sp=sp,
+            signer=signer,
+            method_args=[box_name_from_address(addresses[4]), values[addresses[4]]],
+            boxes=[(app_id, box_name_from_address(addresses[4]))],
+        )
+        atc3.execute.assert_called_once_with(client, 2)
+        mocked_invalidate.assert_has_calls(
+            [mocker.call(app_id, address) for address in addresses]
+        )
+
+    def test_network_write_boxes_default_group_size(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        atc = mocker.MagicMock()
+        mocked_composer = mocker.patch(
+            "network.AtomicTransactionComposer", return_value=atc
+        )
+        client.suggested_params.return_value.first = 1000
+        client.suggested_params.return_value.last = 2000
+        mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        address = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+        mocker.patch("network.box_name_from_address", return_value=b"name")
+        values = {f"{address}{index}": "value" for index in range(140)}
+        write_boxes(client, 5050, writing_parameters, values)
+        assert mocked_composer.call_count == 3
+        assert atc.add_method_call.call_count == 8 + 8 + 2
+
+    def test_network_write_boxes_for_disabled_write_boxes_method(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        atc = mocker.MagicMock()
+        mocked_composer = mocker.patch(
+            "network.AtomicTransactionComposer", return_value=atc
+        )
+        client.suggested_params.return_value.first = 1000
+        client.suggested_params.return_value.last = 2000
+        mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        mocker.patch("network.box_name_from_address", return_value=b"name")
+        values = {f"address{index}": "value" for index in range(20)}
+        write_boxes(client, 5050, writing_parameters, values)
+        assert mocked_composer.call_count == 2
+        assert atc.add_method_call.call_count == 20
+        writing_parameters.get.return_value.get_method_by_name.assert_called_with(
+            "write_box"
+        )
+
+    # # _write_group_size
+    def test_network_write_group_size_functionality(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        assert _write_group_size(64) == 64
+
+    def test_network_write_group_size_for_disabled_write_boxes_method(self):
+        assert _write_group_size(64) == 16
+        assert _write_group_size(8) == 8
+
+    def test_network_write_boxes_for_pipelined(self, mocker):
+        client, app_id, writing_parameters = mocker.MagicMock(), 5050, {}
+        addresses = ["address1", "address2", "address3"]
+        values = {address: "value" for address in addresses}
+        mocked_composer = mocker.patch("network._write_boxes_composer")
+        mocked_submit = mocker.patch(
+            "network.submit_pipelined", return_value=({1: 1005}, {0: "error"})
+        )
+        mocked_invalidate = mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        returned = write_boxes(
+            client, app_id, writing_parameters, values, group_size=2, pipelined=True
+        )
+        assert returned == ({1: 1005}, {0: "error"})
+        mocked_submit.assert_called_once()
+        assert mocked_submit.call_args[0][0] is client
+        builders = mocked_submit.call_args[0][1]
+        assert len(builders) == 2
+        mocked_composer.assert_not_called()
+        assert builders[1]() == mocked_composer.return_value
+        mocked_composer.assert_called_once_with(
+            client, app_id, writing_parameters, values, ["address3"]
+        )
+        mocked_invalidate.assert_called_once_with(app_id, "address3")
+
+    def test_network_write_boxes_for_journal(self, mocker):
+        client, app_id, writing_parameters = mocker.MagicMock(), 5050, {}
+        addresses = ["address1", "address2", "address3"]
+        values = {address: b"\x02" + address.encode() for address in addresses}
+        journal = mocker.MagicMock()
+        mocked_journaled = mocker.patch(
+            "network.confirmed_journal_writes",
+            return_value={"address1": values["address1"].hex(), "address2": "02"},
+        )
+        mocked_composer = mocker.patch("network._journaled_write_boxes_composer")
+        response = mocked_composer.return_value.execute.return_value
+        response.tx_ids, response.confirmed_round = ["txid1"], 1005
+        mocked_append = mocker.patch("network.append_journal_entry")
+        mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        returned = write_boxes(
+            client, app_id, writing_parameters, values, group_size=2, journal=journal
+        )
+        assert returned == ({0: 1005}, {})
+        mocked_journaled.assert_called_once_with(client, journal, app_id)
+        mocked_composer.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            values,
+            ["address2", "address3"],
+            journal=journal,
+        )
+        mocked_append.assert_called_once_with(
+            journal,
+            {
+                "event": "confirmed",
+                "app_id": app_id,
+                "txid": "txid1",
+                "round": 1005,
+                "contents": _journal_contents(values, ["address2", "address3"]),
+            },
+        )
+
+    def test_network_write_boxes_for_pipelined_journal(self, mocker):
+        client, app_id, writing_parameters = mocker.MagicMock(), 5050, {}
+        addresses = ["address1", "address2", "address3"]
+        values = {address: "value" for address in addresses}
+        journal = mocker.MagicMock()
+        mocker.patch("network.confirmed_journal_writes", return_value={})
+        mocked_composer = mocker.patch("network._journaled_write_boxes_composer")
+        transaction = mocker.MagicMock()
+        transaction.txn.get_txid.return_value = "txid1"
+        mocked_composer.return_value.build_group.return_value = [transaction]
+        mocker.patch(
+            "network.submit_pipelined",
+            side_effect=lambda client, builders: (
+                [builder() for builder in builders] and ({1: 1005}, {0: "error"})
+            ),
+        )
+        mocked_append = mocker.patch("network.append_journal_entry")
+        mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        write_boxes(
+            client,
+            app_id,
+            writing_parameters,
+            values,
+            group_size=2,
+            pipelined=True,
+            journal=journal,
+        )
+        mocked_append.assert_called_once_with(
+            journal,
+            {
+                "event": "confirmed",
+                "app_id": app_id,
+                "txid": "txid1",
+                "round": 1005,
+                "contents": {"address3": b"value".hex()},
+            },
+        )
+        assert mocked_composer.call_count == 2
+
+    def test_network_write_boxes_for_raw_values(self, mocker):
+        mocker.patch("network.WRITE_BOXES_METHOD", True)
+        client, app_id = mocker.MagicMock(), 5050
+        contract = mocker.MagicMock()
+        writing_parameters = {
+            "sender": "sender",
+            "signer": "signer",
+            "contract": contract,
+        }
+        addresses = [
+            "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU",
+            "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU",
+            "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U",
+        ]
+        values = {
+            address: serialize_raw_values([index, 0, 0, 0, 0, 0])
+            for index, address in enumerate(addresses)
+        }
+        atc = mocker.MagicMock()
+        mocker.patch("network.AtomicTransactionComposer", return_value=atc)
+        client.suggested_params.return_value.first = 1000
+        client.suggested_params.return_value.last = 2000
+        mocker.patch("network.permission_values_cache.invalidate")
+        mocker.patch("builtins.print")
+        write_boxes(client, app_id, writing_parameters, values)
+        contract.get_method_by_name.assert_called_once_with("write_boxes_raw")
+        atc.add_method_call.assert_called_once()
+        assert atc.add_method_call.call_args.kwargs["method_args"] == [
+            [(box_name_from_address(address), values[address]) for address in addresses]
+        ]
+        assert atc.add_method_call.call_args.kwargs["boxes"] == [
+            (app_id, box_name_from_address(address)) for address in addresses
+        ]
+
+    # # _delete_boxes_composer
+    def test_network_delete_boxes_composer_functionality(self, mocker):
+        client, app_id = mocker.MagicMock(), 5050
+        sender, signer, contract = (
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+        )
+        writing_parameters = {"sender": sender, "signer": signer, "contract": contract}
+        addresses = [
+            "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU",
+            "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U",
+        ]
+        mocked_composer = mocker.patch("network.AtomicTransactionComposer")
+        sp = mocker.MagicMock()
+        sp.first, sp.last = 1000, 2000
+        client.suggested_params.return_value = sp
+        returned = _delete_boxes_composer(client, app_id, writing_parameters, addresses)
+        assert returned == mocked_composer.return_value
+        contract.get_method_by_name.assert_called_once_with("delete_box")
+        client.suggested_params.assert_called_once_with()
+        calls = [
+            mocker.call(
+                app_id=app_id,
+                method=contract.get_method_by_name.return_value,
+                sender=sender,
+                sp=sp,
+                signer=signer,
+                method_args=[box_name_from_address(address)],
+                boxes=[(app_id, box_name_from_address(address))],
+            )
+            for address in addresses
+        ]
+        returned.add_method_call.assert_has_calls(calls)
+        assert returned.add_method_call.call_count == 2
+
+    # # _print_deleting_progress
+    def test_network_print_deleting_progress_functionality(self, mocker):
+        mocker.patch("network.time.monotonic", return_value=110)
+        mocked_print = mocker.patch("network.print")
+        _print_deleting_progress(50, 200, 100)
+        mocked_print.assert_called_once_with("Deleted 50/200 boxes (5.0 boxes/s)")
+
+    def test_network_print_deleting_progress_for_no_elapsed_time(self, mocker):
+        mocker.patch("network.time.monotonic", return_value=100)
+        mocked_print = mocker.patch("network.print")
+        _print_deleting_progress(0, 200, 100)
+        mocked_print.assert_called_once_with("Deleted 0/200 boxes (0.0 boxes/s)")
+
+    # # delete_boxes_in_groups
+    def test_network_delete_boxes_in_groups_for_no_addresses(self, mocker):
+        mocked_composer = mocker.patch("network._delete_boxes_composer")
+        mocker.patch("network._print_deleting_progress")
+        returned = delete_boxes_in_groups(
+            mocker.MagicMock(), 5050, mocker.MagicMock(), []
+        )
+        assert returned == ({}, {})
+        mocked_composer.assert_not_called()
+
+    def test_network_delete_boxes_in_groups_functionality(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        addresses = ["address1", "address2", "address3"]
+        atc1, atc2 = mocker.MagicMock(), mocker.MagicMock()
+        mocked_composer = mocker.patch(
+            "network._delete_boxes_composer", side_effect=[atc1, atc2]
+        )
+        mocked_invalidate = mocker.patch("network.permission_values_cache.invalidate")
+        mocked_progress = mocker.patch("network._print_deleting_progress")
+        returned = delete_boxes_in_groups(
+            client, 5050, writing_parameters, iter(addresses), group_size=2
+        )
+        assert returned == (
+            {
+                0: atc1.execute.return_value.confirmed_round,
+                1: atc2.execute.return_value.confirmed_round,
+            },
+            {},
+        )
+        mocked_composer.assert_has_calls(
+            [
+                mocker.call(client, 5050, writing_parameters, addresses[:2]),
+                mocker.call(client, 5050, writing_parameters, addresses[2:]),
+            ]
+        )
+        atc1.execute.assert_called_once_with(client, 2)
+        atc2.execute.assert_called_once_with(client, 2)
+        mocked_invalidate.assert_has_calls(
+            [mocker.call(5050, address) for address in addresses]
+        )
+        assert [call.args[:2] for call in mocked_progress.call_args_list] == [
+            (2, 3),
+            (3, 3),
+        ]
+
+    def test_network_delete_boxes_in_groups_for_pipelined(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        addresses = ["address1", "address2", "address3"]
+        mocked_composer = mocker.patch("network._delete_boxes_composer")
+        mocked_pipelined = mocker.patch(
+            "network.submit_pipelined", return_value=({1: 1005}, {0: "fee too low"})
+        )
+        mocked_invalidate = mocker.patch("network.permission_values_cache.invalidate")
+        mocked_progress = mocker.patch("network._print_deleting_progress")
+        mocker.patch("network.print")
+        returned = delete_boxes_in_groups(
+            client, 5050, writing_parameters, addresses, group_size=2, pipelined=True
+        )
+        assert returned == ({1: 1005}, {0: "fee too low"})
+        builders = mocked_pipelined.call_args.args[1]
+        assert len(builders) == 2
+        mocked_composer.assert_not_called()
+        builders[1]()
+        mocked_composer.assert_called_once_with(
+            client, 5050, writing_parameters, ["address3"]
+        )
+        mocked_invalidate.assert_called_once_with(5050, "address3")
+        assert mocked_progress.call_args.args[:2] == (1, 3)
+
+    # # _simulated_group
+    def test_network_simulated_group_functionality(self, mocker):
+        client, atc = mocker.MagicMock(), mocker.MagicMock()
+        atc.simulate.return_value.tx_ids = ["txid1", "txid2"]
+        atc.simulate.return_value.simulate_response = {
+            "txn-groups": [{"app-budget-consumed": 1400}]
+        }
+        atc.simulate.return_value.failure_message = ""
+        txn1, txn2 = mocker.MagicMock(), mocker.MagicMock()
+        txn1.txn.fee, txn2.txn.fee = 1000, 2000
+        atc.build_group.return_value = [txn1, txn2]
+        returned = _simulated_group(client, "write", ("address1", "address2"), atc)
+        assert returned == {
+            "action": "write",
+            "addresses": ["address1", "address2"],
+            "transactions": 2,
+            "budget": 1400,
+            "fee": 3000,
+            "failure": None,
+        }
+        atc.simulate.assert_called_once_with(client)
+
+    def test_network_simulated_group_for_failure(self, mocker):
+        atc = mocker.MagicMock()
+        atc.simulate.return_value.tx_ids = ["txid1"]
+        atc.simulate.return_value.simulate_response = {"txn-groups": [{}]}
+        atc.simulate.return_value.failure_message = "logic eval error"
+        atc.build_group.return_value = []
+        returned = _simulated_group(mocker.MagicMock(), "delete", ["address1"], atc)
+        assert returned["budget"] == 0
+        assert returned["failure"] == "logic eval error"
+
+    # # simulate_box_updates
+    def test_network_simulate_box_updates_for_no_changes(self, mocker):
+        mocked_simulated = mocker.patch("network._simulated_group")
+        returned = simulate_box_updates(
+            mocker.MagicMock(), 5050, mocker.MagicMock(), {}
+        )
+        assert returned == []
+        mocked_simulated.assert_not_called()
+
+    def test_network_simulate_box_updates_functionality(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        values = {"address1": b"\x02a", "address2": b"\x02b", "address3": b"\x02c"}
+        deletes = [f"address{index}" for index in range(4, 22)]
+        write_atc1, write_atc2 = mocker.MagicMock(), mocker.MagicMock()
+        mocked_write = mocker.patch(
+            "network._write_boxes_composer", side_effect=[write_atc1, write_atc2]
+        )
+        delete_atc1, delete_atc2 = mocker.MagicMock(), mocker.MagicMock()
+        mocked_delete = mocker.patch(
+            "network._delete_boxes_composer", side_effect=[delete_atc1, delete_atc2]
+        )
+        mocked_simulated = mocker.patch(
+            "network._simulated_group",
+            side_effect=lambda client, action, addresses, atc: (action, atc),
+        )
+        returned = simulate_box_updates(
+            client, 5050, writing_parameters, values, deletes, group_size=2, workers=2
+        )
+        assert returned == [
+            ("write", write_atc1),
+            ("write", write_atc2),
+            ("delete", delete_atc1),
+            ("delete", delete_atc2),
+        ]
+        mocked_write.assert_has_calls(
+            [
+                mocker.call(
+                    client, 5050, writing_parameters, values, ["address1", "address2"]
+                ),
+                mocker.call(client, 5050, writing_parameters, values, ["address3"]),
+            ]
+        )
+        mocked_delete.assert_has_calls(
+            [
+                mocker.call(
+                    client,
+                    5050,
+                    writing_parameters,
+                    deletes[:BOXES_DELETING_GROUP_SIZE],
+                ),
+                mocker.call(
+                    client,
+                    5050,
+                    writing_parameters,
+                    deletes[BOXES_DELETING_GROUP_SIZE:],
+                ),
+            ]
+        )
+        assert mocked_simulated.call_count == 4
 
     # # write_foundation_boxes
     def test_network_write_foundation_boxes_functionality(self, mocker):
@@ -853,9 +2104,9 @@ class TestNetworkPermissionDappFunctions:
             mocker.MagicMock(),
         )
         mocked_serialize = mocker.patch(
-            "network.serialize_values", side_effect=[value1, value2, value3]
+            "network.serialize_box_values", side_effect=[value1, value2, value3]
         )
-        mocked_write = mocker.patch("network.write_box")
+        mocked_write = mocker.patch("network.write_boxes")
         address1, address2, address3 = "address1", "address2", "address3"
         values1, values2, values3 = (
             mocker.MagicMock(),
@@ -867,10 +2118,96 @@ class TestNetworkPermissionDappFunctions:
         calls = [mocker.call(values1), mocker.call(values2), mocker.call(values3)]
         mocked_serialize.assert_has_calls(calls, any_order=True)
         assert mocked_serialize.call_count == 3
-        calls = [
-            mocker.call(client, app_id, writing_parameters, address1, value1),
-            mocker.call(client, app_id, writing_parameters, address2, value2),
-            mocker.call(client, app_id, writing_parameters, address3, value3),
-        ]
-        mocked_write.assert_has_calls(calls, any_order=True)
-        assert mocked_write.call_count == 3
+        mocked_write.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            {address1: value1, address2: value2, address3: value3},
+            journal=None,
+        )
+
+    def test_network_write_foundation_boxes_skips_unchanged_values(self, mocker):
+        client, app_id, writing_parameters = (
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+        )
+        values1, values2 = [1, 2, 3, 4, 5, 6], [7, 8, 9, 10, 11, 12]
+        data = {"address1": values1, "address2": values2}
+        current = {"address1": serialize_raw_values(values1), "address2": b"\x02"}
+        mocked_write = mocker.patch("network.write_boxes")
+        mocker.patch("network._print_skipped_writes")
+        journal = mocker.MagicMock()
+        write_foundation_boxes(
+            client, app_id, writing_parameters, data, current, journal=journal
+        )
+        mocked_write.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            {"address2": serialize_values(values2)},
+            journal=journal,
+        )
+
+    # # migrate_boxes_to_raw_values
+    def test_network_migrate_boxes_to_raw_values_for_no_app_id(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        with pytest.raises(ValueError):
+            migrate_boxes_to_raw_values(client, None, writing_parameters)
+
+    def test_network_migrate_boxes_to_raw_values_functionality(self, mocker):
+        client, app_id, writing_parameters = mocker.MagicMock(), 5050, {}
+        address1 = "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU"
+        address2 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+        address3 = "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U"
+        values1 = [10, 3000, 0, 0, 0, 0, 1000, 1]
+        values2 = [5, 500, 0, 0, 0, 0]
+        box_names = [box_name_from_address(address) for address in (address1, address2)]
+        box_names.append(box_name_from_address(address3))
+        mocker.patch("network.application_box_names", return_value=iter(box_names))
+        mocked_responses = mocker.patch(
+            "network.permission_dapp_box_responses",
+            return_value={
+                box_names[0]: {
+                    "value": base64.b64encode(serialize_values(values1).encode())
+                },
+                box_names[1]: {
+                    "value": base64.b64encode(serialize_raw_values(values2))
+                },
+                box_names[2]: None,
+            },
+        )
+        mocked_write = mocker.patch("network.write_boxes", return_value=({0: 1005}, {}))
+        mocker.patch("builtins.print")
+        returned = migrate_boxes_to_raw_values(
+            client, app_id, writing_parameters, workers=4, group_size=8
+        )
+        assert returned == ({0: 1005}, {})
+        assert mocked_responses.call_args[0][:2] == (client, app_id)
+        assert mocked_responses.call_args.kwargs == {"workers": 4}
+        mocked_write.assert_called_once_with(
+            client,
+            app_id,
+            writing_parameters,
+            {address1: serialize_raw_values(values1)},
+            group_size=8,
+            pipelined=False,
+        )
+
+    def test_network_migrate_boxes_to_raw_values_for_migrated_boxes(self, mocker):
+        client, app_id = mocker.MagicMock(), 5050
+        box_name = box_name_from_address(
+            "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU"
+        )
+        mocker.patch("network.application_box_names", return_value=iter([box_name]))
+        mocker.patch(
+            "network.permission_dapp_box_responses",
+            return_value={
+                box_name: {"value": base64.b64encode(serialize_raw_values([0] * 6))}
+            },
+        )
+        mocked_write = mocker.patch("network.write_boxes")
+        mocker.patch("builtins.print")
+        returned = migrate_boxes_to_raw_values(client, app_id, {})
+        assert returned == ({}, {})
+        mocked_write.assert_not_called()
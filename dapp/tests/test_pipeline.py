@@ -0,0 +1,170 @@
+"""Testing module for :py:mod:`pipeline` module."""
+
+from algosdk.error import AlgodHTTPError
+
+from configuration import PIPELINE_MAX_RETRIES, PIPELINE_MAX_WAIT_ROUNDS
+from pipeline import _transaction_state, submit_pipelined, track_confirmations
+
+
+def _builder(mocker, txid):
+    atc = mocker.MagicMock()
+    atc.submit.return_value = [txid]
+    return mocker.MagicMock(return_value=atc)
+
+
+class TestPipelineFunctions:
+    """Testing class for :py:mod:`pipeline` functions."""
+
+    # # _transaction_state
+    def test_pipeline_transaction_state_for_confirmed(self, mocker):
+        client = mocker.MagicMock()
+        client.pending_transaction_info.return_value = {"confirmed-round": 1005}
+        assert _transaction_state(client, "txid1") == (1005, None)
+        client.pending_transaction_info.assert_called_once_with("txid1")
+
+    def test_pipeline_transaction_state_for_pending(self, mocker):
+        client = mocker.MagicMock()
+        client.pending_transaction_info.return_value = {
+            "confirmed-round": 0,
+            "pool-error": "",
+        }
+        assert _transaction_state(client, "txid1") == (None, None)
+
+    def test_pipeline_transaction_state_for_pool_error(self, mocker):
+        client = mocker.MagicMock()
+        client.pending_transaction_info.return_value = {"pool-error": "fee too low"}
+        assert _transaction_state(client, "txid1") == (None, "fee too low")
+
+    def test_pipeline_transaction_state_for_unknown_transaction(self, mocker):
+        client = mocker.MagicMock()
+        client.pending_transaction_info.side_effect = AlgodHTTPError("not found")
+        assert _transaction_state(client, "txid1") == (None, None)
+
+    # # track_confirmations
+    def test_pipeline_track_confirmations_for_no_txids(self, mocker):
+        client = mocker.MagicMock()
+        assert track_confirmations(client, []) == ({}, {})
+        client.status.assert_not_called()
+
+    def test_pipeline_track_confirmations_functionality(self, mocker):
+        client = mocker.MagicMock()
+        client.status.return_value = {"last-round": 1000}
+        states = {
+            "txid1": [(None, None), (1001, None)],
+            "txid2": [(1000, None)],
+            "txid3": [(None, None), (None, None), (None, "fee too low")],
+        }
+        mocked_state = mocker.patch(
+            "pipeline._transaction_state",
+            side_effect=lambda client, txid: states[txid].pop(0),
+        )
+        returned = track_confirmations(client, ["txid1", "txid2", "txid3"])
+        assert returned == ({"txid2": 1000, "txid1": 1001}, {"txid3": "fee too low"})
+        client.status_after_block.assert_has_calls(
+            [mocker.call(1001), mocker.call(1002)]
+        )
+        assert client.status_after_block.call_count == 2
+        assert mocked_state.call_count == 6
+
+    def test_pipeline_track_confirmations_for_max_rounds(self, mocker):
+        client = mocker.MagicMock()
+        client.status.return_value = {"last-round": 1000}
+        mocker.patch("pipeline._transaction_state", return_value=(None, None))
+        returned = track_confirmations(client, ["txid1"], max_rounds=3)
+        assert returned == ({}, {"txid1": "not confirmed in 3 rounds"})
+        assert client.status_after_block.call_count == 3
+
+    def test_pipeline_track_confirmations_tracks_until_last_valid(self, mocker):
+        client = mocker.MagicMock()
+        client.status.return_value = {"last-round": 1000}
+        states = {
+            "txid1": [(None, None)] * 15 + [(1015, None)],
+            "txid2": [(None, None)] * 21,
+        }
+        mocker.patch(
+            "pipeline._transaction_state",
+            side_effect=lambda client, txid: states[txid].pop(0),
+        )
+        returned = track_confirmations(
+            client,
+            ["txid1", "txid2"],
+            max_rounds=3,
+            last_valid={"txid1": 1100, "txid2": 1020},
+        )
+        assert returned == (
+            {"txid1": 1015},
+            {"txid2": "not confirmed until last valid round 1020"},
+        )
+        assert client.status_after_block.call_count == 20
+
+    def test_pipeline_track_confirmations_default_max_rounds(self, mocker):
+        client = mocker.MagicMock()
+        client.status.return_value = {"last-round": 1000}
+        mocker.patch("pipeline._transaction_state", return_value=(None, None))
+        track_confirmations(client, ["txid1"])
+        assert client.status_after_block.call_count == PIPELINE_MAX_WAIT_ROUNDS
+
+    # # submit_pipelined
+    def test_pipeline_submit_pipelined_functionality(self, mocker):
+        client = mocker.MagicMock()
+        builders = [_builder(mocker, f"txid{index}") for index in range(3)]
+        mocked_track = mocker.patch(
+            "pipeline.track_confirmations",
+            return_value=({"txid0": 1001, "txid1": 1001, "txid2": 1002}, {}),
+        )
+        mocked_invalidate = mocker.patch("pipeline.suggested_params_cache.invalidate")
+        returned = submit_pipelined(client, builders, max_rounds=5)
+        assert returned == ({0: 1001, 1: 1001, 2: 1002}, {})
+        for builder in builders:
+            builder.assert_called_once_with()
+            builder.return_value.submit.assert_called_once_with(client)
+            builder.return_value.execute.assert_not_called()
+        mocked_track.assert_called_once_with(
+            client,
+            {"txid0": 0, "txid1": 1, "txid2": 2},
+            max_rounds=5,
+            last_valid={
+                f"txid{index}": builders[index]
+                .return_value.build_group.return_value[0]
+                .txn.last_valid_round
+                for index in range(3)
+            },
+        )
+        mocked_invalidate.assert_not_called()
+
+    def test_pipeline_submit_pipelined_retries_failed(self, mocker):
+        client = mocker.MagicMock()
+        builder0, builder1 = _builder(mocker, "txid0"), _builder(mocker, "txid1")
+        builder1.return_value.submit.side_effect = [
+            AlgodHTTPError("overspend"),
+            ["txid1"],
+        ]
+        mocked_track = mocker.patch(
+            "pipeline.track_confirmations",
+            side_effect=[
+                ({}, {"txid0": "fee too low"}),
+                ({"txid0": 1005, "txid1": 1005}, {}),
+            ],
+        )
+        mocked_invalidate = mocker.patch("pipeline.suggested_params_cache.invalidate")
+        mocker.patch("builtins.print")
+        returned = submit_pipelined(client, [builder0, builder1])
+        assert returned == ({0: 1005, 1: 1005}, {})
+        assert builder0.call_count == 2
+        assert builder1.call_count == 2
+        assert mocked_track.call_count == 2
+        mocked_invalidate.assert_called_once_with(client)
+
+    def test_pipeline_submit_pipelined_returns_failed_after_retries(self, mocker):
+        client = mocker.MagicMock()
+        builder = _builder(mocker, "txid0")
+        mocked_track = mocker.patch(
+            "pipeline.track_confirmations",
+            return_value=({}, {"txid0": "not confirmed until last valid round 2000"}),
+        )
+        mocker.patch("pipeline.suggested_params_cache.invalidate")
+        mocker.patch("builtins.print")
+        returned = submit_pipelined(client, [builder])
+        assert returned == ({}, {0: "not confirmed until last valid round 2000"})
+        assert builder.call_count == PIPELINE_MAX_RETRIES + 1
+        assert mocked_track.call_count == PIPELINE_MAX_RETRIES + 1
@@ -0,0 +1,201 @@
+"""Testing module for :py:mod:`plan` module."""
+
+from helpers import (
+    serialize_box_values,
+    serialize_raw_values,
+    serialize_values,
+)
+from network import (
+    check_and_update_changed_subscriptions_and_staking,
+    check_and_update_new_stakers,
+    check_and_update_new_subscribers,
+)
+from plan import (
+    apply_plan,
+    box_updates_plan,
+    load_plan,
+    plan_changes,
+    save_plan,
+    simulate_plan,
+)
+
+ADDRESS1 = "SIP2GKX3Z6XA6C44BDD6J2WWWLK6UJF3TR2ZFUIFIJBLNS4FZAKKTADUQU"
+ADDRESS2 = "QQKX5S43BNJLXN6FTZDHMSCVSJPZ2L47OTKV7SOG7B7GGM2G3SIQSF3H3U"
+ADDRESS3 = "YCUJYAHIBMQKZT4YAA2LOBKXGDAFLQNFJNLOUFY6L57CL7PQLAAYCLLV2A"
+ADDRESS4 = "OECZJTT5M2RTJMAWG7N3RBIJSU4M37O47DGHKLHLI6ZNHK5Q7ZDM2VMI6I"
+ADDRESS5 = "2EVGZ4BGOSL3J64UYDE2BUGTNTBZZZLI54VUQQNZZLYCDODLY33UGXNSIU"
+
+VALUES1 = [0, 300, 3000, 300, 0, 0]
+VALUES2 = [0, 100, 0, 0, 1000, 100]
+
+
+def _plan():
+    return {
+        "app_id": 5050,
+        "actions": [
+            {"action": "create", "address": "address1", "old": None, "new": VALUES1},
+            {
+                "action": "update",
+                "address": "address2",
+                "old": [0, 0, 0, 0, 0, 0],
+                "new": VALUES2,
+            },
+            {"action": "create", "address": "address1", "old": None, "new": VALUES2},
+        ],
+        "skipped": 0,
+    }
+
+
+class TestPlanFunctions:
+    """Testing class for :py:mod:`plan` functions."""
+
+    # # box_updates_plan
+    def test_plan_box_updates_plan_for_no_changes(self, mocker):
+        mocker.patch("plan.new_subscribers_values", return_value={})
+        mocker.patch("plan.new_stakers_values", return_value={})
+        mocker.patch("plan.changed_subscriptions_and_staking_values", return_value={})
+        returned = box_updates_plan(5050, {}, {}, {}, {})
+        assert returned == {"app_id": 5050, "actions": [], "skipped": 0}
+
+    def test_plan_box_updates_plan_functionality(self, mocker):
+        permissions, subscriptions, stakings = (
+            {"address2": [0, 0, 0, 0, 0, 0], "address4": VALUES1},
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+        )
+        current = {
+            "address2": serialize_raw_values([0, 0, 0, 0, 0, 0]),
+            "address3": b"",
+            "address4": serialize_values(VALUES1).encode(),
+        }
+        mocked_subscribers = mocker.patch(
+            "plan.new_subscribers_values", return_value={"address1": VALUES1}
+        )
+        mocked_stakers = mocker.patch(
+            "plan.new_stakers_values", return_value={"address1": VALUES2}
+        )
+        mocked_changed = mocker.patch(
+            "plan.changed_subscriptions_and_staking_values",
+            return_value={"address2": VALUES2, "address4": VALUES1},
+        )
+        returned = box_updates_plan(5050, permissions, subscriptions, stakings, current)
+        expected = _plan()
+        expected["actions"] = [
+            expected["actions"][0],
+            expected["actions"][2],
+            expected["actions"][1],
+        ]
+        assert returned == expected | {"skipped": 1}
+        mocked_subscribers.assert_called_once_with(permissions, subscriptions)
+        mocked_stakers.assert_called_once_with(permissions, stakings)
+        mocked_changed.assert_called_once_with(permissions, subscriptions, stakings)
+
+    def test_plan_box_updates_plan_follows_update_run(self, mocker):
+        permissions = {
+            ADDRESS1: [0, 0, 0, 0, 0, 0],
+            ADDRESS2: [10, 500, 0, 0, 1000, 500],
+            ADDRESS3: [0, 0, 0, 0, 0, 0],
+        }
+        subscriptions = {
+            ADDRESS1: [(2_500_000_000, 100)],
+            ADDRESS4: [(18_000_000_000, 1000)],
+            ADDRESS5: [(2_500_000_000, 100)],
+        }
+        stakings = {ADDRESS2: 2_000_000_000_000, ADDRESS5: 600_000_000_000}
+        current = {
+            ADDRESS1: serialize_values(permissions[ADDRESS1]).encode(),
+            ADDRESS2: serialize_raw_values(permissions[ADDRESS2]),
+            ADDRESS3: serialize_raw_values(permissions[ADDRESS3]),
+        }
+        mocked_write = mocker.patch("network.write_boxes")
+        mocker.patch("builtins.print")
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        check_and_update_new_subscribers(
+            client, 5050, writing_parameters, permissions, subscriptions, current
+        )
+        check_and_update_new_stakers(
+            client, 5050, writing_parameters, permissions, stakings, current
+        )
+        check_and_update_changed_subscriptions_and_staking(
+            client,
+            5050,
+            writing_parameters,
+            permissions,
+            subscriptions,
+            stakings,
+            current,
+        )
+        returned = box_updates_plan(5050, permissions, subscriptions, stakings, current)
+        assert [
+            (entry["address"], serialize_box_values(entry["new"]))
+            for entry in returned["actions"]
+        ] == [
+            write
+            for call in mocked_write.call_args_list
+            for write in call.args[3].items()
+        ]
+        assert len(returned["actions"]) == 5
+        assert all(entry["action"] != "delete" for entry in returned["actions"])
+
+    # # plan_changes
+    def test_plan_plan_changes_for_empty_plan(self):
+        assert plan_changes({}) == {}
+
+    def test_plan_plan_changes_functionality(self):
+        returned = plan_changes(_plan())
+        assert returned == {
+            "address1": serialize_box_values(VALUES2),
+            "address2": serialize_box_values(VALUES2),
+        }
+
+    # # simulate_plan
+    def test_plan_simulate_plan_functionality(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        groups = [
+            {"fee": 1000, "budget": 700, "failure": None},
+            {"fee": 2000, "budget": 1400, "failure": "logic eval error"},
+        ]
+        mocked_simulate = mocker.patch("plan.simulate_box_updates", return_value=groups)
+        plan = _plan()
+        returned = simulate_plan(client, writing_parameters, plan, workers=4)
+        assert returned is plan
+        assert returned["simulation"] == {
+            "groups": groups,
+            "fee": 3000,
+            "budget": 2100,
+            "failed": 1,
+        }
+        mocked_simulate.assert_called_once_with(
+            client, 5050, writing_parameters, plan_changes(_plan()), workers=4
+        )
+
+    # # apply_plan
+    def test_plan_apply_plan_for_empty_plan(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        mocked_write = mocker.patch("plan.write_boxes")
+        returned = apply_plan(client, writing_parameters, {"app_id": 5050})
+        assert returned == ({}, {})
+        mocked_write.assert_not_called()
+
+    def test_plan_apply_plan_functionality(self, mocker):
+        client, writing_parameters = mocker.MagicMock(), mocker.MagicMock()
+        mocked_write = mocker.patch("plan.write_boxes")
+        returned = apply_plan(client, writing_parameters, _plan(), pipelined=True)
+        assert returned == mocked_write.return_value
+        mocked_write.assert_called_once_with(
+            client,
+            5050,
+            writing_parameters,
+            plan_changes(_plan()),
+            pipelined=True,
+        )
+
+    # # load_plan
+    def test_plan_load_plan_for_missing_file(self, tmp_path):
+        assert load_plan(tmp_path / "plan.json") == {}
+
+    # # save_plan
+    def test_plan_save_plan_functionality(self, tmp_path):
+        filename = tmp_path / "plan.json"
+        save_plan(_plan(), filename)
+        assert load_plan(filename) == _plan()
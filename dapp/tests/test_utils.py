@@ -1,11 +1,32 @@
 """Testing module for :py:mod:`utils` module."""
 
-from utils import check_test_box, delete_boxes, print_box_values
+import pytest
+
+from configuration import BOXES_FETCHING_WORKERS
+from utils import (
+    _boolean_argument,
+    benchmark_codec,
+    check_test_box,
+    delete_boxes,
+    migrate_boxes,
+    print_box_values,
+)
 
 
 class TestUtilsFunctions:
     """Testing class for :py:mod:`utils` functions."""
 
+    # # _boolean_argument
+    @pytest.mark.parametrize("value", ["1", "true", "True", "YES", " yes ", True, 1])
+    def test_utils_boolean_argument_for_true_values(self, value):
+        assert _boolean_argument(value) is True
+
+    @pytest.mark.parametrize(
+        "value", ["0", "false", "False", "no", "", "n", False, 0, None]
+    )
+    def test_utils_boolean_argument_for_false_values(self, value):
+        assert _boolean_argument(value) is False
+
     # # delete_boxes
     def test_utils_delete_boxes_functionality(self, mocker):
         env = {
@@ -23,35 +44,69 @@ class TestUtilsFunctions:
         mocked_writing_params = mocker.patch(
             "utils.box_writing_parameters", return_value=writing_params
         )
-        boxes_data = {
-            "boxes": [
-                {"name": "dGVzdF9hZGRyZXNzXzAx"},
-                {"name": "dGVzdF9hZGRyZXNzXzAy"},
-            ]
-        }
-        client.application_boxes.return_value = boxes_data
+        mocked_names = mocker.patch(
+            "utils.application_box_names",
+            return_value=iter([b"test_address_01", b"test_address_02"]),
+        )
         mocked_encode = mocker.patch("utils.encode_address")
         mocked_encode.side_effect = [
             "test_address_01_encoded",
             "test_address_02_encoded",
         ]
-        mocked_delete = mocker.patch("utils.delete_box")
+        mocked_delete = mocker.patch("utils.delete_boxes_in_groups")
         mocker.patch("builtins.print")  # suppress output
-        delete_boxes()
+        returned = delete_boxes(pipelined="1")
+        assert returned == mocked_delete.return_value
         mocked_env.assert_called_once_with()
         mocked_permission_id.assert_called_once_with(network="testnet")
         mocked_client.assert_called_once_with("test_token", "test_address")
         mocked_writing_params.assert_called_once_with(env)
-        client.application_boxes.assert_called_once_with(app_id)
+        mocked_names.assert_called_once_with(client, app_id)
         assert mocked_encode.call_count == 2
         mocked_encode.assert_any_call(b"test_address_01")
         mocked_encode.assert_any_call(b"test_address_02")
-        assert mocked_delete.call_count == 2
-        mocked_delete.assert_any_call(
-            client, app_id, writing_params, "test_address_01_encoded"
+        mocked_delete.assert_called_once_with(
+            client,
+            app_id,
+            writing_params,
+            ["test_address_01_encoded", "test_address_02_encoded"],
+            pipelined=True,
+        )
+
+    def test_utils_delete_boxes_for_dry_run(self, mocker):
+        mocker.patch("utils.environment_variables", return_value={})
+        mocker.patch("utils.permission_dapp_id", return_value=5050)
+        mocker.patch("utils.AlgodClient")
+        mocker.patch("utils.box_writing_parameters")
+        mocker.patch(
+            "utils.application_box_names",
+            return_value=iter([b"test_address_01", b"test_address_02"]),
+        )
+        mocker.patch("utils.encode_address")
+        mocked_delete = mocker.patch("utils.delete_boxes_in_groups")
+        mocked_print = mocker.patch("builtins.print")
+        returned = delete_boxes(dry_run=True)
+        assert returned == ({}, {})
+        mocked_print.assert_called_once_with("Found 2 boxes to delete")
+        mocked_delete.assert_not_called()
+
+    def test_utils_delete_boxes_for_false_string_arguments(self, mocker):
+        mocker.patch("utils.environment_variables", return_value={})
+        mocker.patch("utils.permission_dapp_id", return_value=5050)
+        client = mocker.MagicMock()
+        mocker.patch("utils.AlgodClient", return_value=client)
+        writing_params = mocker.MagicMock()
+        mocker.patch("utils.box_writing_parameters", return_value=writing_params)
+        mocker.patch(
+            "utils.application_box_names", return_value=iter([b"test_address_01"])
         )
-        mocked_delete.assert_any_call(
-            client, app_id, writing_params, "test_address_02_encoded"
+        mocker.patch("utils.encode_address", return_value="test_address_01_encoded")
+        mocked_delete = mocker.patch("utils.delete_boxes_in_groups")
+        mocker.patch("builtins.print")
+        returned = delete_boxes("False", "false")
+        assert returned == mocked_delete.return_value
+        mocked_delete.assert_called_once_with(
+            client, 5050, writing_params, ["test_address_01_encoded"], pipelined=False
         )
 
     def test_utils_delete_boxes_with_no_boxes(self, mocker):
@@ -70,20 +125,80 @@ class TestUtilsFunctions:
         mocked_writing_params = mocker.patch(
             "utils.box_writing_parameters", return_value=writing_params
         )
-        boxes_data = {"boxes": []}
-        client.application_boxes.return_value = boxes_data
+        mocked_names = mocker.patch(
+            "utils.application_box_names", return_value=iter([])
+        )
         mocked_encode = mocker.patch("utils.encode_address")
-        mocked_delete = mocker.patch("utils.delete_box")
+        mocked_delete = mocker.patch("utils.delete_boxes_in_groups")
         mocker.patch("builtins.print")  # suppress output
         delete_boxes()
         mocked_env.assert_called_once_with()
         mocked_permission_id.assert_called_once_with(network="testnet")
         mocked_client.assert_called_once_with("test_token", "test_address")
         mocked_writing_params.assert_called_once_with(env)
-        client.application_boxes.assert_called_once_with(app_id)
+        mocked_names.assert_called_once_with(client, app_id)
         mocked_encode.assert_not_called()
         mocked_delete.assert_not_called()
 
+    # # migrate_boxes
+    def test_utils_migrate_boxes_functionality(self, mocker):
+        env = {
+            "algod_token_mainnet": "test_token",
+            "algod_address_mainnet": "test_address",
+        }
+        mocked_env = mocker.patch("utils.environment_variables", return_value=env)
+        mocked_permission_id = mocker.patch(
+            "utils.permission_dapp_id", return_value=5050
+        )
+        client = mocker.MagicMock()
+        mocked_client = mocker.patch("utils.AlgodClient", return_value=client)
+        writing_params = mocker.MagicMock()
+        mocked_writing_params = mocker.patch(
+            "utils.box_writing_parameters", return_value=writing_params
+        )
+        mocked_migrate = mocker.patch(
+            "utils.migrate_boxes_to_raw_values", return_value=({0: 1005}, {})
+        )
+        mocked_print = mocker.patch("builtins.print")
+        migrate_boxes(network="mainnet", pipelined="1")
+        mocked_env.assert_called_once_with()
+        mocked_permission_id.assert_called_once_with(network="mainnet")
+        mocked_client.assert_called_once_with("test_token", "test_address")
+        mocked_writing_params.assert_called_once_with(env, network="mainnet")
+        mocked_migrate.assert_called_once_with(
+            client,
+            5050,
+            writing_params,
+            workers=BOXES_FETCHING_WORKERS,
+            pipelined=True,
+        )
+        mocked_print.assert_called_once_with("Migrated 1 groups, failed 0 groups")
+
+    def test_utils_migrate_boxes_defaults(self, mocker):
+        mocker.patch("utils.environment_variables", return_value={})
+        mocked_permission_id = mocker.patch("utils.permission_dapp_id")
+        mocker.patch("utils.AlgodClient")
+        mocker.patch("utils.box_writing_parameters")
+        mocked_migrate = mocker.patch(
+            "utils.migrate_boxes_to_raw_values", return_value=({}, {})
+        )
+        mocker.patch("builtins.print")
+        migrate_boxes()
+        mocked_permission_id.assert_called_once_with(network="testnet")
+        assert mocked_migrate.call_args.kwargs["pipelined"] is False
+
+    def test_utils_migrate_boxes_for_false_pipelined_string(self, mocker):
+        mocker.patch("utils.environment_variables", return_value={})
+        mocker.patch("utils.permission_dapp_id")
+        mocker.patch("utils.AlgodClient")
+        mocker.patch("utils.box_writing_parameters")
+        mocked_migrate = mocker.patch(
+            "utils.migrate_boxes_to_raw_values", return_value=({}, {})
+        )
+        mocker.patch("builtins.print")
+        migrate_boxes("mainnet", "False")
+        assert mocked_migrate.call_args.kwargs["pipelined"] is False
+
     # # print_box_values
     def test_utils_print_box_values_for_provided_network(self, mocker):
         network = "mainnet"
@@ -111,7 +226,9 @@ class TestUtilsFunctions:
         mocked_env.assert_called_once_with()
         mocked_client.assert_called_once_with("mainnet_token", "mainnet_address")
         mocked_permission_id.assert_called_once_with(network=network)
-        mocked_permissions.assert_called_once_with(client, app_id)
+        mocked_permissions.assert_called_once_with(
+            client, app_id, workers=BOXES_FETCHING_WORKERS
+        )
 
     def test_utils_print_box_values_with_no_boxes(self, mocker):
         env = {
@@ -133,7 +250,9 @@ class TestUtilsFunctions:
         mocked_env.assert_called_once_with()
         mocked_client.assert_called_once_with("test_token", "test_address")
         mocked_permission_id.assert_called_once_with(network="testnet")
-        mocked_permissions.assert_called_once_with(client, app_id)
+        mocked_permissions.assert_called_once_with(
+            client, app_id, workers=BOXES_FETCHING_WORKERS
+        )
         mocked_print.assert_any_call("There are no boxes!")
 
     def test_utils_print_box_values_functionality(self, mocker):
@@ -161,11 +280,49 @@ class TestUtilsFunctions:
         mocked_env.assert_called_once_with()
         mocked_client.assert_called_once_with("test_token", "test_address")
         mocked_permission_id.assert_called_once_with(network="testnet")
-        mocked_permissions.assert_called_once_with(client, app_id)
+        mocked_permissions.assert_called_once_with(
+            client, app_id, workers=BOXES_FETCHING_WORKERS
+        )
         mocked_print.assert_called_once_with(
             [("addr3", (True, 1500)), ("addr1", (True, 1000)), ("addr2", (False, 500))]
         )
 
+    def test_utils_print_box_values_from_mirror(self, mocker):
+        mocked_env = mocker.patch("utils.environment_variables")
+        mocked_client = mocker.patch("utils.AlgodClient")
+        connection = mocker.MagicMock()
+        mocked_connection = mocker.patch(
+            "utils.mirror_connection", return_value=connection
+        )
+        permissions = {"addr1": (True, 1000), "addr2": (False, 1500)}
+        mocked_mirrored = mocker.patch(
+            "utils.mirrored_permission_values", return_value=permissions
+        )
+        mocked_permissions = mocker.patch("utils.permission_dapp_values_from_boxes")
+        mocked_print = mocker.patch("builtins.print")
+        print_box_values(network="mainnet", mirror=True)
+        mocked_connection.assert_called_once_with(network="mainnet")
+        mocked_mirrored.assert_called_once_with(connection)
+        mocked_env.assert_not_called()
+        mocked_client.assert_not_called()
+        mocked_permissions.assert_not_called()
+        mocked_print.assert_called_once_with(
+            [("addr2", (False, 1500)), ("addr1", (True, 1000))]
+        )
+
+    def test_utils_print_box_values_for_false_mirror_string(self, mocker):
+        mocker.patch("utils.environment_variables", return_value={})
+        mocker.patch("utils.AlgodClient")
+        mocker.patch("utils.permission_dapp_id", return_value=5050)
+        mocked_connection = mocker.patch("utils.mirror_connection")
+        mocked_permissions = mocker.patch(
+            "utils.permission_dapp_values_from_boxes", return_value={}
+        )
+        mocker.patch("builtins.print")
+        print_box_values("mainnet", "False")
+        mocked_connection.assert_not_called()
+        mocked_permissions.assert_called_once()
+
     # # check_test_box
     def test_utils_check_test_box_functionality(self, mocker):
         app_id_str = "5050"
@@ -177,13 +334,10 @@ class TestUtilsFunctions:
         mocked_env = mocker.patch("utils.environment_variables", return_value=env)
         client = mocker.MagicMock()
         mocked_client = mocker.patch("utils.AlgodClient", return_value=client)
-        boxes_data = {
-            "boxes": [
-                {"name": "dGVzdF9hZGRyZXNzXzAx"},
-                {"name": "dGVzdF9hZGRyZXNzXzAy"},
-            ]
-        }
-        client.application_boxes.return_value = boxes_data
+        mocked_names = mocker.patch(
+            "utils.application_box_names",
+            return_value=iter([b"test_address_01", b"test_address_02"]),
+        )
         mocked_encode = mocker.patch("utils.encode_address")
         mocked_encode.side_effect = [
             "test_address_01",
@@ -197,18 +351,16 @@ class TestUtilsFunctions:
         mock_binary_data.hex.return_value = mock_hex_value
 
         mocked_b64decode = mocker.patch("utils.base64.b64decode")
-        # Set up side effect for box names and box values
+        # Set up side effect for box values
         mocked_b64decode.side_effect = [
-            b"test_address_01",  # first box name decode
             mock_binary_data,  # first box value decode
-            b"test_address_02",  # second box name decode
             mock_binary_data,  # second box value decode
         ]
         mocked_print = mocker.patch("builtins.print")
         check_test_box(app_id_str)
         mocked_env.assert_called_once_with()
         mocked_client.assert_called_once_with("test_token", "test_address")
-        client.application_boxes.assert_called_once_with(app_id)
+        mocked_names.assert_called_once_with(client, app_id)
         assert mocked_encode.call_count == 2
         mocked_encode.assert_any_call(b"test_address_01")
         mocked_encode.assert_any_call(b"test_address_02")
@@ -227,18 +379,14 @@ class TestUtilsFunctions:
         mocked_env = mocker.patch("utils.environment_variables", return_value=env)
         client = mocker.MagicMock()
         mocked_client = mocker.patch("utils.AlgodClient", return_value=client)
-        boxes_data = {
-            "boxes": [
-                {"name": "dGVzdF9hZGRyZXNz"},
-            ]
-        }
-        client.application_boxes.return_value = boxes_data
+        mocked_names = mocker.patch(
+            "utils.application_box_names", return_value=iter([b"test_address"])
+        )
         mocker.patch("utils.encode_address", return_value="test_address")
         response_data = {"value": "dGVzdA=="}  # base64 for "test" (4 bytes)
         client.application_box_by_name.return_value = response_data
         mocked_b64decode = mocker.patch("utils.base64.b64decode")
         mocked_b64decode.side_effect = [
-            b"test_address",
             b"test",  # only 4 bytes, should trigger assertion error
         ]
         mocker.patch("builtins.print")  # suppress output
@@ -249,4 +397,27 @@ class TestUtilsFunctions:
             assert str(e) == "74657374"  # hex of "test"
         mocked_env.assert_called_once_with()
         mocked_client.assert_called_once_with("test_token", "test_address")
-        client.application_boxes.assert_called_once_with(app_id)
+        mocked_names.assert_called_once_with(client, app_id)
+
+    # # benchmark_codec
+    def test_utils_benchmark_codec_functionality(self, mocker):
+        mocked_timeit = mocker.patch("utils.timeit.timeit", side_effect=[0.05, 0.1])
+        mocked_print = mocker.patch("builtins.print")
+        returned = benchmark_codec("1000", "2")
+        assert returned == {
+            "serialize_values": pytest.approx(50),
+            "deserialize_values_data": pytest.approx(100),
+        }
+        assert mocked_timeit.call_count == 2
+        assert all(call[1]["number"] == 1000 for call in mocked_timeit.call_args_list)
+        mocked_print.assert_has_calls(
+            [
+                mocker.call("serialize_values: 50.00 us per call"),
+                mocker.call("deserialize_values_data: 100.00 us per call"),
+            ]
+        )
+
+    def test_utils_benchmark_codec_runs_codec(self, mocker):
+        mocker.patch("builtins.print")
+        returned = benchmark_codec("10")
+        assert set(returned) == {"serialize_values", "deserialize_values_data"}
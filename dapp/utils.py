@@ -2,27 +2,57 @@
 
 import base64
 import sys
+import timeit
 
 from algosdk.encoding import encode_address
 from algosdk.v2client.algod import AlgodClient
 
+from configuration import BOXES_FETCHING_WORKERS
 from helpers import (
     box_writing_parameters,
+    deserialize_values_data,
     environment_variables,
     permission_dapp_id,
+    serialize_values,
 )
-from network import delete_box, permission_dapp_values_from_boxes
+from mirror import mirror_connection, mirrored_permission_values
+from network import (
+    application_box_names,
+    delete_boxes_in_groups,
+    migrate_boxes_to_raw_values,
+    permission_dapp_values_from_boxes,
+)
+
+
+def _boolean_argument(value):
+    """Return boolean parsed from command line argument `value`.
+
+    Only "1", "true" and "yes" strings, regardless of case, are parsed as True.
+
+    :param value: command line argument or boolean value
+    :type value: str or Boolean
+    :return: Boolean
+    """
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
 
+    return bool(value)
 
-def delete_boxes():
+
+def delete_boxes(dry_run=False, pipelined=False):
     """Delete all boxes from the Permission dApp on testnet.
 
     This function:
     1. Retrieves environment variables and creates an Algod client
     2. Gets the application ID for the Permission dApp on testnet
-    3. Fetches all boxes associated with the application
-    4. Deletes each box by encoding the box name to an address
+    3. Lists all boxes associated with the application page by page
+    4. Deletes the boxes in atomic groups, or only prints their count if
+       `dry_run` is set
 
+    :param dry_run: only print number of boxes to delete
+    :type dry_run: Boolean
+    :param pipelined: submit all groups without waiting for confirmations
+    :type pipelined: Boolean
     :var env: environment variables collection
     :type env: dict
     :var app_id: Permission dApp application ID on testnet
@@ -31,12 +61,11 @@ def delete_boxes():
     :type client: :class:`AlgodClient`
     :var writing_parameters: transaction parameters for box operations
     :type writing_parameters: :class:`transaction.SuggestedParams`
-    :var boxes: collection of boxes associated with the application
-    :type boxes: dict
-    :var box_name: base64 decoded box name
+    :var addresses: Algorand addresses derived from box names
+    :type addresses: list
+    :var box_name: box name
     :type box_name: bytes
-    :var address: Algorand address derived from box name
-    :type address: str
+    :return: two-tuple
     """
     env = environment_variables()
     app_id = permission_dapp_id(network="testnet")
@@ -45,23 +74,70 @@ def delete_boxes():
     )
     writing_parameters = box_writing_parameters(env)
 
-    boxes = client.application_boxes(app_id)
-    for box in boxes.get("boxes", []):
-        box_name = base64.b64decode(box.get("name"))
-        address = encode_address(box_name)
-        print(f"Deleting box for {address[:5]}..{address[-5:]}")
-        delete_box(client, app_id, writing_parameters, address)
+    addresses = [
+        encode_address(box_name) for box_name in application_box_names(client, app_id)
+    ]
+    print(f"Found {len(addresses)} boxes to delete")
+    if _boolean_argument(dry_run) or not addresses:
+        return {}, {}
+
+    return delete_boxes_in_groups(
+        client,
+        app_id,
+        writing_parameters,
+        addresses,
+        pipelined=_boolean_argument(pipelined),
+    )
+
+
+def migrate_boxes(network="testnet", pipelined=False):
+    """Rewrite Permission dApp boxes holding base64 encoded values in raw format.
+
+    :param network: network to migrate boxes on (e.g., "testnet")
+    :type network: str
+    :param pipelined: submit all groups without waiting for confirmations
+    :type pipelined: Boolean
+    :var env: environment variables collection
+    :type env: dict
+    :var client: Algorand Node client instance
+    :type client: :class:`AlgodClient`
+    :var app_id: Permission dApp application ID
+    :type app_id: int
+    :var writing_parameters: instances needed for writing boxes to blockchain
+    :type writing_parameters: dict
+    :var confirmed: collection of group positions and related confirmed rounds
+    :type confirmed: dict
+    :var failed: collection of group positions and related failure reasons
+    :type failed: dict
+    """
+    env = environment_variables()
+    client = AlgodClient(
+        env.get(f"algod_token_{network}"), env.get(f"algod_address_{network}")
+    )
+    app_id = permission_dapp_id(network=network)
+    writing_parameters = box_writing_parameters(env, network=network)
+    confirmed, failed = migrate_boxes_to_raw_values(
+        client,
+        app_id,
+        writing_parameters,
+        workers=BOXES_FETCHING_WORKERS,
+        pipelined=_boolean_argument(pipelined),
+    )
+    print(f"Migrated {len(confirmed)} groups, failed {len(failed)} groups")
 
 
-def print_box_values(network="testnet"):
+def print_box_values(network="testnet", mirror=False):
     """Print all box values from the Permission dApp in sorted order.
 
     Retrieves and displays permission values from application boxes,
     sorted by the second value in descending order. Shows a message
-    if no boxes are found.
+    if no boxes are found. Values are read from local mirror database
+    without any Node call if `mirror` is True.
 
     :param network: network to query (e.g., "testnet")
     :type network: str
+    :param mirror: read values from local mirror database
+    :type mirror: Boolean
     :var env: environment variables collection
     :type env: dict
     :var client: Algorand Node client instance
@@ -71,12 +147,18 @@ def print_box_values(network="testnet"):
     :var permissions: dictionary of address to permission values
     :type permissions: dict
     """
-    env = environment_variables()
-    client = AlgodClient(
-        env.get(f"algod_token_{network}"), env.get(f"algod_address_{network}")
-    )
-    app_id = permission_dapp_id(network=network)
-    permissions = permission_dapp_values_from_boxes(client, app_id)
+    if _boolean_argument(mirror):
+        permissions = mirrored_permission_values(mirror_connection(network=network))
+    else:
+        env = environment_variables()
+        client = AlgodClient(
+            env.get(f"algod_token_{network}"), env.get(f"algod_address_{network}")
+        )
+        app_id = permission_dapp_id(network=network)
+        permissions = permission_dapp_values_from_boxes(
+            client, app_id, workers=BOXES_FETCHING_WORKERS
+        )
+
     if not permissions:
         print("There are no boxes!")
 
@@ -99,9 +181,7 @@ def check_test_box(app_id_str):
     :type env: dict
     :var client: Algorand Node client instance
     :type client: :class:`AlgodClient`
-    :var boxes: collection of boxes associated with the application
-    :type boxes: dict
-    :var box_name: base64 decoded box name
+    :var box_name: box name
     :type box_name: bytes
     :var address: Algorand address derived from box name
     :type address: str
@@ -116,9 +196,7 @@ def check_test_box(app_id_str):
         env.get("algod_token_testnet"), env.get("algod_address_testnet")
     )
 
-    boxes = client.application_boxes(app_id)
-    for box in boxes.get("boxes", []):
-        box_name = base64.b64decode(box.get("name"))
+    for box_name in application_box_names(client, app_id):
         address = encode_address(box_name)
         response = client.application_box_by_name(app_id, box_name)
         hexed = base64.b64decode(response.get("value")).hex()
@@ -130,6 +208,43 @@ def check_test_box(app_id_str):
         print()
 
 
+def benchmark_codec(number="10000", docs="15"):
+    """Print and return average microseconds per box values encode and decode.
+
+    Values collection holds starting values followed by `docs` document pairs.
+
+    :param number: number of timed calls per codec direction
+    :type number: str
+    :param docs: number of document pairs in benchmarked values
+    :type docs: str
+    :var values: benchmarked values collection
+    :type values: list
+    :var data: serialized benchmarked values
+    :type data: str
+    :var timings: collection of codec directions and related microseconds per call
+    :type timings: dict
+    :return: dict
+    """
+    number = int(number)
+    values = [10_000_000, 200_000_000, 0, 0, 2_000_500, 2_055_200] + [
+        value for index in range(int(docs)) for value in (1000 + index, index + 1)
+    ]
+    data = serialize_values(values)
+    timings = {
+        "serialize_values": timeit.timeit(
+            lambda: serialize_values(values), number=number
+        ),
+        "deserialize_values_data": timeit.timeit(
+            lambda: deserialize_values_data(data), number=number
+        ),
+    }
+    timings = {name: total / number * 1_000_000 for name, total in timings.items()}
+    for name, microseconds in timings.items():
+        print(f"{name}: {microseconds:.2f} us per call")
+
+    return timings
+
+
 if __name__ == "__main__":  # pragma: no cover
     args = sys.argv
     if len(args) == 1: